@@ -0,0 +1,114 @@
+"""
+JSON Backend Benchmark
+Times the response parsers of each endpoint under every installed JSON backend.
+
+Responses are synthetic but shaped and sized like real Play Store payloads, so
+the benchmark runs offline.
+
+Usage:
+    python benchmarks/json_backends.py [--repeat N]
+"""
+
+import json
+import random
+import string
+import timeit
+import argparse
+
+from gplay_scraper.core.gplay_parser import SearchParser
+from gplay_scraper.core.gplay_scraper import ListScraper, ReviewsScraper, SearchScraper, SuggestScraper
+from gplay_scraper.utils import json_backend
+
+random.seed(0)
+
+
+def text(length):
+    return "".join(random.choice(string.ascii_letters + "  .,é€") for _ in range(length))
+
+
+def app_entry():
+    """Nested array roughly the size of one app card."""
+    return [
+        [f"com.example.{text(8)}", 7],
+        text(30),
+        [None, None, [None, None, [None, 2, f"https://play-lh.googleusercontent.com/{text(60)}"]]],
+        [[text(20)], [[text(200)]]],
+        [f"{random.random() * 5:.1f}", random.random() * 5, [random.randint(0, 10**7)] * 5],
+        [[[None, "$0.99", 990000, "USD"]]],
+        [text(40), [f"https://play.google.com/store/apps/dev?id={random.randint(0, 10**18)}"]],
+    ]
+
+
+def review_entry():
+    """Nested array shaped like one review."""
+    return [
+        f"gp:{text(40)}",
+        [text(15), [None, None, [None, 2, f"https://play-lh.googleusercontent.com/a/{text(40)}"]]],
+        random.randint(1, 5),
+        None,
+        text(random.randint(50, 600)),
+        [random.randint(1.6e9, 1.7e9), 0],
+        random.randint(0, 500),
+        [None, text(300), [random.randint(1.6e9, 1.7e9), 0]] if random.random() < 0.3 else None,
+        "1.2.3",
+    ]
+
+
+def envelope(inner, rpc="UsvDTd"):
+    """Wrap a payload the way batchexecute does: JSON inside a JSON string."""
+    return ")]}'\n\n" + json.dumps([["wrb.fr", rpc, json.dumps(inner), None, None, None, "generic"]])
+
+
+def build_payloads():
+    reviews = [[review_entry() for _ in range(200)], [None, "next-page-token"], None]
+    collection = [[None, [[None, [[None, None, None, None, None, [app_entry()]] for _ in range(100)]]]]]
+    search_page = [[[[app_entry() for _ in range(100)], [None, "token"]]]]
+    suggest = [[[[text(12), None] for _ in range(5)]]]
+    datasets = "".join(
+        f"<script>AF_initDataCallback({{key: 'ds:{key}', hash: '1', data:{json.dumps(data)}, sideChannel: {{}}}});</script>"
+        for key, data in (
+            ("0", [app_entry() for _ in range(50)]),
+            ("1", [None, [[None, [[None, [app_entry() for _ in range(30)]]]]]]),
+            ("4", [app_entry() for _ in range(150)]),
+        )
+    )
+    return {
+        "reviews": (ReviewsScraper.decode_reviews_batch, envelope(reviews)),
+        "list": (ListScraper.parse_list_response, envelope(collection, "vyAe2")),
+        "search (page)": (lambda html: SearchParser().parse_html_content(html)["ds:1"], f"<html>{datasets}</html>"),
+        "search (pagination)": (SearchScraper.parse_pagination_response, envelope(search_page, "qnKhOb")),
+        "suggest": (SuggestScraper.parse_suggest_response, envelope(suggest, "IJ4APc")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="runs per endpoint and backend")
+    args = parser.parse_args()
+
+    backends = []
+    for name, load in json_backend.BACKENDS.items():
+        try:
+            load()
+            backends.append(name)
+        except ImportError:
+            print(f"{name} not installed, skipped")
+    payloads = build_payloads()
+
+    print(f"{'endpoint':<22}{'size':>10}" + "".join(f"{name:>12}" for name in backends) + "    speedup")
+    for endpoint, (parse, payload) in payloads.items():
+        timings = {}
+        for name in backends:
+            json_backend.set_backend(name)
+            timings[name] = min(timeit.repeat(lambda: parse(payload), number=1, repeat=args.repeat)) * 1000
+        best = min(timings, key=timings.get)
+        print(
+            f"{endpoint:<22}{len(payload) // 1024:>8}KB"
+            + "".join(f"{timings[name]:>10.2f}ms" for name in backends)
+            + f"    {timings['json'] / timings[best]:.1f}x ({best})"
+        )
+    json_backend.set_backend()
+
+
+if __name__ == "__main__":
+    main()
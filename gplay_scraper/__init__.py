@@ -14,6 +14,7 @@ import logging
 
 # Import main scraper class
 from .app import GPlayScraper
+from .async_app import AsyncGPlayScraper
 
 # Import all method classes
 from .core.gplay_methods import AppMethods, SearchMethods, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
@@ -21,6 +22,13 @@ from .core.gplay_methods import AppMethods, SearchMethods, ReviewsMethods, Devel
 # Import configuration
 from .config import Config
 
+# Import rate limiting
+from .utils.rate_limiter import AdaptiveThrottle, RateLimiter, TokenBucket
+from .utils.retry import RetryPolicy
+from .utils.proxy_pool import ProxyPool
+from .utils.cache import ResponseCache, SQLiteCache
+from .utils.checkpoint import FileCheckpointStore, SQLiteCheckpointStore
+
 # Import custom exceptions
 from .exceptions import (
     GPlayScraperError,
@@ -40,6 +48,7 @@ __version__ = "1.0.4"
 # Public API exports
 __all__ = [
     "GPlayScraper",
+    "AsyncGPlayScraper",
     "AppMethods",
     "SearchMethods",
     "ReviewsMethods",
@@ -48,6 +57,15 @@ __all__ = [
     "ListMethods",
     "SuggestMethods",
     "Config",
+    "RateLimiter",
+    "AdaptiveThrottle",
+    "RetryPolicy",
+    "ProxyPool",
+    "ResponseCache",
+    "SQLiteCache",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "TokenBucket",
     "GPlayScraperError",
     "InvalidAppIdError",
     "AppNotFoundError",
@@ -4,10 +4,14 @@ This module contains the main GPlayScraper class which aggregates all 7 method t
 and provides a comprehensive set of functions for interacting with Google Play Store data.
 """
 
-from .core.gplay_methods import AppMethods, SearchMethods, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
+from .core.gplay_methods import AppMethods, SearchMethods, ReviewsIterator, ReviewsMethods, DeveloperMethods, SimilarMethods, ListMethods, SuggestMethods
 from .config import Config
-from .utils.http_client import ProxyConfig
-from typing import Any, List, Dict
+from .utils.http_client import HttpClient, ProxyConfig
+from .utils.cache import CacheConfig, make_cache
+from .utils.checkpoint import BaseCheckpointStore
+from .utils.rate_limiter import RateLimiter
+from datetime import datetime
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 
 class GPlayScraper:
@@ -22,27 +26,44 @@ class GPlayScraper:
     - Similar Methods: Find similar/competitor apps
     - Suggest Methods: Get search suggestions
     
+    All method types share a single network session, so request concurrency
+    and rate limiting are coordinated across the whole instance.
+    
     Args:
         proxies: Optional proxy configuration applied to all HTTP calls.
             Accepts either a string (`"http://host:port"`) which is applied to
             both HTTP and HTTPS requests, or a mapping such as
             `{"http": "http://proxy", "https": "http://proxy2"}`.
+        max_connections: Maximum concurrent requests; each thread's curl handle
+            also keeps at most this many connections open.
+        rate_limiter: Optional token bucket rate limiter. Pass the same
+            instance to several scrapers to share one request budget.
+        cache: Optional response cache. ``True`` uses an in-memory LRU
+            cache with the per-endpoint TTLs from ``Config.CACHE_TTLS``.
     """
     
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, max_connections: int = Config.MAX_CONNECTIONS_PER_HOST,
+                 rate_limiter: RateLimiter = None, cache: CacheConfig = None):
         """Initialize GPlayScraper with all method types.
         
         Args:
             proxies: Optional proxy configuration applied to all HTTP calls.
+            max_connections: Maximum concurrent requests.
+            rate_limiter: Optional token bucket rate limiter.
+            cache: Optional response cache, or True for an in-memory cache.
         """
+        # One pooled session shared by every method type
+        self.http_client = HttpClient(proxies=proxies, max_connections=max_connections, rate_limiter=rate_limiter,
+                                      cache=make_cache(cache))
+        
         # Initialize all 7 method types
-        self.app_methods = AppMethods(proxies=proxies)
-        self.search_methods = SearchMethods(proxies=proxies)
-        self.reviews_methods = ReviewsMethods(proxies=proxies)
-        self.developer_methods = DeveloperMethods(proxies=proxies)
-        self.similar_methods = SimilarMethods(proxies=proxies)
-        self.list_methods = ListMethods(proxies=proxies)
-        self.suggest_methods = SuggestMethods(proxies=proxies)
+        self.app_methods = AppMethods(http_client=self.http_client)
+        self.search_methods = SearchMethods(http_client=self.http_client)
+        self.reviews_methods = ReviewsMethods(http_client=self.http_client)
+        self.developer_methods = DeveloperMethods(http_client=self.http_client)
+        self.similar_methods = SimilarMethods(http_client=self.http_client)
+        self.list_methods = ListMethods(http_client=self.http_client)
+        self.suggest_methods = SuggestMethods(http_client=self.http_client)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for all method groups at runtime.
@@ -51,17 +72,21 @@ class GPlayScraper:
             proxies: Either a proxy URL string or a mapping of scheme to proxy URL.
                 Passing ``None`` clears any existing proxy configuration.
         """
-        self.app_methods.set_proxies(proxies)
-        self.search_methods.set_proxies(proxies)
-        self.reviews_methods.set_proxies(proxies)
-        self.developer_methods.set_proxies(proxies)
-        self.similar_methods.set_proxies(proxies)
-        self.list_methods.set_proxies(proxies)
-        self.suggest_methods.set_proxies(proxies)
+        self.http_client.set_proxies(proxies)
+
+    def get_connection_stats(self) -> Dict[str, float]:
+        """Get connection reuse statistics for the shared network session.
+        
+        Returns:
+            Dictionary with request count, new and reused connection counts,
+            the reuse ratio and adaptive throttling metrics
+        """
+        return self.http_client.get_stats()
 
     # ==================== App Methods ====================
     
-    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict:
+    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None,
+                    include_similar: bool = False, similar_count: int = Config.DEFAULT_SIMILAR_COUNT) -> Dict:
         """Get complete app data with 65+ fields.
         
         Args:
@@ -69,11 +94,14 @@ class GPlayScraper:
             lang: Language code (default: 'en')
             country: Country code (default: 'us')
             assets: Asset size (SMALL=512px, MEDIUM=1024px, LARGE=2048px, ORIGINAL=max)
+            include_similar: Add similar apps as ``similarApps``, reusing the
+                app page download (one request fewer than calling similar_analyze)
+            similar_count: Number of similar apps to include (default: 100)
             
         Returns:
             Dictionary containing all app data
         """
-        return self.app_methods.app_analyze(app_id, lang, country, assets)
+        return self.app_methods.app_analyze(app_id, lang, country, assets, include_similar, similar_count)
 
     def app_get_field(self, app_id: str, field: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Any:
         """Get single field value from app data.
@@ -105,6 +133,27 @@ class GPlayScraper:
         """
         return self.app_methods.app_get_fields(app_id, fields, lang, country, assets)
 
+    def app_analyze_many(self, app_ids: Iterable[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                         assets: str = None, max_workers: int = Config.BULK_MAX_WORKERS, rate: float = None) -> Iterator[Tuple[str, Union[Dict, Exception]]]:
+        """Analyze many apps concurrently, yielding results as they complete.
+        
+        Args:
+            app_ids: Google Play app IDs
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            max_workers: Number of worker threads
+            rate: Optional cap on apps started per second for this batch,
+                applied on top of the client's shared rate limit
+            
+        Returns:
+            Iterator of (app_id, app data dictionary or raised exception) tuples
+
+        Raises:
+            ValueError: If max_workers is not a positive integer
+        """
+        return self.app_methods.app_analyze_many(app_ids, lang, country, assets, max_workers, rate)
+
     # ==================== Search Methods ====================
     
     def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
@@ -154,7 +203,11 @@ class GPlayScraper:
     # ==================== Reviews Methods ====================
     
     def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE, 
-                       country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict]:
+                       country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                       resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                       since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                       batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                       prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict]:
         """Get user reviews for an app.
         
         Args:
@@ -163,14 +216,55 @@ class GPlayScraper:
             lang: Language code
             country: Country code
             sort: Sort order (NEWEST, RELEVANT, RATING)
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of review dictionaries
         """
-        return self.reviews_methods.reviews_analyze(app_id, count, lang, country, sort)
+        return self.reviews_methods.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                                    since, since_review_id, batch_size, prefetch)
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, resume_token: Optional[str] = None,
+                     checkpoint: Optional[BaseCheckpointStore] = None, since: Optional[datetime] = None,
+                     since_review_id: Optional[str] = None,
+                     prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> ReviewsIterator:
+        """Iterate over user reviews as batches arrive, holding one batch in memory.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to yield (None for all)
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            batch_size: Reviews requested per batch
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            prefetch: Fetch the next batch while the current one is parsed
+            
+        Returns:
+            Iterator of review dictionaries; its ``token`` attribute holds
+            the current continuation token
+        """
+        return self.reviews_methods.reviews_iter(app_id, count, lang, country, sort, batch_size, resume_token, checkpoint,
+                                                 since, since_review_id, prefetch)
 
     def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT, 
-                         lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Any]:
+                         lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                         resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                         since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                         batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                         prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Any]:
         """Get single field from reviews.
         
         Args:
@@ -180,14 +274,26 @@ class GPlayScraper:
             lang: Language code
             country: Country code
             sort: Sort order
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of field values
         """
-        return self.reviews_methods.reviews_get_field(app_id, field, count, lang, country, sort)
+        return self.reviews_methods.reviews_get_field(app_id, field, count, lang, country, sort, resume_token, checkpoint,
+                                                      since, since_review_id, batch_size, prefetch)
 
     def reviews_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_REVIEWS_COUNT,
-                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict[str, Any]]:
+                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                          resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                          since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                          batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                          prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict[str, Any]]:
         """Get multiple fields from reviews.
         
         Args:
@@ -197,11 +303,19 @@ class GPlayScraper:
             lang: Language code
             country: Country code
             sort: Sort order
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of dictionaries with requested fields
         """
-        return self.reviews_methods.reviews_get_fields(app_id, fields, count, lang, country, sort)
+        return self.reviews_methods.reviews_get_fields(app_id, fields, count, lang, country, sort, resume_token, checkpoint,
+                                                       since, since_review_id, batch_size, prefetch)
 
     # ==================== Developer Methods ====================
     
@@ -0,0 +1,198 @@
+"""Asyncio counterpart of GPlayScraper.
+
+This module contains the AsyncGPlayScraper class, which exposes every public
+method of GPlayScraper as a coroutine backed by a single async session.
+"""
+
+from .core.async_methods import AsyncAppMethods, AsyncSearchMethods, AsyncReviewsIterator, AsyncReviewsMethods, AsyncDeveloperMethods, AsyncSimilarMethods, AsyncListMethods, AsyncSuggestMethods
+from .config import Config
+from .utils.http_client import AsyncHttpClient, ProxyConfig
+from .utils.cache import CacheConfig, make_cache
+from .utils.checkpoint import BaseCheckpointStore
+from .utils.rate_limiter import RateLimiter
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, List, Dict, Optional, Tuple, Union
+
+
+class AsyncGPlayScraper:
+    """Async scraper providing awaitable versions of all GPlayScraper methods.
+    
+    All method types share one async session, a non-blocking rate limiter and
+    a bound on the number of requests in flight. Use it as an async context
+    manager, or call ``close()`` when done.
+    
+    Example:
+        async with AsyncGPlayScraper(max_concurrency=50) as scraper:
+            apps = await asyncio.gather(*(scraper.app_analyze(app_id) for app_id in app_ids))
+    
+    Args:
+        proxies: Optional proxy configuration applied to all HTTP calls.
+        max_connections: Minimum number of pooled curl handles (connections);
+            raised to max_concurrency when lower.
+        max_concurrency: Maximum number of requests in flight.
+        rate_limit_delay: Minimum delay between requests in seconds.
+        rate_limiter: Optional token bucket rate limiter; overrides rate_limit_delay.
+        cache: Optional response cache, or True for an in-memory cache.
+    """
+    
+    def __init__(self, proxies: ProxyConfig = None, max_connections: int = Config.MAX_CONNECTIONS_PER_HOST,
+                 max_concurrency: int = Config.ASYNC_MAX_CONCURRENCY, rate_limit_delay: float = None,
+                 rate_limiter: RateLimiter = None, cache: CacheConfig = None):
+        """Initialize AsyncGPlayScraper with all method types."""
+        self.http_client = AsyncHttpClient(rate_limit_delay, proxies, max_connections, max_concurrency, rate_limiter,
+                                           make_cache(cache))
+        
+        self.app_methods = AsyncAppMethods(self.http_client)
+        self.search_methods = AsyncSearchMethods(self.http_client)
+        self.reviews_methods = AsyncReviewsMethods(self.http_client)
+        self.developer_methods = AsyncDeveloperMethods(self.http_client)
+        self.similar_methods = AsyncSimilarMethods(self.http_client)
+        self.list_methods = AsyncListMethods(self.http_client)
+        self.suggest_methods = AsyncSuggestMethods(self.http_client)
+
+    async def __aenter__(self) -> "AsyncGPlayScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying async session."""
+        await self.http_client.close()
+
+    def set_proxies(self, proxies: ProxyConfig) -> None:
+        """Update proxy configuration for all method groups at runtime."""
+        self.http_client.set_proxies(proxies)
+
+    def get_connection_stats(self) -> Dict[str, float]:
+        """Get connection reuse and throttling statistics for the shared async session."""
+        return self.http_client.get_stats()
+
+    # ==================== App Methods ====================
+    
+    async def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None,
+                          include_similar: bool = False, similar_count: int = Config.DEFAULT_SIMILAR_COUNT) -> Dict:
+        """Get complete app data with 65+ fields, optionally with similar apps."""
+        return await self.app_methods.app_analyze(app_id, lang, country, assets, include_similar, similar_count)
+
+    async def app_get_field(self, app_id: str, field: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Any:
+        """Get single field value from app data."""
+        return await self.app_methods.app_get_field(app_id, field, lang, country, assets)
+
+    async def app_get_fields(self, app_id: str, fields: List[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict[str, Any]:
+        """Get multiple field values from app data."""
+        return await self.app_methods.app_get_fields(app_id, fields, lang, country, assets)
+
+    def app_analyze_many(self, app_ids: Iterable[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                         assets: str = None, max_workers: int = Config.BULK_MAX_WORKERS,
+                         rate: float = None) -> AsyncIterator[Tuple[str, Union[Dict, Exception]]]:
+        """Analyze many apps concurrently, yielding (app_id, result or exception)."""
+        return self.app_methods.app_analyze_many(app_ids, lang, country, assets, max_workers, rate)
+
+    # ==================== Search Methods ====================
+    
+    async def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Search for apps and get complete results."""
+        return await self.search_methods.search_analyze(query, count, lang, country)
+
+    async def search_get_field(self, query: str, field: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from search results."""
+        return await self.search_methods.search_get_field(query, field, count, lang, country)
+
+    async def search_get_fields(self, query: str, fields: List[str], count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from search results."""
+        return await self.search_methods.search_get_fields(query, fields, count, lang, country)
+
+    # ==================== Reviews Methods ====================
+    
+    async def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE, 
+                              country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                              resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                              since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                              batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                              prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict]:
+        """Get user reviews for an app, optionally resuming a crawl or fetching only new reviews."""
+        return await self.reviews_methods.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                                          since, since_review_id, batch_size, prefetch)
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, resume_token: Optional[str] = None,
+                     checkpoint: Optional[BaseCheckpointStore] = None, since: Optional[datetime] = None,
+                     since_review_id: Optional[str] = None,
+                     prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> AsyncReviewsIterator:
+        """Iterate over user reviews as batches arrive (use with ``async for``)."""
+        return self.reviews_methods.reviews_iter(app_id, count, lang, country, sort, batch_size, resume_token, checkpoint,
+                                                 since, since_review_id, prefetch)
+
+    async def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT, 
+                                lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                                resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                                since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                                batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                                prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Any]:
+        """Get single field from reviews."""
+        return await self.reviews_methods.reviews_get_field(app_id, field, count, lang, country, sort, resume_token, checkpoint,
+                                                            since, since_review_id, batch_size, prefetch)
+
+    async def reviews_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_REVIEWS_COUNT,
+                                 lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                                 resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                                 since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                                 batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                                 prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict[str, Any]]:
+        """Get multiple fields from reviews."""
+        return await self.reviews_methods.reviews_get_fields(app_id, fields, count, lang, country, sort, resume_token, checkpoint,
+                                                             since, since_review_id, batch_size, prefetch)
+
+    # ==================== Developer Methods ====================
+    
+    async def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get all apps from a developer."""
+        return await self.developer_methods.developer_analyze(dev_id, count, lang, country)
+
+    async def developer_get_field(self, dev_id: str, field: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from developer apps."""
+        return await self.developer_methods.developer_get_field(dev_id, field, count, lang, country)
+
+    async def developer_get_fields(self, dev_id: str, fields: List[str], count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from developer apps."""
+        return await self.developer_methods.developer_get_fields(dev_id, fields, count, lang, country)
+
+    # ==================== Similar Methods ====================
+    
+    async def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get similar/competitor apps."""
+        return await self.similar_methods.similar_analyze(app_id, count, lang, country)
+
+    async def similar_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from similar apps."""
+        return await self.similar_methods.similar_get_field(app_id, field, count, lang, country)
+
+    async def similar_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from similar apps."""
+        return await self.similar_methods.similar_get_fields(app_id, fields, count, lang, country)
+
+    # ==================== List Methods ====================
+    
+    async def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+        """Get top charts (top free, top paid, top grossing)."""
+        return await self.list_methods.list_analyze(collection, category, count, lang, country)
+
+    async def list_get_field(self, collection: str, field: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from top charts."""
+        return await self.list_methods.list_get_field(collection, field, category, count, lang, country)
+
+    async def list_get_fields(self, collection: str, fields: List[str], category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from top charts."""
+        return await self.list_methods.list_get_fields(collection, fields, category, count, lang, country)
+
+    # ==================== Suggest Methods ====================
+    
+    async def suggest_analyze(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[str]:
+        """Get search suggestions for a term."""
+        return await self.suggest_methods.suggest_analyze(term, count, lang, country)
+
+    async def suggest_nested(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict[str, List[str]]:
+        """Get nested suggestions (suggestions for suggestions)."""
+        return await self.suggest_methods.suggest_nested(term, count, lang, country)
@@ -11,6 +11,62 @@ class Config:
     # HTTP request settings
     DEFAULT_TIMEOUT = 30  # Request timeout in seconds
     RATE_LIMIT_DELAY = 1.0  # Delay between requests in seconds
+    RATE_LIMIT_BURST = 1  # Requests allowed back to back by the token bucket
+    RATE_LIMIT_SCOPE = "global"  # Options: global, host, proxy
+    MAX_CONNECTIONS_PER_HOST = 10  # Concurrent requests, and connections each curl handle keeps open
+    ASYNC_MAX_CONCURRENCY = 20  # Requests in flight for AsyncGPlayScraper
+    BULK_MAX_WORKERS = 8  # Worker threads for app_analyze_many
+    COALESCE_REQUESTS = True  # Share one response between identical concurrent requests
+    
+    # Adaptive throttling (AIMD on the shared request rate)
+    ADAPTIVE_THROTTLE = True  # Adjust the request rate from server feedback
+    THROTTLE_MIN_RATE = 0.1  # Lowest requests per second after backoff
+    THROTTLE_MAX_RATE = None  # Highest requests per second after recovery (None: the configured rate)
+    THROTTLE_INCREASE = 0.05  # Requests per second added per healthy response
+    THROTTLE_DECREASE = 0.5  # Rate multiplier applied on throttling
+    THROTTLE_LATENCY_TARGET = 5.0  # Responses slower than this count as congestion
+    THROTTLE_COOLDOWN = 2.0  # Minimum seconds between two rate decreases
+    THROTTLE_STATUS_CODES = (429, 503)  # Responses treated as throttling
+    
+    # Response caching (GPlayScraper(cache=...)); TTLs in seconds per endpoint, 0 disables
+    CACHE_MAX_ENTRIES = 1024  # Entries kept by the in-memory LRU cache
+    CACHE_DEFAULT_TTL = 3600  # TTL for endpoints not listed below
+    CACHE_TTLS = {
+        "app": 6 * 3600,
+        "app_fallback": 6 * 3600,
+        "developer": 6 * 3600,
+        "cluster": 3600,
+        "search": 3600,
+        "suggest": 3600,
+        "reviews": 600,
+        "list": 900,  # charts move quickly
+    }
+    CACHE_STALE_GRACE = 7 * 24 * 3600  # Keep expired entries with ETag/Last-Modified for revalidation
+    SQLITE_CACHE_PATH = "gplay_cache.sqlite3"  # Default SQLiteCache database file
+    SQLITE_CACHE_MAX_BYTES = None  # Size cap for compressed bodies (None = unlimited)
+
+    # Review crawl checkpoints
+    CHECKPOINT_FILE_PATH = "gplay_checkpoints.json"  # Default FileCheckpointStore file
+    SQLITE_CHECKPOINT_PATH = "gplay_checkpoints.sqlite3"  # Default SQLiteCheckpointStore database file
+    
+    # Proxy pools
+    PROXY_MAX_FAILURES = 3  # Consecutive failures before a proxy is ejected
+    PROXY_PROBATION = 30.0  # Seconds a proxy is first ejected for (doubles on repeat)
+    PROXY_MAX_PROBATION = 600.0  # Longest ejection in seconds
+    
+    # Retry policies per request plan endpoint ("default" covers the rest)
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # HTTP statuses worth retrying
+    # curl error codes worth retrying: couldn't connect, partial file, timed out,
+    # empty reply, send/receive failure, HTTP/2 stream error
+    RETRY_CURL_CODES = (7, 18, 28, 52, 55, 56, 92)
+    RETRY_POLICIES = {
+        "default": {"max_attempts": 3, "backoff_base": 0.5, "backoff_max": 8.0, "deadline": 60.0},
+        "reviews": {"max_attempts": 5, "backoff_base": 1.0, "backoff_max": 30.0, "deadline": 180.0},
+        "app_fallback": {"max_attempts": 1},  # optional data, fail fast
+    }
+
+    # JSON decoding
+    JSON_BACKEND = "auto"  # Options: auto, orjson, msgspec, json (auto picks the fastest installed)
       
     # Google Play Store URLs
     PLAY_STORE_BASE_URL = "https://play.google.com"
@@ -32,6 +88,10 @@ class Config:
     DEFAULT_LIST_COUNT = 100  # Number of apps to fetch from lists
     DEFAULT_REVIEWS_COUNT = 100  # Number of reviews to fetch
     DEFAULT_REVIEWS_BATCH_SIZE = 50  # Reviews per batch request
+    # Upper bound on reviews requested per batch. Not a documented limit: the
+    # RPC may return fewer (or an empty batch) at large sizes, which paging handles
+    MAX_REVIEWS_BATCH_SIZE = 4500
+    DEFAULT_REVIEWS_PREFETCH = False  # Fetch the next reviews batch while parsing the current one
     DEFAULT_SUGGEST_COUNT = 5  # Number of suggestions to fetch
     DEFAULT_SIMILAR_COUNT = 100  # Number of similar apps to fetch
     DEFAULT_DEVELOPER_COUNT = 100  # Number of developer apps to fetch
@@ -55,6 +115,7 @@ class Config:
         "DS5_NOT_FOUND": "Could not find data",
         "JSON_PARSE_FAILED": "Failed to parse JSON: {error}",
         "APP_FETCH_FAILED": "Failed to fetch app page for {app_id}: {error}",
+        "FALLBACK_FETCH_FAILED": "Fallback fetch failed for {app_id}: {error}",
         "SEARCH_FETCH_FAILED": "Failed to fetch search results for '{query}': {error}",
         "REVIEWS_FETCH_FAILED": "Failed to fetch reviews batch for {app_id}: {error}",
         "REVIEWS_SCRAPE_FAILED": "Failed to scrape reviews for {app_id}: {error}",
@@ -63,6 +124,11 @@ class Config:
         "LIST_FETCH_FAILED": "Failed to fetch list page: {error}",
         "SUGGEST_FETCH_FAILED": "Failed to fetch suggestions for '{term}': {error}",
         "RATE_LIMIT_SLEEP": "Rate limiting: sleeping for {sleep_time:.2f} seconds",
+        "RETRYING": "Retrying {endpoint} request (attempt {attempt}/{max_attempts}) in {delay:.2f}s after: {error}",
+        "PROXY_EJECTED": "Ejecting proxy {proxy} for {seconds:.0f}s after: {error}",
+        "THROTTLED": "Throttled with HTTP {status_code} for {url}",
+        "THROTTLE_BACKOFF": "Throttling: request rate lowered to {rate:.2f}/s ({reason})",
+        "JSON_BACKEND_UNAVAILABLE": "JSON backend '{backend}' is not installed, using the standard library",
         "HTTP_CLIENT_NOT_AVAILABLE": "{client} not available",
         "HTTP_ERROR": "HTTP {status_code} Error",
         "NO_HTTP_CLIENT": "No network libraries found",
@@ -0,0 +1,554 @@
+"""Asyncio method classes for all 7 scraping types.
+
+Each class mirrors its counterpart in ``gplay_methods`` but awaits an
+:class:`AsyncHttpClient` for network I/O. Page extraction and parsing reuse the
+synchronous scraper helpers and parser classes.
+"""
+
+import json
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+from .gplay_scraper import AppScraper, SearchScraper, ReviewsScraper, DeveloperScraper, SimilarScraper, ListScraper, SuggestScraper
+from .gplay_methods import ReviewsCursor
+from .gplay_parser import AppParser, SearchParser, ReviewsParser, DeveloperParser, SimilarParser, ListParser, SuggestParser
+from ..config import Config
+from ..exceptions import InvalidAppIdError
+from ..utils.http_client import AsyncHttpClient
+from ..utils.rate_limiter import TokenBucket
+from ..utils.checkpoint import BaseCheckpointStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAppMethods:
+    """Async methods for extracting app details with 65+ fields."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncAppMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = AppParser()
+        self.similar_parser = SimilarParser()
+
+    async def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None,
+                          include_similar: bool = False, similar_count: int = Config.DEFAULT_SIMILAR_COUNT) -> Dict:
+        """Get complete app data with all 65+ fields.
+        
+        Args:
+            app_id: Google Play app ID
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            include_similar: Also return similar apps under ``similarApps``
+            similar_count: Number of similar apps to return
+            
+        Returns:
+            Dictionary with all app data
+            
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        html_content, result = await self._fetch_app(app_id, lang, country, assets)
+        if include_similar:
+            result["similarApps"] = await self._similar_from_page(html_content, similar_count, lang, country)
+        return result
+
+    async def _fetch_app(self, app_id: str, lang: str, country: str, assets: str = None,
+                         fields: Optional[List[str]] = None) -> Tuple[str, Dict]:
+        """Fetch, parse and format an app page, extracting only ``fields`` if given."""
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        html_content = await self.http_client.fetch_app_page(app_id, lang, country)
+        dataset = AppScraper.parse_app_page(html_content)
+        app_details = self.parser.parse_app_data(dataset, app_id, None, assets, fields)
+
+        # Release date fallback needs another request, so it is awaited here
+        if self.parser.needs_release_date(app_details):
+            try:
+                fallback_html = await self.http_client.fetch_app_page_no_locale(app_id)
+                self.parser.apply_fallback_data(app_details, AppScraper.parse_fallback_page(fallback_html))
+            except Exception:
+                pass
+            self.parser.compute_install_metrics(app_details)
+
+        return html_content, self.parser.format_app_data(app_details, fields)
+
+    async def _similar_from_page(self, html_content: str, count: int, lang: str, country: str) -> List[Dict]:
+        """Fetch and format the similar apps cluster linked from an app page."""
+        cluster_url = SimilarScraper.extract_cluster_url(html_content)
+        if not cluster_url:
+            return []
+        cluster_html = await self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        apps_data = self.similar_parser.parse_similar_data(SimilarScraper.parse_cluster_page(cluster_html))
+        return apps_data[:count]
+
+    async def app_get_field(self, app_id: str, field: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Any:
+        """Get single field value from app data."""
+        return (await self.app_get_fields(app_id, [field], lang, country, assets))[field]
+
+    async def app_get_fields(self, app_id: str, fields: List[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict[str, Any]:
+        """Get multiple field values from app data, extracting only those fields."""
+        _, data = await self._fetch_app(app_id, lang, country, assets, fields)
+        return data
+
+    def app_analyze_many(self, app_ids: Iterable[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                         assets: str = None, max_workers: int = Config.BULK_MAX_WORKERS,
+                         rate: float = None) -> AsyncIterator[Tuple[str, Union[Dict, Exception]]]:
+        """Analyze many apps concurrently, yielding results as they complete.
+        
+        Args:
+            app_ids: Google Play app IDs
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            max_workers: Number of apps analyzed at once
+            rate: Optional cap on apps started per second for this batch,
+                applied on top of the client's shared rate limit
+            
+        Returns:
+            Async iterator of (app_id, app data dictionary or raised exception) tuples
+
+        Raises:
+            ValueError: If max_workers is not a positive integer
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        return self._analyze_many(iter(app_ids), lang, country, assets, max_workers, rate)
+
+    async def _analyze_many(self, app_ids: Iterator[str], lang: str, country: str, assets: Optional[str],
+                            max_workers: int, rate: Optional[float]) -> AsyncIterator[Tuple[str, Union[Dict, Exception]]]:
+        """Async generator behind app_analyze_many, run once its arguments are validated."""
+        # A batch-local bucket, so the shared limiter and other callers are untouched
+        bucket = TokenBucket(rate) if rate else None
+
+        async def analyze(app_id):
+            try:
+                if bucket is not None:
+                    await bucket.acquire_async()
+                return app_id, await self.app_analyze(app_id, lang, country, assets)
+            except Exception as e:
+                return app_id, e
+
+        pending = set()
+        try:
+            while True:
+                for app_id in app_ids:
+                    pending.add(asyncio.ensure_future(analyze(app_id)))
+                    if len(pending) >= max_workers * 2:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncSearchMethods:
+    """Async methods for searching apps by keyword."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncSearchMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = SearchParser()
+
+    async def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Search for apps and get complete results with pagination support.
+        
+        Args:
+            query: Search query string
+            count: Number of results to return
+            lang: Language code
+            country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
+            
+        Returns:
+            List of dictionaries containing app data
+            
+        Raises:
+            InvalidAppIdError: If query is invalid
+        """
+        if not query or not isinstance(query, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        html_content = await self.http_client.fetch_search_page(query=query, lang=lang, country=country) if count > 0 else ""
+        dataset = self.parser.parse_html_content(html_content)
+
+        if count > 20:
+            token = self.parser.extract_pagination_token(dataset)
+            all_results = list(SearchScraper._get_nested_value(dataset.get("ds:1", []), [0, 1, 0, 0, 0], []))
+
+            while len(all_results) < count and token:
+                needed = min(100, count - len(all_results))
+                try:
+                    response_text = await self.http_client.fetch_search_page(token=token, needed=needed, lang=lang, country=country)
+                    page = SearchScraper.parse_pagination_response(response_text)
+                    if page is None:
+                        break
+                    paginated_results, token = page
+                    all_results.extend(paginated_results)
+                except (json.JSONDecodeError, IndexError, KeyError, Exception):
+                    break
+
+            dataset = SearchScraper.merge_results(dataset, all_results, count)
+
+        return self.parser.parse_search_results(dataset, count, fields)
+
+    async def search_get_field(self, query: str, field: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from all search results."""
+        results = await self.search_analyze(query, count, lang, country, fields=[field])
+        return [app.get(field) for app in results]
+
+    async def search_get_fields(self, query: str, fields: List[str], count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from all search results."""
+        results = await self.search_analyze(query, count, lang, country, fields=fields)
+        return [{field: app.get(field) for field in fields} for app in results]
+
+
+class AsyncReviewsIterator(ReviewsCursor):
+    """Async iterator yielding parsed reviews, fetching the next batch on demand.
+
+    Example:
+        async for review in scraper.reviews_iter("com.whatsapp", sort="NEWEST"):
+            await publish(review)
+    """
+
+    def __init__(self, http_client: AsyncHttpClient, parser: ReviewsParser, app_id: str, **kwargs):
+        super().__init__(parser, app_id, **kwargs)
+        self.http_client = http_client
+
+    def __aiter__(self) -> "AsyncReviewsIterator":
+        return self
+
+    async def __anext__(self) -> Dict:
+        try:
+            while not self._buffer:
+                if self._exhausted:
+                    raise StopAsyncIteration
+                reviews_raw, next_token = self.decode(await self.fetch())
+                if self._pending is not None:
+                    # Let the prefetch send its request before parsing blocks the loop
+                    await asyncio.sleep(0)
+                self.fill(reviews_raw, next_token)
+            return self.pop()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def __aenter__(self) -> "AsyncReviewsIterator":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def fetch(self) -> str:
+        """Get the response of the batch for ``_next_token``, prefetched or fetched now."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            return await pending
+        return await self.http_client.fetch_reviews_batch(
+            self.app_id, self.lang, self.country, self.sort, self.batch_count(), self._next_token
+        )
+
+    def start_fetch(self, token: str, count: int) -> None:
+        self._pending = asyncio.ensure_future(self.http_client.fetch_reviews_batch(
+            self.app_id, self.lang, self.country, self.sort, count, token
+        ))
+
+    async def aclose(self) -> None:
+        """Stop iterating and cancel any prefetch in flight, discarding its batch.
+
+        ``token`` keeps pointing at the first batch not fully yielded, so the
+        crawl can still be resumed from it.
+        """
+        self._exhausted = True
+        self._buffer.clear()
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                pending.exception()  # Retrieve it so an unused failure is not logged
+
+
+class AsyncReviewsMethods:
+    """Async methods for extracting user reviews and ratings."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncReviewsMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = ReviewsParser()
+
+    async def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE,
+                              country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                              resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                              since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                              batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                              prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict]:
+        """Get user reviews for an app.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
+            
+        Returns:
+            List of review dictionaries
+            
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        if count <= 0:
+            return []
+
+        try:
+            reviews = self.reviews_iter(app_id, count, lang, country, sort, resume_token=resume_token, checkpoint=checkpoint,
+                                        since=since, since_review_id=since_review_id, batch_size=batch_size,
+                                        prefetch=prefetch)
+            reviews_data = [review async for review in reviews]
+        except Exception as e:
+            logger.error(Config.ERROR_MESSAGES["REVIEWS_SCRAPE_FAILED"].format(app_id=app_id, error=e))
+            raise
+
+        return reviews_data
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, resume_token: Optional[str] = None,
+                     checkpoint: Optional[BaseCheckpointStore] = None, since: Optional[datetime] = None,
+                     since_review_id: Optional[str] = None,
+                     prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> AsyncReviewsIterator:
+        """Iterate asynchronously over user reviews, fetching one batch at a time."""
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        return AsyncReviewsIterator(self.http_client, self.parser, app_id, count=count, lang=lang, country=country,
+                                    sort=sort, batch_size=batch_size, token=resume_token, checkpoint=checkpoint,
+                                    since=since, since_review_id=since_review_id, prefetch=prefetch)
+
+    async def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT,
+                                lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                                resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                                since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                                batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                                prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Any]:
+        """Get single field from all reviews."""
+        reviews_data = await self.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                                  since, since_review_id, batch_size, prefetch)
+        return [review.get(field) for review in reviews_data]
+
+    async def reviews_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_REVIEWS_COUNT,
+                                 lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                                 resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                                 since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                                 batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                                 prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict[str, Any]]:
+        """Get multiple fields from all reviews."""
+        reviews_data = await self.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                                  since, since_review_id, batch_size, prefetch)
+        return [{field: review.get(field) for field in fields} for review in reviews_data]
+
+
+class AsyncDeveloperMethods:
+    """Async methods for getting all apps from a developer."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncDeveloperMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = DeveloperParser()
+
+    async def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get all apps from a developer.
+        
+        Args:
+            dev_id: Developer ID (numeric or string)
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
+            
+        Returns:
+            List of app dictionaries
+            
+        Raises:
+            InvalidAppIdError: If dev_id is invalid
+        """
+        if not dev_id or not isinstance(dev_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_DEV_ID"])
+
+        html_content = await self.http_client.fetch_developer_page(dev_id, lang, country)
+        dataset = DeveloperScraper.parse_developer_page(html_content, dev_id)
+        apps_data = self.parser.parse_developer_data(dataset, dev_id, fields)
+        return apps_data[:count]
+
+    async def developer_get_field(self, dev_id: str, field: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from all developer apps."""
+        results = await self.developer_analyze(dev_id, count, lang, country, fields=[field])
+        return [app.get(field) for app in results]
+
+    async def developer_get_fields(self, dev_id: str, fields: List[str], count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from all developer apps."""
+        results = await self.developer_analyze(dev_id, count, lang, country, fields=fields)
+        return [{field: app.get(field) for field in fields} for app in results]
+
+
+class AsyncSimilarMethods:
+    """Async methods for finding similar/competitor apps."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncSimilarMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = SimilarParser()
+
+    async def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get similar/competitor apps.
+        
+        Args:
+            app_id: Google Play app ID
+            count: Number of similar apps to return
+            lang: Language code
+            country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
+            
+        Returns:
+            List of similar app dictionaries
+            
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        html_content = await self.http_client.fetch_app_page(app_id, lang, country)
+        cluster_url = SimilarScraper.extract_cluster_url(html_content)
+        if not cluster_url:
+            return []
+
+        cluster_html = await self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        apps_data = self.parser.parse_similar_data(SimilarScraper.parse_cluster_page(cluster_html), fields)
+        return apps_data[:count]
+
+    async def similar_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from all similar apps."""
+        results = await self.similar_analyze(app_id, count, lang, country, fields=[field])
+        return [app.get(field) for app in results]
+
+    async def similar_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from all similar apps."""
+        results = await self.similar_analyze(app_id, count, lang, country, fields=fields)
+        return [{field: app.get(field) for field in fields} for app in results]
+
+
+class AsyncListMethods:
+    """Async methods for getting top charts (free, paid, grossing)."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncListMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = ListParser()
+
+    async def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get top charts (top free, top paid, top grossing).
+        
+        Args:
+            collection: Collection type (TOP_FREE, TOP_PAID, TOP_GROSSING)
+            category: App category
+            count: Number of apps to return
+            lang: Language code
+            country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
+            
+        Returns:
+            List of app dictionaries from top charts
+        """
+        cluster = ListScraper.CLUSTER_NAMES.get(collection, collection)
+        response_text = await self.http_client.fetch_list_page(cluster, category, count, lang, country)
+        apps_data = self.parser.parse_list_data(ListScraper.parse_list_response(response_text), count, fields)
+        return apps_data
+
+    async def list_get_field(self, collection: str, field: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
+        """Get single field from all list apps."""
+        results = await self.list_analyze(collection, category, count, lang, country, fields=[field])
+        return [app.get(field) for app in results]
+
+    async def list_get_fields(self, collection: str, fields: List[str], category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
+        """Get multiple fields from all list apps."""
+        results = await self.list_analyze(collection, category, count, lang, country, fields=fields)
+        return [{field: app.get(field) for field in fields} for app in results]
+
+
+class AsyncSuggestMethods:
+    """Async methods for getting search suggestions and autocomplete."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """Initialize AsyncSuggestMethods with a shared async client and parser."""
+        self.http_client = http_client
+        self.parser = SuggestParser()
+
+    async def suggest_analyze(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[str]:
+        """Get search suggestions for a term.
+        
+        Args:
+            term: Search term
+            count: Number of suggestions to return
+            lang: Language code
+            country: Country code
+            
+        Returns:
+            List of suggestion strings
+            
+        Raises:
+            InvalidAppIdError: If term is invalid
+        """
+        if not term or not isinstance(term, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        response_text = await self.http_client.fetch_suggest_page(term, lang, country)
+        suggestions = self.parser.parse_suggestions(SuggestScraper.parse_suggest_response(response_text))
+        return suggestions[:count]
+
+    async def suggest_nested(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict[str, List[str]]:
+        """Get nested suggestions (suggestions for suggestions).
+
+        Second-level lookups run concurrently.
+        
+        Args:
+            term: Search term
+            count: Number of suggestions per level
+            lang: Language code
+            country: Country code
+            
+        Returns:
+            Dictionary mapping suggestions to their nested suggestions
+            
+        Raises:
+            InvalidAppIdError: If term is invalid
+        """
+        if not term or not isinstance(term, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_QUERY"])
+
+        first_level = await self.suggest_analyze(term, count, lang, country)
+        second_level = await asyncio.gather(
+            *(self.suggest_analyze(suggestion, count, lang, country) for suggestion in first_level)
+        )
+        return dict(zip(first_level, second_level))
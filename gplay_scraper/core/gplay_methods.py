@@ -5,13 +5,19 @@ data, retrieve specific fields, and print selected values; suggest methods also
 offer utilities for nested suggestions.
 """
 
-from typing import Any, List, Dict
+from abc import ABC, abstractmethod
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import logging
 from .gplay_scraper import AppScraper, SearchScraper, ReviewsScraper, DeveloperScraper, SimilarScraper, ListScraper, SuggestScraper
 from .gplay_parser import AppParser, SearchParser, ReviewsParser, DeveloperParser, SimilarParser, ListParser, SuggestParser
 from ..config import Config
 from ..exceptions import InvalidAppIdError
-from ..utils.http_client import ProxyConfig
+from ..utils.http_client import HttpClient, ProxyConfig
+from ..utils.rate_limiter import TokenBucket
+from ..utils.checkpoint import BaseCheckpointStore, ReviewsCheckpoint
 
 # Configure logging
 if not logging.getLogger().handlers:
@@ -22,16 +28,20 @@ logger = logging.getLogger(__name__)
 class AppMethods:
     """Methods for extracting app details with 65+ fields."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize AppMethods with scraper and parser."""
-        self.scraper = AppScraper(proxies=proxies)
+        self.scraper = AppScraper(proxies=proxies, http_client=http_client)
         self.parser = AppParser()
+        # Similar apps are read from the same app page when requested together
+        self.similar_scraper = SimilarScraper(http_client=self.scraper.http_client)
+        self.similar_parser = SimilarParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for the underlying scraper."""
         self.scraper.set_proxies(proxies)
 
-    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict:
+    def app_analyze(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None,
+                    include_similar: bool = False, similar_count: int = Config.DEFAULT_SIMILAR_COUNT) -> Dict:
         """Get complete app data with all 65+ fields.
         
         Args:
@@ -39,6 +49,9 @@ class AppMethods:
             lang: Language code
             country: Country code
             assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            include_similar: Also return similar apps under ``similarApps``,
+                reusing the app page instead of fetching it a second time
+            similar_count: Number of similar apps to return
             
         Returns:
             Dictionary with all app data
@@ -49,9 +62,16 @@ class AppMethods:
         if not app_id or not isinstance(app_id, str):
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
             
-        dataset = self.scraper.scrape_play_store_data(app_id, lang, country)
+        html_content = self.scraper.fetch_playstore_page(app_id, lang, country)
+        dataset = self.scraper.parse_app_page(html_content)
         app_details = self.parser.parse_app_data(dataset, app_id, self.scraper, assets)
-        return self.parser.format_app_data(app_details)
+        result = self.parser.format_app_data(app_details)
+        
+        if include_similar:
+            similar_dataset = self.similar_scraper.scrape_cluster_data(html_content, lang, country)
+            apps_data = self.similar_parser.parse_similar_data(similar_dataset)
+            result["similarApps"] = apps_data[:similar_count]
+        return result
 
     def app_get_field(self, app_id: str, field: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Any:
         """Get single field value from app data.
@@ -66,7 +86,7 @@ class AppMethods:
         Returns:
             Value of the requested field
         """
-        return self.app_analyze(app_id, lang, country, assets).get(field)
+        return self.app_get_fields(app_id, [field], lang, country, assets)[field]
 
     def app_get_fields(self, app_id: str, fields: List[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, assets: str = None) -> Dict[str, Any]:
         """Get multiple field values from app data.
@@ -80,23 +100,96 @@ class AppMethods:
             
         Returns:
             Dictionary with requested fields and values
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
         """
-        data = self.app_analyze(app_id, lang, country, assets)
-        return {field: data.get(field) for field in fields}
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        # Only the requested fields are extracted; the release date fallback
+        # request is skipped unless a date-based field was asked for
+        html_content = self.scraper.fetch_playstore_page(app_id, lang, country)
+        dataset = self.scraper.parse_app_page(html_content)
+        app_details = self.parser.parse_app_data(dataset, app_id, self.scraper, assets, fields)
+        return self.parser.format_app_data(app_details, fields)
+
+    def app_analyze_many(self, app_ids: Iterable[str], lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                         assets: str = None, max_workers: int = Config.BULK_MAX_WORKERS, rate: float = None) -> Iterator[Tuple[str, Union[Dict, Exception]]]:
+        """Analyze many apps concurrently, yielding results as they complete.
+        
+        Failures are yielded per item instead of aborting the batch. At most
+        ``max_workers * 2`` apps are queued at once, so ``app_ids`` may be a
+        large or lazy iterable.
+        
+        Args:
+            app_ids: Google Play app IDs
+            lang: Language code
+            country: Country code
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            max_workers: Number of worker threads
+            rate: Optional cap on apps started per second for this batch,
+                applied on top of the client's shared rate limit
+            
+        Returns:
+            Iterator of (app_id, app data dictionary or raised exception) tuples
+
+        Raises:
+            ValueError: If max_workers is not a positive integer
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        return self._analyze_many(iter(app_ids), lang, country, assets, max_workers, rate)
+
+    def _analyze_many(self, app_ids: Iterator[str], lang: str, country: str, assets: Optional[str],
+                      max_workers: int, rate: Optional[float]) -> Iterator[Tuple[str, Union[Dict, Exception]]]:
+        """Generator behind app_analyze_many, run once its arguments are validated."""
+        # A batch-local bucket, so the shared limiter and other callers are untouched
+        bucket = TokenBucket(rate) if rate else None
+
+        def analyze(app_id: str) -> Dict:
+            if bucket is not None:
+                bucket.acquire()
+            return self.app_analyze(app_id, lang, country, assets)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+
+        def submit_next() -> bool:
+            for app_id in app_ids:
+                pending[executor.submit(analyze, app_id)] = app_id
+                return True
+            return False
+
+        try:
+            while len(pending) < max_workers * 2 and submit_next():
+                pass
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    app_id = pending.pop(future)
+                    error = future.exception()
+                    yield app_id, error if error is not None else future.result()
+                    submit_next()
+        finally:
+            # An abandoned batch drops the apps still queued instead of waiting for them
+            executor.shutdown(wait=False, cancel_futures=True)
+
 
 class SearchMethods:
     """Methods for searching apps by keyword."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize SearchMethods with scraper and parser."""
-        self.scraper = SearchScraper(proxies=proxies)
+        self.scraper = SearchScraper(proxies=proxies, http_client=http_client)
         self.parser = SearchParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for the underlying scraper."""
         self.scraper.set_proxies(proxies)
 
-    def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def search_analyze(self, query: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
         """Search for apps and get complete results with pagination support.
         
         Args:
@@ -104,6 +197,8 @@ class SearchMethods:
             count: Number of results to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
             
         Returns:
             List of dictionaries containing app data
@@ -117,8 +212,7 @@ class SearchMethods:
         # scrape_play_store_data now handles pagination automatically
         dataset = self.scraper.scrape_play_store_data(query, count, lang, country)
         
-        raw_results = self.parser.parse_search_results(dataset, count)
-        return [self.parser.format_search_result(result) for result in raw_results]
+        return self.parser.parse_search_results(dataset, count, fields)
 
     def search_get_field(self, query: str, field: str, count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
         """Get single field from all search results.
@@ -133,7 +227,7 @@ class SearchMethods:
         Returns:
             List of field values from all results
         """
-        results = self.search_analyze(query, count, lang, country)
+        results = self.search_analyze(query, count, lang, country, fields=[field])
         return [app.get(field) for app in results]
 
     def search_get_fields(self, query: str, fields: List[str], count: int = Config.DEFAULT_SEARCH_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
@@ -149,15 +243,255 @@ class SearchMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.search_analyze(query, count, lang, country)
+        results = self.search_analyze(query, count, lang, country, fields=fields)
         return [{field: app.get(field) for field in fields} for app in results]
 
+class ReviewsCursor(ABC):
+    """Position in an app's reviews, shared by the sync and async iterators.
+
+    Holds at most one parsed batch. ``token`` is the continuation token from
+    which the reviews not yet yielded can be fetched: it advances once a
+    batch has been fully yielded and is None when no reviews are left, so a
+    crawl restarted from it never skips reviews (it may repeat part of a
+    batch that was cut short). With a checkpoint store, every advance of
+    ``token`` is recorded, a crawl without an explicit token resumes from
+    the recorded one, and the checkpoint is deleted when no reviews are left.
+
+    With ``since`` or ``since_review_id`` (NEWEST order only), paging stops
+    at the first review that is not newer than the given time or is the
+    given review, so only reviews posted since the last poll are fetched.
+
+    With ``prefetch``, the request for the next batch is started as soon as
+    its token has been decoded, so it is in flight while the current batch
+    is parsed and consumed. Subclasses provide the transport by implementing
+    ``start_fetch``.
+
+    Args:
+        parser: ReviewsParser used to parse each batch
+        app_id: Google Play app ID
+        count: Maximum number of reviews to yield (None for all)
+        lang: Language code
+        country: Country code
+        sort: Sort order (NEWEST, RELEVANT, RATING)
+        batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+        token: Continuation token to start from (None for the first page,
+            or the checkpointed token)
+        checkpoint: Optional store recording progress for resuming
+        since: Stop at the first review posted at or before this time
+        since_review_id: Stop at this review, e.g. the newest one of the last poll
+        prefetch: Fetch the next batch while the current one is parsed
+
+    Raises:
+        ValueError: If batch_size is not positive, or ``since`` or
+            ``since_review_id`` is used with a sort order other than NEWEST
+    """
+
+    def __init__(self, parser: ReviewsParser, app_id: str, count: Optional[int] = None,
+                 lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY,
+                 sort: str = Config.DEFAULT_REVIEWS_SORT, batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                 token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                 since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                 prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH):
+        self.parser = parser
+        self.app_id = app_id
+        self.lang = lang
+        self.country = country
+        self.sort = ReviewsScraper.sort_value(sort)
+        if (since is not None or since_review_id is not None) and self.sort != ReviewsScraper.SORT_NAMES["NEWEST"]:
+            raise ValueError("since and since_review_id require sort='NEWEST'")
+        self.since = since.timestamp() if since is not None else None
+        self.since_review_id = since_review_id
+        self.batch_size = ReviewsScraper.batch_size_value(batch_size)
+        self.prefetch = prefetch
+        self.remaining = count
+        self.checkpoint = checkpoint
+        self.seen = 0
+        if checkpoint is not None and token is None:
+            saved = checkpoint.load(app_id, self.sort, lang, country)
+            if saved is not None:
+                token, self.seen = saved.token, saved.seen
+        self.token = token
+        self._next_token = token
+        self._buffer = deque()
+        self._pending = None  # Prefetched batch (a future or task) for _next_token
+        self._exhausted = count is not None and count <= 0
+
+    def batch_count(self, pending: int = 0) -> int:
+        """Number of reviews to request in the next batch.
+
+        Args:
+            pending: Reviews already fetched but not yet counted against ``remaining``
+        """
+        if self.remaining is None:
+            return self.batch_size
+        return min(self.batch_size, self.remaining - pending)
+
+    def accept(self, response: str) -> None:
+        """Decode and parse one batch response into the buffer.
+
+        Args:
+            response: Raw API response content of the batch fetched with ``_next_token``
+        """
+        self.fill(*self.decode(response))
+
+    def decode(self, response: str) -> Tuple[List, Optional[str]]:
+        """Decode one batch response and start prefetching the batch after it.
+
+        Args:
+            response: Raw API response content of the batch fetched with ``_next_token``
+
+        Returns:
+            Tuple of (raw review arrays, token for the next batch or None)
+        """
+        reviews_raw, next_token = ReviewsScraper.decode_reviews_batch(response) if response else ([], None)
+        if self.since is not None or self.since_review_id is not None:
+            unseen = self.unseen_count(reviews_raw)
+            if unseen < len(reviews_raw):
+                # Everything from here on was seen by the previous poll
+                reviews_raw, next_token = reviews_raw[:unseen], None
+        if self.prefetch and next_token:
+            upcoming = self.batch_count(len(reviews_raw))
+            if upcoming > 0:
+                self.start_fetch(next_token, upcoming)
+        return reviews_raw, next_token
+
+    def fill(self, reviews_raw: List, next_token: Optional[str]) -> None:
+        """Parse a decoded batch into the buffer and move to the next batch.
+
+        Args:
+            reviews_raw: Raw review arrays returned by ``decode``
+            next_token: Token for the next batch returned by ``decode``
+        """
+        reviews = self.parser.parse_review_entries(reviews_raw)
+        if self.remaining is not None:
+            if len(reviews) > self.remaining:
+                # Resume from this batch again, since its tail is not yielded
+                reviews, next_token = reviews[:self.remaining], self._next_token
+            self.remaining -= len(reviews)
+        self._buffer.extend(reviews)
+        self._next_token = next_token
+        if not next_token or self.remaining == 0:
+            self._exhausted = True
+        if not self._buffer:
+            self.advance(next_token)
+
+    def unseen_count(self, reviews_raw: List) -> int:
+        """Number of leading raw reviews newer than ``since`` and ``since_review_id``."""
+        for index, review_raw in enumerate(reviews_raw):
+            if not review_raw:
+                continue
+            if self.since_review_id is not None and review_raw[0] == self.since_review_id:
+                return index
+            if (self.since is not None and len(review_raw) > 5 and review_raw[5]
+                    and review_raw[5][0] <= self.since):
+                return index
+        return len(reviews_raw)
+
+    def pop(self) -> Dict:
+        """Take the next buffered review, advancing ``token`` past a finished batch."""
+        review = self._buffer.popleft()
+        self.seen += 1
+        if not self._buffer:
+            self.advance(self._next_token)
+        return review
+
+    def advance(self, token: Optional[str]) -> None:
+        """Move ``token`` past a finished batch and record it in the checkpoint store."""
+        self.token = token
+        if self.checkpoint is None:
+            return
+        if token is None:
+            self.checkpoint.delete(self.app_id, self.sort, self.lang, self.country)
+        else:
+            self.checkpoint.save(ReviewsCheckpoint(self.app_id, self.sort, self.lang, self.country, token, self.seen))
+
+    @abstractmethod
+    def start_fetch(self, token: str, count: int) -> None:
+        """Start fetching the batch for ``token`` in the background, storing it in ``_pending``."""
+
+
+class ReviewsIterator(ReviewsCursor):
+    """Iterator yielding parsed reviews, fetching the next batch on demand.
+
+    With ``prefetch``, the next batch is fetched on a background thread. A
+    consumer that stops early should call ``close`` (or use the iterator as a
+    context manager) to release that thread and drop the in-flight request.
+
+    Example:
+        with scraper.reviews_iter("com.whatsapp", sort="NEWEST", prefetch=True) as reviews:
+            for review in reviews:
+                if not publish(review):
+                    break
+        print(reviews.token)  # None once every review has been read
+    """
+
+    def __init__(self, scraper: ReviewsScraper, parser: ReviewsParser, app_id: str, **kwargs):
+        super().__init__(parser, app_id, **kwargs)
+        self.scraper = scraper
+        self._executor = None
+
+    def __iter__(self) -> "ReviewsIterator":
+        return self
+
+    def __next__(self) -> Dict:
+        try:
+            while not self._buffer:
+                if self._exhausted:
+                    raise StopIteration
+                self.accept(self.fetch())
+            return self.pop()
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ReviewsIterator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        # Safeguard for iterators dropped without close()
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch(self) -> str:
+        """Get the response of the batch for ``_next_token``, prefetched or fetched now."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            return pending.result()
+        return self.scraper.fetch_reviews_batch(
+            self.app_id, self.lang, self.country, self.sort, self.batch_count(), self._next_token
+        )
+
+    def start_fetch(self, token: str, count: int) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = self._executor.submit(
+            self.scraper.fetch_reviews_batch, self.app_id, self.lang, self.country, self.sort, count, token
+        )
+
+    def close(self) -> None:
+        """Stop iterating and release the prefetch thread, discarding any prefetched batch.
+
+        ``token`` keeps pointing at the first batch not fully yielded, so the
+        crawl can still be resumed from it.
+        """
+        self._exhausted = True
+        self._buffer.clear()
+        self._pending = None
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class ReviewsMethods:
     """Methods for extracting user reviews and ratings."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize ReviewsMethods with scraper and parser."""
-        self.scraper = ReviewsScraper(proxies=proxies)
+        self.scraper = ReviewsScraper(proxies=proxies, http_client=http_client)
         self.parser = ReviewsParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
@@ -165,7 +499,11 @@ class ReviewsMethods:
         self.scraper.set_proxies(proxies)
 
     def reviews_analyze(self, app_id: str, count: int = Config.DEFAULT_REVIEWS_COUNT, lang: str = Config.DEFAULT_LANGUAGE, 
-                       country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict]:
+                       country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                       resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                       since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                       batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                       prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict]:
         """Get user reviews for an app.
         
         Args:
@@ -174,6 +512,13 @@ class ReviewsMethods:
             lang: Language code
             country: Country code
             sort: Sort order (NEWEST, RELEVANT, RATING)
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of review dictionaries
@@ -188,16 +533,58 @@ class ReviewsMethods:
             return []
             
         try:
-            dataset = self.scraper.scrape_reviews_data(app_id, count, lang, country, sort)
-            reviews_data = self.parser.parse_multiple_responses(dataset)
+            reviews_data = list(self.reviews_iter(app_id, count, lang, country, sort,
+                                                  resume_token=resume_token, checkpoint=checkpoint,
+                                                  since=since, since_review_id=since_review_id,
+                                                  batch_size=batch_size, prefetch=prefetch))
         except Exception as e:
             logger.error(Config.ERROR_MESSAGES["REVIEWS_SCRAPE_FAILED"].format(app_id=app_id, error=e))
             raise
 
-        return self.parser.format_reviews_data(reviews_data)
+        return reviews_data
+
+    def reviews_iter(self, app_id: str, count: Optional[int] = None, lang: str = Config.DEFAULT_LANGUAGE,
+                     country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                     batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE, resume_token: Optional[str] = None,
+                     checkpoint: Optional[BaseCheckpointStore] = None, since: Optional[datetime] = None,
+                     since_review_id: Optional[str] = None,
+                     prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> ReviewsIterator:
+        """Iterate over user reviews, fetching one batch at a time.
+
+        Args:
+            app_id: Google Play app ID
+            count: Maximum number of reviews to yield (None for all)
+            lang: Language code
+            country: Country code
+            sort: Sort order (NEWEST, RELEVANT, RATING)
+            batch_size: Reviews requested per batch
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            prefetch: Fetch the next batch while the current one is parsed
+
+        Returns:
+            Iterator of review dictionaries; its ``token`` attribute holds
+            the current continuation token
+
+        Raises:
+            InvalidAppIdError: If app_id is invalid
+        """
+        if not app_id or not isinstance(app_id, str):
+            raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
+
+        return ReviewsIterator(self.scraper, self.parser, app_id, count=count, lang=lang, country=country,
+                               sort=sort, batch_size=batch_size, token=resume_token, checkpoint=checkpoint,
+                               since=since, since_review_id=since_review_id, prefetch=prefetch)
 
     def reviews_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_REVIEWS_COUNT, 
-                         lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Any]:
+                         lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                         resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                         since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                         batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                         prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Any]:
         """Get single field from all reviews.
         
         Args:
@@ -207,15 +594,27 @@ class ReviewsMethods:
             lang: Language code
             country: Country code
             sort: Sort order
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of field values from all reviews
         """
-        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort)
+        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                            since, since_review_id, batch_size, prefetch)
         return [review.get(field) for review in reviews_data]
 
     def reviews_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_REVIEWS_COUNT,
-                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT) -> List[Dict[str, Any]]:
+                          lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, sort: str = Config.DEFAULT_REVIEWS_SORT,
+                          resume_token: Optional[str] = None, checkpoint: Optional[BaseCheckpointStore] = None,
+                          since: Optional[datetime] = None, since_review_id: Optional[str] = None,
+                          batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+                          prefetch: bool = Config.DEFAULT_REVIEWS_PREFETCH) -> List[Dict[str, Any]]:
         """Get multiple fields from all reviews.
         
         Args:
@@ -225,26 +624,34 @@ class ReviewsMethods:
             lang: Language code
             country: Country code
             sort: Sort order
+            resume_token: Continuation token to resume a crawl from
+            checkpoint: Checkpoint store recording progress; a crawl without
+                ``resume_token`` resumes from its recorded token
+            since: Return only reviews posted after this time (NEWEST sort)
+            since_review_id: Return only reviews newer than this review (NEWEST sort)
+            batch_size: Reviews requested per batch (capped at Config.MAX_REVIEWS_BATCH_SIZE)
+            prefetch: Fetch the next batch while the current one is parsed
             
         Returns:
             List of dictionaries with requested fields
         """
-        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort)
+        reviews_data = self.reviews_analyze(app_id, count, lang, country, sort, resume_token, checkpoint,
+                                            since, since_review_id, batch_size, prefetch)
         return [{field: review.get(field) for field in fields} for review in reviews_data]
 
 class DeveloperMethods:
     """Methods for getting all apps from a developer."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize DeveloperMethods with scraper and parser."""
-        self.scraper = DeveloperScraper(proxies=proxies)
+        self.scraper = DeveloperScraper(proxies=proxies, http_client=http_client)
         self.parser = DeveloperParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for the underlying scraper."""
         self.scraper.set_proxies(proxies)
 
-    def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def developer_analyze(self, dev_id: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
         """Get all apps from a developer.
         
         Args:
@@ -252,6 +659,8 @@ class DeveloperMethods:
             count: Number of apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
             
         Returns:
             List of app dictionaries
@@ -263,8 +672,8 @@ class DeveloperMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_DEV_ID"])
             
         dataset = self.scraper.scrape_play_store_data(dev_id, lang, country)
-        apps_data = self.parser.parse_developer_data(dataset, dev_id)
-        return self.parser.format_developer_data(apps_data)[:count]
+        apps_data = self.parser.parse_developer_data(dataset, dev_id, fields)
+        return apps_data[:count]
 
     def developer_get_field(self, dev_id: str, field: str, count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
         """Get single field from all developer apps.
@@ -279,7 +688,7 @@ class DeveloperMethods:
         Returns:
             List of field values from all apps
         """
-        results = self.developer_analyze(dev_id, count, lang, country)
+        results = self.developer_analyze(dev_id, count, lang, country, fields=[field])
         return [app.get(field) for app in results]
 
     def developer_get_fields(self, dev_id: str, fields: List[str], count: int = Config.DEFAULT_DEVELOPER_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
@@ -295,22 +704,22 @@ class DeveloperMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.developer_analyze(dev_id, count, lang, country)
+        results = self.developer_analyze(dev_id, count, lang, country, fields=fields)
         return [{field: app.get(field) for field in fields} for app in results]
 
 class SimilarMethods:
     """Methods for finding similar/competitor apps."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize SimilarMethods with scraper and parser."""
-        self.scraper = SimilarScraper(proxies=proxies)
+        self.scraper = SimilarScraper(proxies=proxies, http_client=http_client)
         self.parser = SimilarParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for the underlying scraper."""
         self.scraper.set_proxies(proxies)
 
-    def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def similar_analyze(self, app_id: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
         """Get similar/competitor apps.
         
         Args:
@@ -318,6 +727,8 @@ class SimilarMethods:
             count: Number of similar apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
             
         Returns:
             List of similar app dictionaries
@@ -329,8 +740,8 @@ class SimilarMethods:
             raise InvalidAppIdError(Config.ERROR_MESSAGES["INVALID_APP_ID"])
             
         dataset = self.scraper.scrape_play_store_data(app_id, lang, country)
-        apps_data = self.parser.parse_similar_data(dataset)
-        return self.parser.format_similar_data(apps_data)[:count]
+        apps_data = self.parser.parse_similar_data(dataset, fields)
+        return apps_data[:count]
 
     def similar_get_field(self, app_id: str, field: str, count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
         """Get single field from all similar apps.
@@ -345,7 +756,7 @@ class SimilarMethods:
         Returns:
             List of field values from all similar apps
         """
-        results = self.similar_analyze(app_id, count, lang, country)
+        results = self.similar_analyze(app_id, count, lang, country, fields=[field])
         return [app.get(field) for app in results]
 
     def similar_get_fields(self, app_id: str, fields: List[str], count: int = Config.DEFAULT_SIMILAR_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
@@ -361,22 +772,22 @@ class SimilarMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.similar_analyze(app_id, count, lang, country)
+        results = self.similar_analyze(app_id, count, lang, country, fields=fields)
         return [{field: app.get(field) for field in fields} for app in results]
 
 class ListMethods:
     """Methods for getting top charts (free, paid, grossing)."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize ListMethods with scraper and parser."""
-        self.scraper = ListScraper(proxies=proxies)
+        self.scraper = ListScraper(proxies=proxies, http_client=http_client)
         self.parser = ListParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for the underlying scraper."""
         self.scraper.set_proxies(proxies)
 
-    def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict]:
+    def list_analyze(self, collection: str = Config.DEFAULT_LIST_COLLECTION, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY, fields: Optional[List[str]] = None) -> List[Dict]:
         """Get top charts (top free, top paid, top grossing).
         
         Args:
@@ -385,13 +796,15 @@ class ListMethods:
             count: Number of apps to return
             lang: Language code
             country: Country code
+            fields: Only extract these fields (None for all); each result then
+                holds the requested fields it knows plus ``title``, and no others
             
         Returns:
             List of app dictionaries from top charts
         """
         dataset = self.scraper.scrape_play_store_data(collection, category, count, lang, country)
-        apps_data = self.parser.parse_list_data(dataset, count)
-        return self.parser.format_list_data(apps_data)
+        apps_data = self.parser.parse_list_data(dataset, count, fields)
+        return apps_data
 
     def list_get_field(self, collection: str, field: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Any]:
         """Get single field from all list apps.
@@ -407,7 +820,7 @@ class ListMethods:
         Returns:
             List of field values from all apps
         """
-        results = self.list_analyze(collection, category, count, lang, country)
+        results = self.list_analyze(collection, category, count, lang, country, fields=[field])
         return [app.get(field) for app in results]
 
     def list_get_fields(self, collection: str, fields: List[str], category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> List[Dict[str, Any]]:
@@ -424,15 +837,15 @@ class ListMethods:
         Returns:
             List of dictionaries with requested fields
         """
-        results = self.list_analyze(collection, category, count, lang, country)
+        results = self.list_analyze(collection, category, count, lang, country, fields=fields)
         return [{field: app.get(field) for field in fields} for app in results]
 
 class SuggestMethods:
     """Methods for getting search suggestions and autocomplete."""
 
-    def __init__(self, proxies: ProxyConfig = None):
+    def __init__(self, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize SuggestMethods with scraper and parser."""
-        self.scraper = SuggestScraper(proxies=proxies)
+        self.scraper = SuggestScraper(proxies=proxies, http_client=http_client)
         self.parser = SuggestParser()
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
@@ -459,7 +872,7 @@ class SuggestMethods:
         
         dataset = self.scraper.scrape_suggestions(term, lang, country)
         suggestions = self.parser.parse_suggestions(dataset)
-        return self.parser.format_suggestions(suggestions[:count])
+        return suggestions[:count]
 
     def suggest_nested(self, term: str, count: int = Config.DEFAULT_SUGGEST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> Dict[str, List[str]]:
         """Get nested suggestions (suggestions for suggestions).
@@ -5,36 +5,193 @@ data formatting for all scraping methods.
 """
 
 import json
-import re
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
-from ..models.element_specs import ElementSpecs, nested_lookup, format_image_url
+from typing import Callable, Dict, Any, Iterable, List, Mapping, Optional, Set, Tuple
+from .gplay_scraper import ReviewsScraper
+from ..models.element_specs import ElementSpecs, compile_specs, nested_lookup, format_image_url
 from ..utils.helpers import (
-    clean_json_string,
-    alternative_json_clean,
+    parse_data_array,
     calculate_app_age,
     calculate_daily_installs,
     calculate_monthly_installs,
 )
+from ..utils.init_data import LazyDatasets
+from ..utils.js_literal import parse_js_literal
+from ..utils import json_backend
 from ..config import Config
 from ..exceptions import DataParsingError
 
 
+# Output field -> spec key, in output order, for the app cards of search
+# results, developer pages, clusters and top charts
+APP_CARD_LAYOUT = {
+    "appId": "appId",
+    "title": "title",
+    "description": "description",
+    "icon": "icon",
+    "screenshots": "screenshots",
+    "developer": "developer",
+    "genre": "genre",
+    "score": "score",
+    "scoreText": "scoreText",
+    "installs": "installs",
+    "currency": "currency",
+    "price": "price",
+    "free": "free",
+    "url": "url",
+}
+
+
+def card_layout(specs: Mapping[str, Any], **spec_keys: str) -> Dict[str, str]:
+    """APP_CARD_LAYOUT narrowed to the fields a spec table defines.
+
+    Args:
+        specs: Spec table such as ``ElementSpecs.Search``
+        **spec_keys: Output fields read from a differently named spec key
+
+    Returns:
+        Output field -> spec key, in output order
+    """
+    layout = {**APP_CARD_LAYOUT, **spec_keys}
+    return {field: key for field, key in layout.items() if key in specs}
+
+
+def projected_fields(fields: Optional[Iterable[str]]) -> Optional[Set[str]]:
+    """Output fields to extract for a list-type result.
+
+    ``title`` is always included since results without one are dropped.
+
+    Args:
+        fields: Output field names, or None for all fields
+
+    Returns:
+        Set of output fields, or None for all
+    """
+    if fields is None:
+        return None
+    return set(fields) | {"title"}
+
+
 class AppParser:
     """Parser for extracting and formatting app data."""
 
+    # Output field -> App spec key
+    FIELDS = {
+        "appId": "appId",
+        "title": "title",
+        "summary": "summary",
+        "description": "description",
+        "genre": "genre",
+        "genreId": "genreId",
+        "categories": "categories",
+        "available": "available",
+        "released": "released",
+        "appAgeDays": "appAge",
+        "lastUpdated": "lastUpdatedOn",
+        "updatedTimestamp": "updated",
+        "icon": "icon",
+        "headerImage": "headerImage",
+        "screenshots": "screenshots",
+        "video": "video",
+        "videoImage": "videoImage",
+        "installs": "installs",
+        "minInstalls": "minInstalls",
+        "realInstalls": "realInstalls",
+        "dailyInstalls": "dailyInstalls",
+        "minDailyInstalls": "minDailyInstalls",
+        "realDailyInstalls": "realDailyInstalls",
+        "monthlyInstalls": "monthlyInstalls",
+        "minMonthlyInstalls": "minMonthlyInstalls",
+        "realMonthlyInstalls": "realMonthlyInstalls",
+        "score": "score",
+        "ratings": "ratings",
+        "reviews": "reviews",
+        "histogram": "histogram",
+        "adSupported": "adSupported",
+        "containsAds": "containsAds",
+        "version": "version",
+        "androidVersion": "androidVersion",
+        "maxAndroidApi": "maxandroidapi",
+        "minAndroidApi": "minandroidapi",
+        "appBundle": "appBundle",
+        "contentRating": "contentRating",
+        "contentRatingDescription": "contentRatingDescription",
+        "whatsNew": "whatsNew",
+        "permissions": "permissions",
+        "dataSafety": "dataSafety",
+        "price": "price",
+        "currency": "currency",
+        "free": "free",
+        "offersIAP": "offersIAP",
+        "inAppProductPrice": "inAppProductPrice",
+        "sale": "sale",
+        "originalPrice": "originalPrice",
+        "developer": "developer",
+        "developerId": "developerId",
+        "developerEmail": "developerEmail",
+        "developerWebsite": "developerWebsite",
+        "developerAddress": "developerAddress",
+        "developerPhone": "developerPhone",
+        "privacyPolicy": "privacyPolicy",
+        "appUrl": "url",
+    }
+
+    # Derived metric -> (calculation, installs field it is based on, or None)
+    INSTALL_METRICS = {
+        "appAgeDays": (calculate_app_age, None),
+        "dailyInstalls": (calculate_daily_installs, "installs"),
+        "minDailyInstalls": (calculate_daily_installs, "minInstalls"),
+        "realDailyInstalls": (calculate_daily_installs, "realInstalls"),
+        "monthlyInstalls": (calculate_monthly_installs, "installs"),
+        "minMonthlyInstalls": (calculate_monthly_installs, "minInstalls"),
+        "realMonthlyInstalls": (calculate_monthly_installs, "realInstalls"),
+    }
+
+    # Fields filled in by the parser rather than read from a spec
+    COMPUTED_FIELDS = ("appId", "appUrl", *INSTALL_METRICS)
+
+    def record_layout(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """Output field -> spec key layout of the app record.
+
+        Args:
+            fields: Output fields the caller needs, or None for all fields
+
+        Returns:
+            Layout for compile_specs(); inputs of requested install metrics
+            are appended after the requested fields
+        """
+        names = self.FIELDS if fields is None else list(fields)
+        layout = {
+            field: None if field in self.COMPUTED_FIELDS else self.FIELDS.get(field)
+            for field in names
+        }
+        for metric, (_, installs_field) in self.INSTALL_METRICS.items():
+            if metric in layout:
+                for field in ("released", installs_field):
+                    if field:
+                        layout.setdefault(field, self.FIELDS[field])
+        return layout
+
     def parse_app_data(
-        self, dataset: Dict, app_id: str, scraper=None, assets: str = None
+        self, dataset: Dict, app_id: str, scraper=None, assets: str = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """Parse raw app data from dataset with fallback for missing release date.
 
+        The record is built once, with final field names and order, by the
+        compiled App extractor.
+
         Args:
             dataset: Raw dataset from scraper
             app_id: Google Play app ID
             scraper: AppScraper instance for fallback requests
+            assets: Asset size (SMALL, MEDIUM, LARGE, ORIGINAL)
+            fields: Output fields the caller needs (None for all); other specs,
+                metrics and the release date fallback request are skipped
 
         Returns:
-            Dictionary with parsed app details
+            Dictionary with all app fields (the requested ones first when
+            ``fields`` is given)
 
         Raises:
             DataParsingError: If parsing fails
@@ -43,171 +200,125 @@ class AppParser:
         if not ds5_data:
             raise DataParsingError(Config.ERROR_MESSAGES["NO_DS5_DATA"])
 
-        json_str_cleaned = clean_json_string(ds5_data)
         try:
-            data = json.loads(json_str_cleaned)
+            data = parse_js_literal(ds5_data)
         except json.JSONDecodeError as e:
             try:
-                alternative_cleaned = alternative_json_clean(ds5_data)
-                data = json.loads(alternative_cleaned)
+                data = {"data": parse_data_array(ds5_data)}
             except Exception:
                 raise DataParsingError(
                     Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e))
                 )
 
-        app_details = {}
-        for key, spec in ElementSpecs.App.items():
-            value = spec.extract_content(data.get("data", data))
-            # Format image URLs with assets parameter
-            if key in ["icon", "headerImage", "videoImage"] and value:
-                app_details[key] = format_image_url(value, assets)
-            elif key == "screenshots" and value:
-                app_details[key] = [
-                    format_image_url(url, assets) for url in value if url
-                ]
-            else:
-                app_details[key] = value
+        extract = compile_specs(ElementSpecs.App, layout=self.record_layout(fields))
+        app = extract(data.get("data", data))
+        # Format image URLs with assets parameter
+        for key in ["icon", "headerImage", "videoImage"]:
+            if app.get(key):
+                app[key] = format_image_url(app[key], assets)
+        if app.get("screenshots"):
+            app["screenshots"] = [
+                format_image_url(url, assets) for url in app["screenshots"] if url
+            ]
 
-        app_details["appId"] = app_id
-        app_details["url"] = (
-            f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
-        )
+        if "appId" in app:
+            app["appId"] = app_id
+        if "appUrl" in app:
+            app["appUrl"] = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
 
         # Check if release date is missing and try fallback
-        if not app_details.get("released") and scraper:
+        if scraper and self.needs_release_date(app):
+            try:
+                self.apply_fallback_data(app, scraper.fetch_fallback_data(app_id))
+            except Exception:
+                pass
+
+        self.compute_install_metrics(app)
+        return app
+
+    @staticmethod
+    def needs_release_date(app: Dict[str, Any]) -> bool:
+        """Check whether the release date fallback request is worth making.
+
+        Args:
+            app: App record from parse_app_data
+
+        Returns:
+            True if the record has a release date field and it is empty
+        """
+        return "released" in app and not app["released"]
+
+    def apply_fallback_data(self, app: Dict[str, Any], fallback_dataset: Optional[Dict]) -> None:
+        """Fill a missing release date from a fallback (no locale) dataset.
+
+        Args:
+            app: App record, updated in place
+            fallback_dataset: Dataset returned by AppScraper.fetch_fallback_data
+        """
+        if fallback_dataset and fallback_dataset.get("ds:5"):
             try:
-                fallback_dataset = scraper.fetch_fallback_data(app_id)
-                if fallback_dataset and fallback_dataset.get("ds:5"):
-                    fallback_cleaned = clean_json_string(fallback_dataset["ds:5"])
-                    try:
-                        fallback_data = json.loads(fallback_cleaned)
-                        released_spec = ElementSpecs.App["released"]
-                        fallback_released = released_spec.extract_content(
-                            fallback_data.get("data", fallback_data)
-                        )
-                        if fallback_released:
-                            app_details["released"] = fallback_released
-                    except Exception:
-                        pass
+                fallback_data = parse_js_literal(fallback_dataset["ds:5"])
+                released_spec = ElementSpecs.App["released"]
+                fallback_released = released_spec.extract_content(
+                    fallback_data.get("data", fallback_data)
+                )
+                if fallback_released:
+                    app["released"] = fallback_released
             except Exception:
                 pass
 
+    def compute_install_metrics(self, app: Dict[str, Any]) -> None:
+        """Compute app age and install rate metrics from the release date.
+
+        Only metrics present in the record are computed.
+
+        Args:
+            app: App record, updated in place
+        """
         current_date = datetime.now(timezone.utc)
-        release_date_str = app_details.get("released")
-        if release_date_str:
-            app_details["appAge"] = calculate_app_age(release_date_str, current_date)
-            app_details["dailyInstalls"] = calculate_daily_installs(
-                app_details.get("installs"), release_date_str, current_date
-            )
-            app_details["minDailyInstalls"] = calculate_daily_installs(
-                app_details.get("minInstalls"), release_date_str, current_date
-            )
-            app_details["realDailyInstalls"] = calculate_daily_installs(
-                app_details.get("realInstalls"), release_date_str, current_date
-            )
-            app_details["monthlyInstalls"] = calculate_monthly_installs(
-                app_details.get("installs"), release_date_str, current_date
-            )
-            app_details["minMonthlyInstalls"] = calculate_monthly_installs(
-                app_details.get("minInstalls"), release_date_str, current_date
-            )
-            app_details["realMonthlyInstalls"] = calculate_monthly_installs(
-                app_details.get("realInstalls"), release_date_str, current_date
-            )
-        else:
-            metric_keys = [
-                "appAge",
-                "dailyInstalls",
-                "minDailyInstalls",
-                "realDailyInstalls",
-                "monthlyInstalls",
-                "minMonthlyInstalls",
-                "realMonthlyInstalls",
-            ]
-            for key in metric_keys:
-                app_details[key] = None
+        release_date_str = app.get("released")
+        for metric, (calculate, installs_field) in self.INSTALL_METRICS.items():
+            if metric not in app:
+                continue
+            if not release_date_str:
+                app[metric] = None
+            elif installs_field is None:
+                app[metric] = calculate(release_date_str, current_date)
+            else:
+                app[metric] = calculate(app.get(installs_field), release_date_str, current_date)
 
-        return app_details
+    def format_app_data(self, details: dict, fields: Optional[Iterable[str]] = None) -> dict:
+        """Select fields of an app record.
 
-    def format_app_data(self, details: dict) -> dict:
-        """Format parsed app data into final structure.
+        Records from parse_app_data already have their final form, so this
+        only narrows one down to the requested fields.
 
         Args:
-            details: Parsed app details
+            details: App record from parse_app_data
+            fields: Only return these fields, in this order (None returns the record)
 
         Returns:
-            Formatted dictionary with all app fields
+            Dictionary with the app fields
         """
-        return {
-            "appId": details.get("appId"),
-            "title": details.get("title"),
-            "summary": details.get("summary"),
-            "description": details.get("description"),
-            "genre": details.get("genre"),
-            "genreId": details.get("genreId"),
-            "categories": details.get("categories"),
-            "available": details.get("available"),
-            "released": details.get("released"),
-            "appAgeDays": details.get("appAge"),
-            "lastUpdated": details.get("lastUpdatedOn"),
-            "updatedTimestamp": details.get("updated"),
-            "icon": details.get("icon"),
-            "headerImage": details.get("headerImage"),
-            "screenshots": details.get("screenshots"),
-            "video": details.get("video"),
-            "videoImage": details.get("videoImage"),
-            "installs": details.get("installs"),
-            "minInstalls": details.get("minInstalls"),
-            "realInstalls": details.get("realInstalls"),
-            "dailyInstalls": details.get("dailyInstalls"),
-            "minDailyInstalls": details.get("minDailyInstalls"),
-            "realDailyInstalls": details.get("realDailyInstalls"),
-            "monthlyInstalls": details.get("monthlyInstalls"),
-            "minMonthlyInstalls": details.get("minMonthlyInstalls"),
-            "realMonthlyInstalls": details.get("realMonthlyInstalls"),
-            "score": details.get("score"),
-            "ratings": details.get("ratings"),
-            "reviews": details.get("reviews"),
-            "histogram": details.get("histogram"),
-            "adSupported": details.get("adSupported"),
-            "containsAds": details.get("containsAds"),
-            "version": details.get("version"),
-            "androidVersion": details.get("androidVersion"),
-            "maxAndroidApi": details.get("maxandroidapi"),
-            "minAndroidApi": details.get("minandroidapi"),
-            "appBundle": details.get("appBundle"),
-            "contentRating": details.get("contentRating"),
-            "contentRatingDescription": details.get("contentRatingDescription"),
-            "whatsNew": details.get("whatsNew"),
-            "permissions": details.get("permissions"),
-            "dataSafety": details.get("dataSafety"),
-            "price": details.get("price"),
-            "currency": details.get("currency"),
-            "free": details.get("free"),
-            "offersIAP": details.get("offersIAP"),
-            "inAppProductPrice": details.get("inAppProductPrice"),
-            "sale": details.get("sale"),
-            "originalPrice": details.get("originalPrice"),
-            "developer": details.get("developer"),
-            "developerId": details.get("developerId"),
-            "developerEmail": details.get("developerEmail"),
-            "developerWebsite": details.get("developerWebsite"),
-            "developerAddress": details.get("developerAddress"),
-            "developerPhone": details.get("developerPhone"),
-            "privacyPolicy": details.get("privacyPolicy"),
-            "appUrl": details.get("url"),
-        }
+        if fields is None:
+            return details
+        return {field: details.get(field) for field in fields}
 
 
 class SearchParser:
     """Parser for extracting and formatting search results."""
 
-    def parse_search_results(self, dataset: Dict, count: int) -> List[Dict]:
+    # Output field -> spec key, in output order
+    LAYOUT = card_layout(ElementSpecs.Search, description="summary")
+
+    def parse_search_results(self, dataset: Dict, count: int, fields: Optional[Iterable[str]] = None) -> List[Dict]:
         """Parse search results from dataset.
 
         Args:
             dataset: Raw dataset from scraper
             count: Maximum number of results to parse
+            fields: Only extract these output fields, plus ``title`` (None
+                for all); unknown and unrequested fields are left out
 
         Returns:
             List of parsed search result dictionaries
@@ -220,54 +331,31 @@ class SearchParser:
         if not search_data:
             return []
 
+        extract = compile_specs(ElementSpecs.Search, projected_fields(fields), self.LAYOUT)
         results = []
         n_apps = min(len(search_data), count)
         for i in range(n_apps):
-            app = self.extract_search_result(search_data[i])
+            app = self.extract_search_result(search_data[i], extract)
             if app:
                 results.append(app)
 
         return results[:count]
 
-    def extract_search_result(self, data) -> Dict:
+    def extract_search_result(self, data, extract: Optional[Callable] = None) -> Dict:
         """Extract single search result from raw data.
 
         Args:
             data: Raw search result data
+            extract: Compiled Search extractor (default: all fields)
 
         Returns:
             Dictionary with extracted search result or None if extraction fails
         """
         try:
-            result = {}
-            for key, spec in ElementSpecs.Search.items():
-                result[key] = spec.extract_content(data)
-            return result
+            return (extract or compile_specs(ElementSpecs.Search, layout=self.LAYOUT))(data)
         except Exception:
             return None
 
-    def format_search_result(self, result: dict) -> dict:
-        """Format parsed search result into final structure.
-
-        Args:
-            result: Parsed search result
-
-        Returns:
-            Formatted dictionary with search result fields
-        """
-        return {
-            "appId": result.get("appId"),
-            "title": result.get("title"),
-            "description": result.get("summary"),
-            "icon": result.get("icon"),
-            "developer": result.get("developer"),
-            "score": result.get("score"),
-            "scoreText": result.get("scoreText"),
-            "currency": result.get("currency"),
-            "price": result.get("price"),
-            "free": result.get("free"),
-            "url": result.get("url"),
-        }
 
     def extract_pagination_token(self, dataset: Dict) -> str:
         """Extract pagination token from search dataset.
@@ -290,44 +378,20 @@ class SearchParser:
                     return potential_token
         return None
 
-    def parse_html_content(self, html_content: str) -> Dict:
+    def parse_html_content(self, html_content: str) -> Mapping[str, Any]:
         """Extract datasets from search page HTML.
 
         Args:
             html_content: HTML content of search page
 
         Returns:
-            Dictionary containing all datasets
+            Mapping of dataset key to data; blocks are decoded on first access
 
         Raises:
             DataParsingError: If no datasets found
         """
-        import re
-
-        script_regex = re.compile(r"AF_initDataCallback[\s\S]*?</script")
-        key_regex = re.compile(r"(ds:.*?)'")
-        value_regex = re.compile(r"data:([\s\S]*?), sideChannel: \{\}\}\);</")
-
-        matches = script_regex.findall(html_content)
-        dataset = {}
-
-        for match in matches:
-            key_match = key_regex.findall(match)
-            value_match = value_regex.findall(match)
-
-            if key_match and value_match:
-                key = key_match[0]
-                try:
-                    import json
-
-                    value = json.loads(value_match[0])
-                    dataset[key] = value
-                except json.JSONDecodeError:
-                    continue
-
-        if not dataset:
-            from ..exceptions import DataParsingError
-
+        dataset = LazyDatasets(html_content)
+        if not dataset.any_decodable("ds:1"):
             raise DataParsingError("No search data found in HTML")
 
         return dataset
@@ -348,58 +412,26 @@ class ReviewsParser:
         if not content or not isinstance(content, str):
             return [], None
 
-        regex = re.compile(r"\)]}'\\n\\n([\\s\\S]+)")
-        matches = regex.findall(content)
-
-        if not matches:
-            return [], None
-
-        try:
-            data = json.loads(matches[0])
-            if not data or len(data) == 0 or len(data[0]) < 3:
-                return [], None
-
-            reviews_data = json.loads(data[0][2])
+        reviews_raw, next_token = ReviewsScraper.decode_reviews_batch(content)
+        return self.parse_review_entries(reviews_raw), next_token
 
-            # Handle case where reviews_data is None or empty
-            if not reviews_data:
-                return [], None
+    def parse_review_entries(self, reviews_raw: List) -> List[Dict]:
+        """Parse already decoded raw review arrays.
 
-            next_token = None
-            try:
-                if (
-                    isinstance(reviews_data, list)
-                    and len(reviews_data) >= 2
-                    and reviews_data[-2]
-                    and isinstance(reviews_data[-2], list)
-                    and len(reviews_data[-2]) > 0
-                ):
-                    potential_token = reviews_data[-2][-1]
-                    if isinstance(potential_token, str):
-                        next_token = potential_token
-            except (IndexError, TypeError, AttributeError):
-                pass
+        Args:
+            reviews_raw: Raw review arrays, as returned by
+                ReviewsScraper.decode_reviews_batch
 
-            # Check if we have actual reviews data
-            if (
-                not isinstance(reviews_data, list)
-                or len(reviews_data) == 0
-                or not isinstance(reviews_data[0], list)
-                or len(reviews_data[0]) == 0
-            ):
-                return [], None
-
-            reviews = []
-            for review_raw in reviews_data[0]:
-                if review_raw:  # Make sure review_raw is not None
-                    review = self.extract_review_data(review_raw)
-                    if review:
-                        reviews.append(review)
-
-            return reviews, next_token
-
-        except (json.JSONDecodeError, IndexError, KeyError, TypeError, AttributeError):
-            return [], None
+        Returns:
+            List of review dictionaries
+        """
+        reviews = []
+        for review_raw in reviews_raw:
+            if review_raw:  # Make sure review_raw is not None
+                review = self.extract_review_data(review_raw)
+                if review:
+                    reviews.append(review)
+        return reviews
 
     def extract_review_data(self, review_raw) -> Optional[Dict]:
         """Extract single review from raw data.
@@ -417,13 +449,13 @@ class ReviewsParser:
                 if len(review_raw) > 1 and review_raw[1]
                 else None,
                 "userImage": None,
-                "content": review_raw[4] if len(review_raw) > 4 else None,
                 "score": review_raw[2] if len(review_raw) > 2 else None,
+                "content": review_raw[4] if len(review_raw) > 4 else None,
                 "thumbsUpCount": review_raw[6] if len(review_raw) > 6 else None,
+                "appVersion": review_raw[10] if len(review_raw) > 10 else None,
                 "at": datetime.fromtimestamp(review_raw[5][0]).isoformat()
                 if len(review_raw) > 5 and review_raw[5]
                 else None,
-                "appVersion": review_raw[10] if len(review_raw) > 10 else None,
             }
             try:
                 if (
@@ -440,10 +472,11 @@ class ReviewsParser:
             return None
 
     def parse_multiple_responses(self, dataset: Dict) -> List[Dict]:
-        """Parse multiple review responses.
+        """Parse the reviews collected by ReviewsScraper.scrape_reviews_data.
 
         Args:
-            dataset: Dataset containing multiple review responses
+            dataset: Dataset with raw review arrays under ``reviews``; raw
+                response strings are also accepted and decoded
 
         Returns:
             List of all parsed reviews
@@ -457,53 +490,31 @@ class ReviewsParser:
 
         all_reviews = []
 
-        for response in responses:
-            if response and isinstance(response, str):
-                try:
-                    reviews, _ = self.parse_reviews_response(response)
-                    if reviews:  # Only extend if we got actual reviews
-                        all_reviews.extend(reviews)
-                except Exception:
-                    continue  # Skip this response if it fails
+        for item in responses:
+            if isinstance(item, str):
+                all_reviews.extend(self.parse_reviews_response(item)[0])
+            elif item:
+                review = self.extract_review_data(item)
+                if review:
+                    all_reviews.append(review)
 
         return all_reviews
 
-    def format_reviews_data(self, reviews_data: List[Dict]) -> List[Dict]:
-        """Format parsed reviews into final structure.
-
-        Args:
-            reviews_data: List of parsed reviews
-
-        Returns:
-            List of formatted review dictionaries
-        """
-        formatted_reviews = []
-
-        for review in reviews_data:
-            formatted_review = {
-                "reviewId": review.get("reviewId"),
-                "userName": review.get("userName"),
-                "userImage": review.get("userImage"),
-                "score": review.get("score"),
-                "content": review.get("content"),
-                "thumbsUpCount": review.get("thumbsUpCount"),
-                "appVersion": review.get("appVersion"),
-                "at": review.get("at"),
-            }
-            formatted_reviews.append(formatted_review)
-
-        return formatted_reviews
-
 
 class DeveloperParser:
     """Parser for extracting and formatting developer apps."""
 
-    def parse_developer_data(self, dataset: Dict, dev_id: str) -> List[Dict]:
+    # Output field -> spec key, in output order
+    LAYOUT = card_layout(ElementSpecs.Developer)
+
+    def parse_developer_data(self, dataset: Dict, dev_id: str, fields: Optional[Iterable[str]] = None) -> List[Dict]:
         """Parse developer apps from dataset.
 
         Args:
             dataset: Raw dataset from scraper
             dev_id: Developer ID (numeric or string)
+            fields: Only extract these output fields, plus ``title`` (None
+                for all); unknown and unrequested fields are left out
 
         Returns:
             List of parsed app dictionaries
@@ -515,15 +526,11 @@ class DeveloperParser:
         if not ds3_data:
             raise DataParsingError(Config.ERROR_MESSAGES["NO_DS3_DATA"])
 
-        from ..utils.helpers import clean_json_string, alternative_json_clean
-
-        json_str_cleaned = clean_json_string(ds3_data)
         try:
-            data = json.loads(json_str_cleaned)
+            data = parse_js_literal(ds3_data)
         except json.JSONDecodeError as e:
             try:
-                alternative_cleaned = alternative_json_clean(ds3_data)
-                data = json.loads(alternative_cleaned)
+                data = {"data": parse_data_array(ds3_data)}
             except Exception:
                 raise DataParsingError(
                     Config.ERROR_MESSAGES["DS3_JSON_PARSE_FAILED"].format(error=str(e))
@@ -540,55 +547,30 @@ class DeveloperParser:
         if not apps_data:
             return []
 
+        extract = compile_specs(ElementSpecs.Developer, projected_fields(fields), self.LAYOUT)
         apps = []
         for app_data in apps_data:
-            app_details = {}
-            for key, spec in ElementSpecs.Developer.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = extract(app_data)
 
             if app_details.get("title"):
                 apps.append(app_details)
 
         return apps
 
-    def format_developer_data(self, apps_data: List[Dict]) -> List[Dict]:
-        """Format parsed developer apps into final structure.
-
-        Args:
-            apps_data: List of parsed apps
-
-        Returns:
-            List of formatted app dictionaries
-        """
-        formatted_apps = []
-
-        for app in apps_data:
-            formatted_app = {
-                "appId": app.get("appId"),
-                "title": app.get("title"),
-                "description": app.get("description"),
-                "icon": app.get("icon"),
-                "developer": app.get("developer"),
-                "score": app.get("score"),
-                "scoreText": app.get("scoreText"),
-                "currency": app.get("currency"),
-                "price": app.get("price"),
-                "free": app.get("free"),
-                "url": app.get("url"),
-            }
-            formatted_apps.append(formatted_app)
-
-        return formatted_apps
-
 
 class SimilarParser:
     """Parser for extracting and formatting similar apps."""
 
-    def parse_similar_data(self, dataset: Dict) -> List[Dict]:
+    # Output field -> spec key, in output order
+    LAYOUT = card_layout(ElementSpecs.Similar)
+
+    def parse_similar_data(self, dataset: Dict, fields: Optional[Iterable[str]] = None) -> List[Dict]:
         """Parse similar apps from dataset.
 
         Args:
             dataset: Raw dataset from scraper
+            fields: Only extract these output fields, plus ``title`` (None
+                for all); unknown and unrequested fields are left out
 
         Returns:
             List of parsed similar app dictionaries
@@ -597,15 +579,11 @@ class SimilarParser:
         if not ds3_data:
             return []
 
-        from ..utils.helpers import clean_json_string, alternative_json_clean
-
-        json_str_cleaned = clean_json_string(ds3_data)
         try:
-            data = json.loads(json_str_cleaned)
+            data = parse_js_literal(ds3_data)
         except json.JSONDecodeError:
             try:
-                alternative_cleaned = alternative_json_clean(ds3_data)
-                data = json.loads(alternative_cleaned)
+                data = {"data": parse_data_array(ds3_data)}
             except Exception:
                 return []
 
@@ -613,56 +591,31 @@ class SimilarParser:
         if not apps_data:
             return []
 
+        extract = compile_specs(ElementSpecs.Similar, projected_fields(fields), self.LAYOUT)
         apps = []
         for app_data in apps_data:
-            app_details = {}
-            for key, spec in ElementSpecs.Similar.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = extract(app_data)
 
             if app_details.get("title"):
                 apps.append(app_details)
 
         return apps
 
-    def format_similar_data(self, apps_data: List[Dict]) -> List[Dict]:
-        """Format parsed similar apps into final structure.
-
-        Args:
-            apps_data: List of parsed apps
-
-        Returns:
-            List of formatted app dictionaries
-        """
-        formatted_apps = []
-
-        for app in apps_data:
-            formatted_app = {
-                "appId": app.get("appId"),
-                "title": app.get("title"),
-                "description": app.get("description"),
-                "icon": app.get("icon"),
-                "developer": app.get("developer"),
-                "score": app.get("score"),
-                "scoreText": app.get("scoreText"),
-                "currency": app.get("currency"),
-                "price": app.get("price"),
-                "free": app.get("free"),
-                "url": app.get("url"),
-            }
-            formatted_apps.append(formatted_app)
-
-        return formatted_apps
-
 
 class ListParser:
     """Parser for extracting and formatting top chart apps."""
 
-    def parse_list_data(self, dataset: Dict, count: int) -> List[Dict]:
+    # Output field -> spec key, in output order
+    LAYOUT = card_layout(ElementSpecs.List)
+
+    def parse_list_data(self, dataset: Dict, count: int, fields: Optional[Iterable[str]] = None) -> List[Dict]:
         """Parse top chart apps from dataset.
 
         Args:
             dataset: Raw dataset from scraper
             count: Maximum number of apps to parse
+            fields: Only extract these output fields, plus ``title`` (None
+                for all); unknown and unrequested fields are left out
 
         Returns:
             List of parsed app dictionaries
@@ -675,49 +628,16 @@ class ListParser:
         if not apps_data:
             return []
 
+        extract = compile_specs(ElementSpecs.List, projected_fields(fields), self.LAYOUT)
         apps = []
         for app_data in apps_data[:count]:
-            app_details = {}
-            for key, spec in ElementSpecs.List.items():
-                app_details[key] = spec.extract_content(app_data)
+            app_details = extract(app_data)
 
             if app_details.get("title"):
                 apps.append(app_details)
 
         return apps
 
-    def format_list_data(self, apps_data: List[Dict]) -> List[Dict]:
-        """Format parsed list apps into final structure.
-
-        Args:
-            apps_data: List of parsed apps
-
-        Returns:
-            List of formatted app dictionaries
-        """
-        formatted_apps = []
-
-        for app in apps_data:
-            formatted_app = {
-                "appId": app.get("appId"),
-                "title": app.get("title"),
-                "description": app.get("description"),
-                "icon": app.get("icon"),
-                "screenshots": app.get("screenshots"),
-                "developer": app.get("developer"),
-                "genre": app.get("genre"),
-                "score": app.get("score"),
-                "scoreText": app.get("scoreText"),
-                "installs": app.get("installs"),
-                "currency": app.get("currency"),
-                "price": app.get("price"),
-                "free": app.get("free"),
-                "url": app.get("url"),
-            }
-            formatted_apps.append(formatted_app)
-
-        return formatted_apps
-
 
 class SuggestParser:
     """Parser for extracting and formatting search suggestions."""
@@ -732,14 +652,3 @@ class SuggestParser:
             List of suggestion strings
         """
         return dataset.get("suggestions", [])
-
-    def format_suggestions(self, suggestions: List[str]) -> List[str]:
-        """Format suggestions (pass-through for strings).
-
-        Args:
-            suggestions: List of suggestion strings
-
-        Returns:
-            Same list of suggestion strings
-        """
-        return suggestions
@@ -1,8 +1,10 @@
 import json
 import re
 import logging
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 from ..utils.http_client import HttpClient, ProxyConfig
+from ..utils.init_data import extract_init_data
+from ..utils import json_backend
 from ..config import Config
 from ..exceptions import DataParsingError, InvalidAppIdError
 
@@ -12,14 +14,15 @@ logger = logging.getLogger(__name__)
 class AppScraper:
     """Scraper for fetching app details from Google Play Store."""
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
         """Initialize AppScraper with an internal network session.
 
         Args:
             rate_limit_delay: Delay between requests
             proxies: Optional proxy configuration
+            http_client: Shared network session to use instead of a new one
         """
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
@@ -53,28 +56,40 @@ class AppScraper:
             Dictionary containing ds:5 dataset from fallback request
         """
         html_content = self.http_client.fetch_app_page_no_locale(app_id)
+        return self.parse_fallback_page(html_content)
 
-        ds_match = re.search(
-            r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:5["\'][\s\S]*?})\s*\)\s*;',
-            html_content,
-            re.DOTALL,
-        )
-        if ds_match:
-            ds5_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(
-                r"AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;",
-                html_content,
-                re.DOTALL,
-            )
-            ds5_data = ""
-            for callback in all_callbacks:
-                if "'ds:5'" in callback or '"ds:5"' in callback:
-                    ds5_data = callback
-                    break
+    @staticmethod
+    def parse_fallback_page(html_content: str) -> Optional[Dict]:
+        """Extract ds:5 dataset from a fallback app page.
+
+        Args:
+            html_content: HTML content of app page
 
+        Returns:
+            Dictionary containing ds:5 dataset, or None if not found
+        """
+        ds5_data = extract_init_data(html_content, "ds:5")
         return {"ds:5": ds5_data} if ds5_data else None
 
+    @staticmethod
+    def parse_app_page(html_content: str) -> Dict:
+        """Extract ds:5 dataset from app page HTML.
+
+        Args:
+            html_content: HTML content of app page
+
+        Returns:
+            Dictionary containing ds:5 dataset
+
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        ds5_data = extract_init_data(html_content, "ds:5")
+        if not ds5_data:
+            raise DataParsingError(Config.ERROR_MESSAGES["DS5_NOT_FOUND"])
+
+        return {"ds:5": ds5_data, "fallback_needed": False}
+
     def scrape_play_store_data(
         self,
         app_id: str,
@@ -95,38 +110,15 @@ class AppScraper:
             DataParsingError: If dataset not found
         """
         html_content = self.fetch_playstore_page(app_id, lang, country)
-
-        ds_match = re.search(
-            r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:5["\'][\s\S]*?})\s*\)\s*;',
-            html_content,
-            re.DOTALL,
-        )
-        if ds_match:
-            ds5_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(
-                r"AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;",
-                html_content,
-                re.DOTALL,
-            )
-            ds5_data = ""
-            for callback in all_callbacks:
-                if "'ds:5'" in callback or '"ds:5"' in callback:
-                    ds5_data = callback
-                    break
-
-        if not ds5_data:
-            raise DataParsingError(Config.ERROR_MESSAGES["DS5_NOT_FOUND"])
-
-        return {"ds:5": ds5_data, "fallback_needed": False}
+        return self.parse_app_page(html_content)
 
 
 class SearchScraper:
     """Scraper for fetching search results from Google Play Store."""
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize SearchScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize SearchScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
@@ -214,28 +206,55 @@ class SearchScraper:
                 response_text = self.http_client.fetch_search_page(
                     token=token, needed=needed, lang=lang, country=country
                 )
-                data = json.loads(response_text[5:])
-                parsed_data = json.loads(data[0][2])
-
-                if parsed_data:
-                    paginated_results = self._get_nested_value(
-                        parsed_data, [0, 0, 0], []
-                    )
-                    all_results.extend(paginated_results)
-                    # Update token for next iteration
-                    token = self._get_nested_value(parsed_data, [0, 0, 7, 1])
-                else:
+                page = self.parse_pagination_response(response_text)
+                if page is None:
                     break
+                paginated_results, token = page
+                all_results.extend(paginated_results)
             except (json.JSONDecodeError, IndexError, KeyError, Exception):
                 break
 
-        # Update dataset with all results
+        return self.merge_results(dataset, all_results, count)
+
+    @classmethod
+    def parse_pagination_response(cls, response_text: str) -> Optional[Tuple[List, Optional[str]]]:
+        """Parse a paginated search response.
+
+        Args:
+            response_text: Raw batchexecute response
+
+        Returns:
+            Tuple of (results, next token), or None if the page is empty
+        """
+        data = json_backend.loads(response_text[5:])
+        parsed_data = json_backend.loads(data[0][2])
+
+        if not parsed_data:
+            return None
+        results = cls._get_nested_value(parsed_data, [0, 0, 0], [])
+        # Token for next iteration
+        token = cls._get_nested_value(parsed_data, [0, 0, 7, 1])
+        return results, token
+
+    @staticmethod
+    def merge_results(dataset: Dict, all_results: List, count: int) -> Dict:
+        """Store collected results back into the ds:1 dataset.
+
+        Args:
+            dataset: Search dataset from the initial page
+            all_results: Results from the initial and paginated requests
+            count: Maximum number of results to keep
+
+        Returns:
+            Updated dataset
+        """
         if "ds:1" in dataset:
             dataset["ds:1"][0][1][0][0][0] = all_results[:count]
 
         return dataset
 
-    def _get_nested_value(self, data, path, default=None):
+    @staticmethod
+    def _get_nested_value(data, path, default=None):
         """Safely get nested value from data structure.
 
         Args:
@@ -264,14 +283,30 @@ class ReviewsScraper:
         "RATING": 3,  # Sorted by rating
     }
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize ReviewsScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize ReviewsScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
         self.http_client.set_proxies(proxies)
 
+    @classmethod
+    def sort_value(cls, sort) -> int:
+        """Convert a sort name (NEWEST, RELEVANT, RATING) to its API value."""
+        return cls.SORT_NAMES.get(sort, sort) if isinstance(sort, str) else sort
+
+    @staticmethod
+    def batch_size_value(batch_size: int) -> int:
+        """Validate a reviews batch size, capping it at Config.MAX_REVIEWS_BATCH_SIZE.
+
+        Raises:
+            ValueError: If batch_size is not a positive integer
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        return min(batch_size, Config.MAX_REVIEWS_BATCH_SIZE)
+
     def fetch_reviews_batch(
         self,
         app_id: str,
@@ -294,20 +329,69 @@ class ReviewsScraper:
         Returns:
             Raw API response content
         """
-        sort_value = self.SORT_NAMES.get(sort, sort) if isinstance(sort, str) else sort
         return self.http_client.fetch_reviews_batch(
-            app_id, lang, country, sort_value, batch_count, token
+            app_id, lang, country, self.sort_value(sort), batch_count, token
         )
 
-    def scrape_reviews_data(
+    @staticmethod
+    def decode_reviews_batch(response: str) -> Tuple[List, Optional[str]]:
+        """Decode a reviews batch response once into raw reviews and token.
+
+        Args:
+            response: Raw API response content
+
+        Returns:
+            Tuple of (list of raw review arrays, token for the next batch).
+            Both are empty/None if the response is malformed, and the token
+            is None if the batch was empty or last.
+        """
+        start = response.find(")]}'") if isinstance(response, str) else -1
+        if start == -1:
+            return [], None
+        try:
+            data = json_backend.loads(response[start + 4:])
+            parsed_data = json_backend.loads(data[0][2])
+        except (json.JSONDecodeError, IndexError, KeyError, TypeError):
+            return [], None
+
+        # Check if we got any reviews in this batch
+        if not isinstance(parsed_data, list) or not parsed_data or not isinstance(parsed_data[0], list):
+            return [], None
+        reviews = parsed_data[0]
+        if not reviews:
+            return [], None
+
+        # Extract next token safely
+        token = None
+        try:
+            if len(parsed_data) >= 2 and parsed_data[-2]:
+                token = parsed_data[-2][-1]
+        except (IndexError, TypeError, KeyError):
+            pass
+        return reviews, token if isinstance(token, str) and token else None
+
+    @classmethod
+    def extract_next_token(cls, response: str) -> Optional[str]:
+        """Extract the continuation token from a reviews batch response.
+
+        Args:
+            response: Raw API response content
+
+        Returns:
+            Token for the next batch, or None if the batch was empty or last
+        """
+        return cls.decode_reviews_batch(response)[1]
+
+    def iter_reviews_batches(
         self,
         app_id: str,
         count: int = Config.DEFAULT_REVIEWS_COUNT,
         lang: str = Config.DEFAULT_LANGUAGE,
         country: str = Config.DEFAULT_COUNTRY,
         sort: int = Config.DEFAULT_REVIEWS_SORT,
-    ) -> Dict:
-        """Scrape multiple batches of reviews.
+        batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+    ) -> Iterator[Tuple[List, Optional[str]]]:
+        """Fetch batches of reviews, decoding each response once.
 
         Args:
             app_id: Google Play app ID
@@ -315,17 +399,20 @@ class ReviewsScraper:
             lang: Language code
             country: Country code
             sort: Sort order
+            batch_size: Reviews requested per batch (capped at
+                Config.MAX_REVIEWS_BATCH_SIZE)
 
-        Returns:
-            Dictionary containing all review responses
+        Yields:
+            Tuple of (raw review arrays, token for the next batch or None).
+            Batches may hold fewer reviews than requested; paging goes on
+            until ``count`` reviews arrived or no token is returned.
         """
-        all_responses = []
         token = None
-        batch_size = Config.DEFAULT_REVIEWS_BATCH_SIZE
+        batch_size = self.batch_size_value(batch_size)
+        fetched = 0
 
-        while len(all_responses) * batch_size < count:
-            remaining = count - (len(all_responses) * batch_size)
-            fetch_count = min(batch_size, remaining)
+        while fetched < count:
+            fetch_count = min(batch_size, count - fetched)
 
             response = self.fetch_reviews_batch(
                 app_id, lang, country, sort, fetch_count, token
@@ -334,56 +421,49 @@ class ReviewsScraper:
             if not response:
                 break
 
-            all_responses.append(response)
-
-            try:
-                regex = re.compile(r"\)]}'\n\n([\s\S]+)")
-                matches = regex.findall(response)
-                if matches:
-                    data = json.loads(matches[0])
-                    parsed_data = json.loads(data[0][2])
-
-                    # Check if we got any reviews in this batch
-                    if (
-                        not parsed_data
-                        or len(parsed_data) == 0
-                        or (len(parsed_data) > 0 and len(parsed_data[0]) == 0)
-                    ):
-                        break
-
-                    # Extract next token safely
-                    try:
-                        if (
-                            len(parsed_data) >= 2
-                            and parsed_data[-2]
-                            and len(parsed_data[-2]) > 0
-                        ):
-                            token = parsed_data[-2][-1]
-                        else:
-                            token = None
-                    except (IndexError, TypeError, AttributeError):
-                        token = None
-
-                    if (
-                        not token
-                        or isinstance(token, list)
-                        or not isinstance(token, str)
-                    ):
-                        break
-                else:
-                    break
-            except (json.JSONDecodeError, IndexError, KeyError, TypeError):
+            reviews, token = self.decode_reviews_batch(response)
+            fetched += len(reviews)
+            yield reviews, token
+            if not token:
                 break
 
-        return {"reviews": all_responses if all_responses else []}
+    def scrape_reviews_data(
+        self,
+        app_id: str,
+        count: int = Config.DEFAULT_REVIEWS_COUNT,
+        lang: str = Config.DEFAULT_LANGUAGE,
+        country: str = Config.DEFAULT_COUNTRY,
+        sort: int = Config.DEFAULT_REVIEWS_SORT,
+        batch_size: int = Config.DEFAULT_REVIEWS_BATCH_SIZE,
+    ) -> Dict:
+        """Scrape multiple batches of reviews.
+
+        Args:
+            app_id: Google Play app ID
+            count: Total number of reviews to fetch
+            lang: Language code
+            country: Country code
+            sort: Sort order
+            batch_size: Reviews requested per batch
+
+        Returns:
+            Dictionary with the raw review arrays of all batches under
+            ``reviews`` and the last continuation token under ``token``
+        """
+        all_reviews = []
+        token = None
+        for reviews, token in self.iter_reviews_batches(app_id, count, lang, country, sort, batch_size):
+            all_reviews.extend(reviews)
+
+        return {"reviews": all_reviews, "token": token}
 
 
 class DeveloperScraper:
     """Scraper for fetching developer portfolio from Google Play Store."""
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize DeveloperScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize DeveloperScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
@@ -407,6 +487,26 @@ class DeveloperScraper:
         """
         return self.http_client.fetch_developer_page(dev_id, lang, country)
 
+    @staticmethod
+    def parse_developer_page(html_content: str, dev_id: str) -> Dict:
+        """Extract ds:3 dataset from developer page HTML.
+
+        Args:
+            html_content: HTML content of developer page
+            dev_id: Developer ID
+
+        Returns:
+            Dictionary containing ds:3 dataset and dev_id
+
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        ds3_data = extract_init_data(html_content, "ds:3")
+        if not ds3_data:
+            raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
+
+        return {"ds:3": ds3_data, "dev_id": dev_id}
+
     def scrape_play_store_data(
         self,
         dev_id: str,
@@ -427,38 +527,15 @@ class DeveloperScraper:
             DataParsingError: If dataset not found
         """
         html_content = self.fetch_developer_page(dev_id, lang, country)
-
-        ds_match = re.search(
-            r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:3["\'][\s\S]*?})\s*\)\s*;',
-            html_content,
-            re.DOTALL,
-        )
-        if ds_match:
-            ds3_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(
-                r"AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;",
-                html_content,
-                re.DOTALL,
-            )
-            ds3_data = ""
-            for callback in all_callbacks:
-                if "'ds:3'" in callback or '"ds:3"' in callback:
-                    ds3_data = callback
-                    break
-
-        if not ds3_data:
-            raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
-
-        return {"ds:3": ds3_data, "dev_id": dev_id}
+        return self.parse_developer_page(html_content, dev_id)
 
 
 class SimilarScraper:
     """Scraper for fetching similar apps from Google Play Store."""
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize SimilarScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize SimilarScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
@@ -482,6 +559,46 @@ class SimilarScraper:
         """
         return self.http_client.fetch_app_page(app_id, lang, country)
 
+    @staticmethod
+    def extract_cluster_url(html_content: str) -> Optional[str]:
+        """Extract the similar apps cluster URL from app page HTML.
+
+        Args:
+            html_content: HTML content of app page
+
+        Returns:
+            Cluster URL path, or None if the page has no similar apps
+        """
+        pattern1 = r"&quot;(/store/apps/collection/cluster\?gsr=[^&]+)&quot;"
+        matches1 = re.findall(pattern1, html_content)
+        pattern2 = r'"(/store/apps/collection/cluster\?gsr=[^"]+)"'
+        matches2 = re.findall(pattern2, html_content)
+        all_matches = list(set(matches1 + matches2))
+
+        if not all_matches:
+            return None
+
+        return all_matches[0].replace("&amp;", "&")
+
+    @staticmethod
+    def parse_cluster_page(cluster_html: str) -> Dict:
+        """Extract ds:3 dataset from cluster page HTML.
+
+        Args:
+            cluster_html: HTML content of cluster page
+
+        Returns:
+            Dictionary containing ds:3 dataset
+
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        ds3_data = extract_init_data(cluster_html, "ds:3")
+        if not ds3_data:
+            raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
+
+        return {"ds:3": ds3_data}
+
     def scrape_play_store_data(
         self,
         app_id: str,
@@ -502,43 +619,33 @@ class SimilarScraper:
             DataParsingError: If dataset not found
         """
         html_content = self.fetch_similar_page(app_id, lang, country)
+        return self.scrape_cluster_data(html_content, lang, country)
 
-        # Extract cluster URL from app page
-        pattern1 = r"&quot;(/store/apps/collection/cluster\?gsr=[^&]+)&quot;"
-        matches1 = re.findall(pattern1, html_content)
-        pattern2 = r'"(/store/apps/collection/cluster\?gsr=[^"]+)"'
-        matches2 = re.findall(pattern2, html_content)
-        all_matches = list(set(matches1 + matches2))
-
-        if not all_matches:
-            return {"ds:3": None}
+    def scrape_cluster_data(
+        self,
+        html_content: str,
+        lang: str = Config.DEFAULT_LANGUAGE,
+        country: str = Config.DEFAULT_COUNTRY,
+    ) -> Dict:
+        """Fetch the similar apps cluster linked from an already fetched app page.
 
-        cluster_url = all_matches[0].replace("&amp;", "&")
-        cluster_html = self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        Args:
+            html_content: HTML content of app page
+            lang: Language code
+            country: Country code
 
-        ds_match = re.search(
-            r'AF_initDataCallback\s*\(\s*({\s*key:\s*["\']ds:3["\'][\s\S]*?})\s*\)\s*;',
-            cluster_html,
-            re.DOTALL,
-        )
-        if ds_match:
-            ds3_data = ds_match.group(1)
-        else:
-            all_callbacks = re.findall(
-                r"AF_initDataCallback\s*\(\s*({[\s\S]*?})\s*\)\s*;",
-                cluster_html,
-                re.DOTALL,
-            )
-            ds3_data = ""
-            for callback in all_callbacks:
-                if "'ds:3'" in callback or '"ds:3"' in callback:
-                    ds3_data = callback
-                    break
+        Returns:
+            Dictionary containing ds:3 dataset (None if the page has no similar apps)
 
-        if not ds3_data:
-            raise DataParsingError(Config.ERROR_MESSAGES["DS3_NOT_FOUND"])
+        Raises:
+            DataParsingError: If dataset not found
+        """
+        cluster_url = self.extract_cluster_url(html_content)
+        if not cluster_url:
+            return {"ds:3": None}
 
-        return {"ds:3": ds3_data}
+        cluster_html = self.http_client.fetch_cluster_page(cluster_url, lang, country)
+        return self.parse_cluster_page(cluster_html)
 
 
 class ListScraper:
@@ -551,14 +658,37 @@ class ListScraper:
         "TOP_GROSSING": "topgrossing",  # Top grossing apps
     }
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize ListScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize ListScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
         self.http_client.set_proxies(proxies)
 
+    @staticmethod
+    def parse_list_response(response_text: str) -> Dict:
+        """Decode a top charts batchexecute response.
+
+        Args:
+            response_text: Raw API response text
+
+        Returns:
+            Dictionary containing collection data
+
+        Raises:
+            DataParsingError: If JSON parsing fails
+        """
+        try:
+            lines = response_text.strip().split("\n")
+            data = json_backend.loads(lines[2])
+            collection_data = json_backend.loads(data[0][2])
+            return {"collection_data": collection_data}
+        except (json.JSONDecodeError, IndexError, KeyError) as e:
+            raise DataParsingError(
+                Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e))
+            )
+
     def scrape_play_store_data(
         self,
         collection: str,
@@ -586,29 +716,47 @@ class ListScraper:
         response_text = self.http_client.fetch_list_page(
             cluster, category, count, lang, country
         )
-
-        try:
-            lines = response_text.strip().split("\n")
-            data = json.loads(lines[2])
-            collection_data = json.loads(data[0][2])
-            return {"collection_data": collection_data}
-        except (json.JSONDecodeError, IndexError, KeyError) as e:
-            raise DataParsingError(
-                Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e))
-            )
+        return self.parse_list_response(response_text)
 
 
 class SuggestScraper:
     """Scraper for fetching search suggestions from Google Play Store."""
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize SuggestScraper with an internal network session."""
-        self.http_client = HttpClient(rate_limit_delay, proxies)
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, http_client: HttpClient = None):
+        """Initialize SuggestScraper with an internal or shared network session."""
+        self.http_client = http_client or HttpClient(rate_limit_delay, proxies)
 
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update proxy configuration for subsequent requests."""
         self.http_client.set_proxies(proxies)
 
+    @staticmethod
+    def parse_suggest_response(response_text: str) -> Dict:
+        """Decode a suggestions batchexecute response.
+
+        Args:
+            response_text: Raw API response text
+
+        Returns:
+            Dictionary containing list of suggestions
+
+        Raises:
+            DataParsingError: If JSON parsing fails
+        """
+        try:
+            input_data = json_backend.loads(response_text[5:])
+            data = json_backend.loads(input_data[0][2])
+
+            if data is None:
+                return {"suggestions": []}
+
+            suggestions = [s[0] for s in data[0][0]]
+            return {"suggestions": suggestions}
+        except (json.JSONDecodeError, IndexError, KeyError, TypeError) as e:
+            raise DataParsingError(
+                Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e))
+            )
+
     def scrape_suggestions(
         self,
         term: str,
@@ -632,17 +780,4 @@ class SuggestScraper:
             return {"suggestions": []}
 
         response_text = self.http_client.fetch_suggest_page(term, lang, country)
-
-        try:
-            input_data = json.loads(response_text[5:])
-            data = json.loads(input_data[0][2])
-
-            if data is None:
-                return {"suggestions": []}
-
-            suggestions = [s[0] for s in data[0][0]]
-            return {"suggestions": suggestions}
-        except (json.JSONDecodeError, IndexError, KeyError, TypeError) as e:
-            raise DataParsingError(
-                Config.ERROR_MESSAGES["JSON_PARSE_FAILED"].format(error=str(e))
-            )
+        return self.parse_suggest_response(response_text)
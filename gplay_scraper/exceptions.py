@@ -20,8 +20,15 @@ class AppNotFoundError(GPlayScraperError):
 
 
 class RateLimitError(GPlayScraperError):
-    """Raised when rate limiting is triggered by Google Play Store."""
-    pass
+    """Raised when rate limiting is triggered by Google Play Store.
+    
+    Attributes:
+        retry_after: Seconds the server asked to wait, if it said so
+    """
+    
+    def __init__(self, message: str = "", retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class NetworkError(GPlayScraperError):
@@ -2,10 +2,13 @@
 
 This module defines ElementSpec class and ElementSpecs for all 7 method types.
 Each spec defines how to extract specific fields from raw JSON data.
+compile_specs() turns a whole spec table into one generated extractor function.
 """
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import html
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from ..utils.helpers import unescape_text
 from ..config import Config
@@ -261,4 +264,153 @@ class ElementSpecs:
         "scoreText": ElementSpec("raw", [0, 4, 0]),
         "score": ElementSpec("raw", [0, 4, 1]),
         "url": ElementSpec("raw", [0, 10, 4, 2], lambda path: f"https://play.google.com{path}" if path else None),
-    }
\ No newline at end of file
+    }
+
+_LOOKUP_ERRORS = (IndexError, KeyError, TypeError)
+# Least recently used first; field projections are caller-chosen, so the cache is bounded
+_COMPILED: "OrderedDict[Tuple, Tuple[Tuple, Callable]]" = OrderedDict()
+_COMPILED_MAX_SIZE = 256
+_COMPILED_LOCK = threading.Lock()
+
+
+class _SpecCompiler:
+    """Generate the source of one extractor function for a spec table.
+
+    Every distinct path is looked up once; paths sharing a prefix reuse the
+    prefix's value, and runs without branches are indexed in a single
+    expression. Each field then applies its post-processor and fallback
+    exactly as :meth:`ElementSpec.extract_content` would.
+    """
+
+    def __init__(self, specs: Dict[str, ElementSpec], layout: Dict[str, Optional[str]]):
+        self.specs = specs
+        self.layout = layout
+        self.namespace: Dict[str, Any] = {"_LOOKUP_ERRORS": _LOOKUP_ERRORS}
+        self.lines: List[str] = []
+        self.path_vars: Dict[Tuple, str] = {(): "source"}
+
+    def bind(self, prefix: str, obj: Any) -> str:
+        """Expose ``obj`` to the generated code under a fresh name."""
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+    def build(self, name: str) -> Callable:
+        used = {key: self.specs[key] for key in self.layout.values() if key in self.specs}
+        trie: Dict = {}
+        for spec in used.values():
+            while isinstance(spec, ElementSpec):
+                node = trie
+                for key in spec.data_map:
+                    node = node.setdefault(key, {})
+                node[None] = True  # a path ends here
+                spec = spec.fallback_value
+
+        self.lines.append(f"def {name}(source, assets=None):")
+        self.emit_lookups(trie, "source", ())
+        values = {}
+        for index, (key, spec) in enumerate(used.items()):
+            if spec.post_processor is None and spec.fallback_value is None:
+                values[key] = self.path_vars[tuple(spec.data_map)]
+                continue
+            self.emit_spec(spec, "    ")
+            self.lines.append(f"    f{index} = value")
+            values[key] = f"f{index}"
+        fields = [f"{field!r}: {values.get(key, 'None')}" for field, key in self.layout.items()]
+        self.lines.append("    return {" + ", ".join(fields) + "}")
+
+        source = "\n".join(self.lines) + "\n"
+        exec(compile(source, f"<compiled {name}>", "exec"), self.namespace)
+        function = self.namespace[name]
+        function.source = source
+        return function
+
+    def emit_lookups(self, node: Dict, var: str, path: Tuple) -> None:
+        for key, child in node.items():
+            if key is None:
+                continue
+            keys = [key]
+            # Follow the branch while it neither forks nor ends a path
+            while None not in child and len(child) == 1:
+                next_key, child = next(iter(child.items()))
+                keys.append(next_key)
+            child_path = path + tuple(keys)
+            child_var = f"v{len(self.path_vars)}"
+            self.path_vars[child_path] = child_var
+            index = "".join(f"[{k!r}]" for k in keys)
+            self.lines += [
+                "    try:",
+                f"        {child_var} = {var}{index}",
+                "    except _LOOKUP_ERRORS:",
+                f"        {child_var} = None",
+            ]
+            self.emit_lookups(child, child_var, child_path)
+
+    def emit_spec(self, spec: ElementSpec, indent: str) -> None:
+        self.lines.append(f"{indent}value = {self.path_vars[tuple(spec.data_map)]}")
+        processor = spec.post_processor
+        if processor is not None:
+            call = f"{self.bind('pp', processor)}(value"
+            # Same rule as extract_content: image formatters receive the asset size
+            if "image" in getattr(processor, "__name__", ""):
+                call += f", assets or {self.bind('assets', spec.assets)}"
+            call += ")"
+            self.lines += [
+                f"{indent}try:",
+                f"{indent}    value = {call}",
+                f"{indent}except Exception:",
+                f"{indent}    pass",
+            ]
+        fallback = spec.fallback_value
+        if fallback is not None:
+            self.lines.append(f"{indent}if value is None:")
+            if isinstance(fallback, ElementSpec):
+                self.emit_spec(fallback, indent + "    ")
+            else:
+                self.lines.append(f"{indent}    value = {self.bind('fallback', fallback)}")
+
+
+def compile_specs(
+    specs: Dict[str, ElementSpec],
+    fields: Optional[Iterable[str]] = None,
+    layout: Optional[Dict[str, Optional[str]]] = None,
+) -> Callable[..., Dict[str, Any]]:
+    """Compile a spec table into one extractor function.
+
+    The function takes ``(source, assets=None)`` and returns the same dict
+    as calling ``extract_content`` for every spec in table order, but it
+    resolves shared path prefixes once and runs no per-field Python loop.
+    With a ``layout`` it returns the final record instead: output keys in
+    layout order, each holding the value of its spec. The most recently used
+    extractors are cached until their table changes.
+
+    Args:
+        specs: Spec table such as ``ElementSpecs.App``
+        fields: Only return these output keys (None returns all)
+        layout: Output key -> spec key; keys mapped to None or to no spec
+            are returned as None for the caller to fill (default: every
+            spec under its own key, in table order)
+
+    Returns:
+        Extractor function; its generated code is available as ``.source``
+    """
+    snapshot = tuple(specs.items())
+    if layout is None:
+        layout = {key: key for key in specs}
+    if fields is not None:
+        fields = set(fields)
+        layout = {field: key for field, key in layout.items() if field in fields}
+    cache_key = (id(specs), tuple(layout.items()))
+    with _COMPILED_LOCK:
+        cached = _COMPILED.get(cache_key)
+        if cached is not None and cached[0] == snapshot:
+            _COMPILED.move_to_end(cache_key)
+            return cached[1]
+    name = next((attr for attr, value in vars(ElementSpecs).items() if value is specs), "table")
+    extractor = _SpecCompiler(specs, layout).build(f"extract_{name.lower()}")
+    with _COMPILED_LOCK:
+        _COMPILED[cache_key] = (snapshot, extractor)
+        _COMPILED.move_to_end(cache_key)
+        while len(_COMPILED) > _COMPILED_MAX_SIZE:
+            _COMPILED.popitem(last=False)
+    return extractor
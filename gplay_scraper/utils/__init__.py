@@ -3,5 +3,5 @@ from .helpers import *
 __all__ = [
     'nested_lookup', 'unescape_text', 'extract_categories', 'get_categories',
     'parse_release_date', 'calculate_app_age', 'parse_installs_string',
-    'calculate_daily_installs', 'calculate_monthly_installs', 'clean_json_string'
+    'calculate_daily_installs', 'calculate_monthly_installs'
 ]
\ No newline at end of file
@@ -0,0 +1,403 @@
+"""Response caches for request plans.
+
+The HTTP clients look up every request plan in an optional cache before
+going to the network and store successful response bodies afterwards.
+Entries are keyed on the canonical request (method, URLs and body) and expire
+after a per-endpoint TTL (``Config.CACHE_TTLS``). Expired entries that carry
+an ETag or Last-Modified validator are revalidated with a conditional request;
+a ``304 Not Modified`` answer renews them without downloading the body again.
+
+:class:`BaseCache` holds the TTL policy and hit/miss statistics; storage
+backends implement ``_load``, ``_store``, ``_delete`` and ``clear``.
+:class:`ResponseCache` keeps entries in memory, :class:`SQLiteCache` in a
+single database file that survives restarts and can be shared by processes.
+"""
+
+import time
+import zlib
+import itertools
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+from ..config import Config
+
+
+class CacheEntry:
+    """One cached response body.
+
+    Attributes:
+        value: Response text
+        endpoint: Endpoint the response belongs to
+        stored_at: Wall clock time the entry was written
+        expires_at: Wall clock time after which the entry is stale
+        etag: ETag response header, if the server sent one
+        last_modified: Last-Modified response header, if the server sent one
+    """
+
+    __slots__ = ("value", "endpoint", "stored_at", "expires_at", "etag", "last_modified")
+
+    def __init__(self, value: str, endpoint: str, stored_at: float, expires_at: float,
+                 etag: str = None, last_modified: str = None):
+        """Initialize CacheEntry."""
+        self.value = value
+        self.endpoint = endpoint
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now: float = None) -> bool:
+        """Check whether the entry has not expired yet."""
+        return (now or time.time()) < self.expires_at
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the server to answer 304 if unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class BaseCache:
+    """TTL policy and statistics shared by all cache backends.
+
+    Args:
+        ttls: Seconds to keep responses per endpoint; merged over ``Config.CACHE_TTLS``
+        default_ttl: Seconds for endpoints without an entry in ``ttls``
+    """
+
+    def __init__(self, ttls: Dict[str, float] = None, default_ttl: float = Config.CACHE_DEFAULT_TTL):
+        """Initialize the cache policy and counters."""
+        self.ttls = {**Config.CACHE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "revalidations": 0, "bytes_saved": 0}
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Seconds a response from ``endpoint`` stays fresh (0 disables caching)."""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Increment a statistics counter."""
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Find the entry for ``key``, fresh or stale, and count the lookup.
+
+        A stale entry is still returned so the caller can revalidate it; it
+        counts as a miss until :meth:`revalidated` turns it into a hit.
+
+        Args:
+            key: Canonical request key
+
+        Returns:
+            Cache entry, or None if nothing is stored
+        """
+        entry = self._load(key)
+        self._count("hits" if entry is not None and entry.is_fresh() else "misses")
+        return entry
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` if present and fresh.
+
+        Args:
+            key: Canonical request key
+
+        Returns:
+            Response text, or None on a miss
+        """
+        entry = self.lookup(key)
+        return entry.value if entry is not None and entry.is_fresh() else None
+
+    def set(self, key: str, value: str, endpoint: str, etag: str = None, last_modified: str = None) -> None:
+        """Store a response using the TTL of its endpoint.
+
+        Args:
+            key: Canonical request key
+            value: Response text
+            endpoint: Endpoint name used to pick the TTL
+            etag: ETag response header, kept for revalidation
+            last_modified: Last-Modified response header, kept for revalidation
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        now = time.time()
+        self._store(key, CacheEntry(value, endpoint, now, now + ttl, etag, last_modified))
+        self._count("stores")
+
+    def revalidated(self, key: str, entry: CacheEntry) -> None:
+        """Renew a stale entry after the server answered 304 Not Modified.
+
+        The earlier miss becomes a hit, and the body size counts as bytes saved.
+
+        Args:
+            key: Canonical request key
+            entry: Stale entry that was revalidated
+        """
+        now = time.time()
+        self._store(key, CacheEntry(entry.value, entry.endpoint, now, now + self.ttl_for(entry.endpoint),
+                                    entry.etag, entry.last_modified))
+        with self._stats_lock:
+            self._stats["misses"] -= 1
+            self._stats["hits"] += 1
+            self._stats["revalidations"] += 1
+            self._stats["bytes_saved"] += len(entry.value.encode("utf-8"))
+
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+        self._delete(key)
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss statistics.
+
+        Returns:
+            Dictionary with hits, misses, stores, evictions, revalidations
+            (304 responses), bytes_saved, entries and hit ratio
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = len(self)
+        return stats
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class ResponseCache(BaseCache):
+    """In-memory LRU response cache.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+        ttls: Seconds to keep responses per endpoint
+        default_ttl: Seconds for endpoints without an entry in ``ttls``
+    """
+
+    def __init__(self, max_entries: int = Config.CACHE_MAX_ENTRIES, ttls: Dict[str, float] = None,
+                 default_ttl: float = Config.CACHE_DEFAULT_TTL):
+        """Initialize an empty ResponseCache."""
+        super().__init__(ttls, default_ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.has_validators and not entry.is_fresh():
+                # Nothing to revalidate it with, so it would only hold memory
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(BaseCache):
+    """Single-file SQLite response cache shared across threads and processes.
+
+    The database runs in WAL mode so several worker processes can read and
+    write it at once. Bodies are stored zlib-compressed. Every
+    ``prune_interval`` writes (and on :meth:`prune` / :meth:`vacuum`) expired
+    entries are deleted (those with validators after ``stale_grace``) and,
+    when ``max_bytes`` is set, the entries closest to expiry are evicted
+    until the stored bodies fit.
+
+    Args:
+        path: Database file path
+        ttls: Seconds to keep responses per endpoint
+        default_ttl: Seconds for endpoints without an entry in ``ttls``
+        max_bytes: Upper bound for compressed bodies, or None for no cap
+        compress_level: zlib compression level (1-9)
+        prune_interval: Writes between automatic prune passes
+        stale_grace: Seconds expired entries with validators are kept for
+            revalidation
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            endpoint TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT
+        )
+    """
+
+    def __init__(self, path: str = Config.SQLITE_CACHE_PATH, ttls: Dict[str, float] = None,
+                 default_ttl: float = Config.CACHE_DEFAULT_TTL, max_bytes: int = Config.SQLITE_CACHE_MAX_BYTES,
+                 compress_level: int = 6, prune_interval: int = 500, stale_grace: float = Config.CACHE_STALE_GRACE):
+        """Open (or create) the cache database."""
+        super().__init__(ttls, default_ttl)
+        self.stale_grace = stale_grace
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.prune_interval = prune_interval
+        self._local = threading.local()
+        self._writes = itertools.count(1)  # next() is atomic, so threads never share a count
+        with self._connect() as conn:
+            conn.execute(self._SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:  # databases created before validators were stored
+                    conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        row = self._connect().execute(
+            "SELECT endpoint, stored_at, expires_at, body, etag, last_modified FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        endpoint, stored_at, expires_at, body, etag, last_modified = row
+        return CacheEntry(zlib.decompress(body).decode("utf-8"), endpoint, stored_at, expires_at, etag, last_modified)
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        body = zlib.compress(entry.value.encode("utf-8"), self.compress_level)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, stored_at, expires_at, size, body, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.endpoint, entry.stored_at, entry.expires_at, len(body), body, entry.etag, entry.last_modified),
+            )
+        if next(self._writes) % self.prune_interval == 0:
+            self.prune()
+
+    def _delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def prune(self) -> int:
+        """Delete expired entries and enforce ``max_bytes``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._connect() as conn:
+            now = time.time()
+            # Expired entries with validators stay a while longer so they can be revalidated
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ? AND (etag IS NULL AND last_modified IS NULL OR expires_at <= ?)",
+                (now, now - self.stale_grace),
+            ).rowcount
+            if self.max_bytes:
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_bytes:
+                    # Evict the entries closest to expiry until the bodies fit
+                    rows = conn.execute("SELECT key, size FROM responses ORDER BY expires_at").fetchall()
+                    evict = []
+                    for key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        evict.append((key,))
+                        total -= size
+                    conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+                    self._count("evictions", len(evict))
+                    removed += len(evict)
+        return removed
+
+    def vacuum(self) -> None:
+        """Prune entries and compact the database file."""
+        self.prune()
+        conn = self._connect()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def size_bytes(self) -> int:
+        """Total size of the stored (compressed) bodies."""
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+CacheConfig = Optional[Union[BaseCache, bool]]
+
+
+def make_cache(cache: CacheConfig) -> Optional[BaseCache]:
+    """Resolve a ``cache=`` argument: True builds a default ResponseCache.
+
+    Args:
+        cache: Cache instance, True for an in-memory cache, or None/False
+
+    Returns:
+        Cache instance, or None when caching is disabled
+    """
+    if cache is True:
+        return ResponseCache()
+    return cache if isinstance(cache, BaseCache) else None
@@ -0,0 +1,234 @@
+"""Checkpoint stores for resumable review crawls.
+
+A review crawl walks an app's reviews page by page with continuation
+tokens. When a checkpoint store is passed to ``reviews_analyze`` or
+``reviews_iter``, the token reached so far is recorded after every fully
+consumed batch, keyed on app, sort order, language and country. A later
+crawl with the same key resumes from the recorded token instead of the
+first page, and the checkpoint is deleted once the last page was read.
+
+:class:`BaseCheckpointStore` defines the interface; storage backends
+implement ``_load``, ``_store``, ``_delete`` and ``clear``.
+:class:`FileCheckpointStore` keeps checkpoints in a JSON file,
+:class:`SQLiteCheckpointStore` in a database that can be shared by processes.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+from ..config import Config
+
+CheckpointKey = Tuple[str, int, str, str]
+
+
+class ReviewsCheckpoint:
+    """Progress of one review crawl.
+
+    Attributes:
+        app_id: Google Play app ID
+        sort: Sort order API value
+        lang: Language code
+        country: Country code
+        token: Continuation token of the next batch to fetch
+        seen: Reviews yielded so far across resumed runs
+        updated_at: Wall clock time the checkpoint was written
+    """
+
+    __slots__ = ("app_id", "sort", "lang", "country", "token", "seen", "updated_at")
+
+    def __init__(self, app_id: str, sort: int, lang: str, country: str, token: Optional[str],
+                 seen: int = 0, updated_at: float = None):
+        """Initialize ReviewsCheckpoint."""
+        self.app_id = app_id
+        self.sort = sort
+        self.lang = lang
+        self.country = country
+        self.token = token
+        self.seen = seen
+        self.updated_at = updated_at if updated_at is not None else time.time()
+
+    @property
+    def key(self) -> CheckpointKey:
+        """Crawl identity: (app_id, sort, lang, country)."""
+        return (self.app_id, self.sort, self.lang, self.country)
+
+    def to_dict(self) -> Dict:
+        """Return the checkpoint as a JSON-serializable dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class BaseCheckpointStore:
+    """Interface shared by all checkpoint backends."""
+
+    def load(self, app_id: str, sort: int, lang: str, country: str) -> Optional[ReviewsCheckpoint]:
+        """Find the checkpoint of a crawl.
+
+        Args:
+            app_id: Google Play app ID
+            sort: Sort order API value
+            lang: Language code
+            country: Country code
+
+        Returns:
+            Checkpoint, or None if the crawl has none
+        """
+        return self._load((app_id, sort, lang, country))
+
+    def save(self, checkpoint: ReviewsCheckpoint) -> None:
+        """Record (or replace) the checkpoint of a crawl."""
+        checkpoint.updated_at = time.time()
+        self._store(checkpoint)
+
+    def delete(self, app_id: str, sort: int, lang: str, country: str) -> None:
+        """Remove the checkpoint of a crawl, e.g. once it has finished."""
+        self._delete((app_id, sort, lang, country))
+
+    def _load(self, key: CheckpointKey) -> Optional[ReviewsCheckpoint]:
+        raise NotImplementedError
+
+    def _store(self, checkpoint: ReviewsCheckpoint) -> None:
+        raise NotImplementedError
+
+    def _delete(self, key: CheckpointKey) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all checkpoints."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class FileCheckpointStore(BaseCheckpointStore):
+    """Checkpoints kept in one JSON file, rewritten atomically on every change.
+
+    Args:
+        path: JSON file path
+    """
+
+    def __init__(self, path: str = Config.CHECKPOINT_FILE_PATH):
+        """Open (or start) the checkpoint file."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._checkpoints: Dict[CheckpointKey, ReviewsCheckpoint] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                for entry in json.load(handle):
+                    checkpoint = ReviewsCheckpoint(**entry)
+                    self._checkpoints[checkpoint.key] = checkpoint
+
+    def _write(self) -> None:
+        """Replace the file with the current checkpoints."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump([checkpoint.to_dict() for checkpoint in self._checkpoints.values()], handle)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _load(self, key: CheckpointKey) -> Optional[ReviewsCheckpoint]:
+        with self._lock:
+            return self._checkpoints.get(key)
+
+    def _store(self, checkpoint: ReviewsCheckpoint) -> None:
+        with self._lock:
+            self._checkpoints[checkpoint.key] = checkpoint
+            self._write()
+
+    def _delete(self, key: CheckpointKey) -> None:
+        with self._lock:
+            if self._checkpoints.pop(key, None) is not None:
+                self._write()
+
+    def clear(self) -> None:
+        """Remove all checkpoints."""
+        with self._lock:
+            self._checkpoints.clear()
+            self._write()
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+
+class SQLiteCheckpointStore(BaseCheckpointStore):
+    """Checkpoints kept in a SQLite database shared across threads and processes.
+
+    Args:
+        path: Database file path
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS review_checkpoints (
+            app_id TEXT NOT NULL,
+            sort INTEGER NOT NULL,
+            lang TEXT NOT NULL,
+            country TEXT NOT NULL,
+            token TEXT,
+            seen INTEGER NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (app_id, sort, lang, country)
+        )
+    """
+
+    def __init__(self, path: str = Config.SQLITE_CHECKPOINT_PATH):
+        """Open (or create) the checkpoint database."""
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _load(self, key: CheckpointKey) -> Optional[ReviewsCheckpoint]:
+        row = self._connect().execute(
+            "SELECT token, seen, updated_at FROM review_checkpoints "
+            "WHERE app_id = ? AND sort = ? AND lang = ? AND country = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        return ReviewsCheckpoint(*key, *row)
+
+    def _store(self, checkpoint: ReviewsCheckpoint) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO review_checkpoints (app_id, sort, lang, country, token, seen, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*checkpoint.key, checkpoint.token, checkpoint.seen, checkpoint.updated_at),
+            )
+
+    def _delete(self, key: CheckpointKey) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM review_checkpoints WHERE app_id = ? AND sort = ? AND lang = ? AND country = ?", key
+            )
+
+    def clear(self) -> None:
+        """Remove all checkpoints."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM review_checkpoints")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM review_checkpoints").fetchone()[0]
@@ -2,7 +2,7 @@
 
 This module contains utility functions for:
 - Text unescaping and cleaning
-- JSON string cleaning
+- Data array extraction from callback literals
 - Date parsing and calculations
 - Install metrics calculations
 """
@@ -13,6 +13,9 @@ from html import unescape
 from typing import Any, List, Optional, Dict
 from datetime import datetime, timezone
 
+from .init_data import match_bracket
+from .js_literal import parse_js_literal
+
 
 def unescape_text(s: Optional[str]) -> Optional[str]:
     """Unescape HTML entities and remove HTML tags from text.
@@ -38,80 +41,28 @@ def unescape_text(s: Optional[str]) -> Optional[str]:
     return unescape(text).strip()
 
 
-def clean_json_string(json_str: str) -> str:
-    """Clean malformed JSON string from Google Play Store.
-    
-    Args:
-        json_str: Raw JSON string
-        
-    Returns:
-        Cleaned JSON string
-    """
-    json_str = re.sub(r',\s*sideChannel:\s*\{\}', '', json_str)
-    
-    json_str = re.sub(r'([{,]\s*)([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:', r'\1"\2":', json_str)
-    
-    json_str = re.sub(r'\bfunction\s*\([^)]*\)\s*\{[^}]*\}', 'null', json_str)
-    json_str = re.sub(r'\bundefined\b', 'null', json_str)
-    
-    json_str = re.sub(r":\s*'([^']*)'", r': "\1"', json_str)
-    
-    json_str = re.sub(r'(\])\s*(\[)', r'\1,\2', json_str)
-    json_str = re.sub(r'(\})\s*(\{)', r'\1,\2', json_str)
-    
-    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-    
-    json_str = re.sub(r',,+', ',', json_str)
-    
-    json_str = re.sub(r':\s*\$([0-9.]+)', r': "$\1"', json_str)
-    
-    json_str = re.sub(r'"version"\s*:\s*([0-9.]+)(?=\s*[,}])', r'"version": "\1"', json_str)
-    
-    return json_str
+def parse_data_array(json_str: str) -> Any:
+    """Parse just the ``data:`` array of a callback literal.
 
+    Fallback for literals whose surrounding object cannot be parsed. The
+    array is located with a string-aware bracket scan and parsed directly.
 
-def alternative_json_clean(json_str: str) -> str:
-    """Alternative JSON cleaning method using bracket matching.
-    
     Args:
-        json_str: Raw JSON string
-        
+        json_str: Raw callback literal
+
     Returns:
-        Cleaned JSON string
+        Parsed data array
+
+    Raises:
+        json.JSONDecodeError: If no well-formed data array is found
     """
-    data_start = json_str.find('data:')
-    if data_start != -1:
-        bracket_start = json_str.find('[', data_start)
-        if bracket_start != -1:
-            bracket_count = 0
-            pos = bracket_start
-            
-            while pos < len(json_str):
-                if json_str[pos] == '[':
-                    bracket_count += 1
-                elif json_str[pos] == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        data_end = pos + 1
-                        break
-                pos += 1
-            
-            if bracket_count == 0:
-                data_array = json_str[bracket_start:data_end]
-                
-                try:
-                    parsed_array = json.loads(data_array)
-                    
-                    return json.dumps({
-                        "key": "ds:5",
-                        "hash": "13",
-                        "data": parsed_array
-                    })
-                except json.JSONDecodeError:
-                    pass
-    
-    json_str = re.sub(r'\bNaN\b', 'null', json_str)
-    return clean_json_string(json_str)
+    field = json_str.find('data:')
+    start = json_str.find('[', field) if field != -1 else -1
+    end = match_bracket(json_str, start) if start != -1 else -1
+    if end == -1:
+        raise json.JSONDecodeError("No data array found", json_str, max(start, 0))
+    return parse_js_literal(json_str[start:end])
+
 
 def parse_release_date(release_date_str: Optional[str]) -> Optional[datetime]:
     """Parse release date string to datetime object.
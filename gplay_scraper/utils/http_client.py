@@ -1,51 +1,164 @@
-"""Network session wrapper with rate limiting support."""
+"""Network session wrappers with rate limiting support.
+
+Every ``fetch_*`` method describes its request as a :class:`RequestPlan` and
+hands it to the transport, so the blocking :class:`HttpClient` and the
+asyncio-based :class:`AsyncHttpClient` share URLs, payloads and error mapping.
+"""
 
 import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Optional, Union
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import quote
 
 from ..config import Config
-from ..exceptions import AppNotFoundError, NetworkError
+from ..exceptions import AppNotFoundError, NetworkError, RateLimitError
+from .cache import BaseCache, CacheEntry
+from .proxy_pool import ProxyPool, ProxyState
+from .rate_limiter import AdaptiveThrottle, RateLimiter
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
-ProxyConfig = Optional[Union[str, Dict[str, str]]]
+ProxyConfig = Optional[Union[str, Dict[str, str], ProxyPool]]
+
+
+class RequestPlan:
+    """Description of one logical fetch and how its failures are reported.
+
+    Attributes:
+        endpoint: Endpoint name (app, search, reviews, ...)
+        method: HTTP method
+        urls: URLs to try in order; later ones are fallbacks
+        data: Optional request body
+        headers: Optional request headers
+        not_found: Message for AppNotFoundError on 404, or None to skip the check
+        failure_key: ERROR_MESSAGES key used for NetworkError
+        failure_args: Format arguments for the failure message
+        soft_fail: Return ``default`` instead of raising on failure
+        default: Value returned when a soft failure occurs
+        key: Sticky routing key for proxy pools (app ID, developer ID or query)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        urls: List[str],
+        data: str = None,
+        headers: Dict[str, str] = None,
+        not_found: str = None,
+        failure_key: str = None,
+        failure_args: Dict = None,
+        soft_fail: bool = False,
+        default: str = "",
+        key: str = None,
+    ):
+        """Initialize RequestPlan with request and error-mapping details."""
+        self.endpoint = endpoint
+        self.method = method
+        self.urls = urls
+        self.data = data
+        self.headers = headers
+        self.not_found = not_found
+        self.failure_key = failure_key
+        self.failure_args = failure_args or {}
+        self.soft_fail = soft_fail
+        self.default = default
+        self.key = key
+
+    @property
+    def cache_key(self) -> str:
+        """Canonical request key (method, URLs and body) used by response caches."""
+        canonical = "\n".join([self.method, *self.urls, self.data or ""])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-class HttpClient:
-    """Internal network session manager."""
+class BaseHttpClient:
+    """Shared configuration, request building and error mapping.
 
-    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None):
-        """Initialize the network session manager."""
+    Subclasses provide the transport by implementing ``_setup_client``,
+    ``_make_request``, ``rate_limit``, ``_execute`` and ``_run_plan``.
+    """
+
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, max_connections: int = None,
+                 rate_limiter: RateLimiter = None, cache: BaseCache = None):
+        """Initialize the network session manager.
+
+        Args:
+            rate_limit_delay: Minimum delay between requests in seconds
+            proxies: Optional proxy configuration or ProxyPool
+            max_connections: Maximum concurrent requests; also the connection
+                cache size of each curl handle
+            rate_limiter: Shared rate limiter; overrides rate_limit_delay
+            cache: Optional response cache consulted before every request
+        """
         self.headers = Config.get_headers()
         self.timeout = Config.DEFAULT_TIMEOUT
-        self.rate_limit_delay = rate_limit_delay or Config.RATE_LIMIT_DELAY
-        self.last_request_time = 0
+        self.proxy_pool: Optional[ProxyPool] = proxies if isinstance(proxies, ProxyPool) else None
         self.proxies: Dict[str, str] = self._normalize_proxies(proxies)
+        # A proxy pool paces each proxy itself, so the shared limit is opt-in there
+        if rate_limiter is None and self.proxy_pool and rate_limit_delay is None:
+            rate_limiter = RateLimiter(rate=None)
+        self.rate_limiter = rate_limiter or RateLimiter(rate=1.0 / (rate_limit_delay or Config.RATE_LIMIT_DELAY))
+        self.throttle = AdaptiveThrottle(self.rate_limiter) if Config.ADAPTIVE_THROTTLE and not self.proxy_pool else None
+        self.retry_policies: Dict[str, RetryPolicy] = RetryPolicy.from_config()
+        self.single_flight = SingleFlight() if Config.COALESCE_REQUESTS else None
+        self.cache = cache
+        self.max_connections = max_connections or Config.MAX_CONNECTIONS_PER_HOST
         self.session = None
+        self._num_connects_info = None
+        self._timeout_errors = (TimeoutError, asyncio.TimeoutError)
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "new_connections": 0, "reused_connections": 0, "retries": 0, "retries_exhausted": 0}
         self._setup_client()
-    
-    def _setup_client(self):
-        """Setup the underlying session implementation."""
+
+    def _import_curl(self):
+        """Import curl_cffi lazily so a missing install gives a clear error."""
         try:
             from curl_cffi import requests as curl_requests
+            from curl_cffi import CurlInfo, CurlOpt
         except ImportError as exc:
             raise ImportError(Config.ERROR_MESSAGES["HTTP_CLIENT_NOT_AVAILABLE"].format(client="curl_cffi")) from exc
-        
-        self.session = curl_requests.Session(impersonate="chrome110")
-        self._apply_proxies()
-    
+        self._num_connects_info = CurlInfo.NUM_CONNECTS
+        self._timeout_errors = (curl_requests.exceptions.Timeout, TimeoutError, asyncio.TimeoutError)
+        return curl_requests, CurlInfo, CurlOpt
+
+    def _setup_client(self):
+        """Setup the underlying session implementation."""
+        raise NotImplementedError
+
+    @property
+    def rate_limit_delay(self) -> float:
+        """Minimum delay between requests in seconds (0 if unlimited)."""
+        rate = self.rate_limiter.rate
+        return 1.0 / rate if rate else 0.0
+
+    @rate_limit_delay.setter
+    def rate_limit_delay(self, delay: float) -> None:
+        self.rate_limiter.set_rate(1.0 / delay if delay else None)
+        if self.throttle is not None:
+            # The new rate is also the ceiling adaptive recovery may climb back to
+            self.throttle.max_rate = self.rate_limiter.rate
+
+    def _rate_limit_proxy(self) -> Optional[str]:
+        """Proxy URL used as the rate limiter key for the ``proxy`` scope."""
+        return self.proxies.get("https") or self.proxies.get("http")
+
     def _normalize_proxies(self, proxies: ProxyConfig) -> Dict[str, str]:
         """Normalise proxy configuration to a requests-compatible dictionary."""
-        if proxies is None:
+        if proxies is None or isinstance(proxies, ProxyPool):
             return {}
         if isinstance(proxies, str):
             return {"http": proxies, "https": proxies}
         if isinstance(proxies, dict):
             # Only keep string values to avoid session issues
             return {key: value for key, value in proxies.items() if isinstance(key, str) and isinstance(value, str)}
-        raise TypeError("proxies must be a string or mapping of scheme to proxy URL")
+        raise TypeError("proxies must be a string, mapping of scheme to proxy URL or ProxyPool")
     
     def _apply_proxies(self) -> None:
         """Apply current proxy configuration to the underlying session."""
@@ -62,8 +175,13 @@ class HttpClient:
     
     def set_proxies(self, proxies: ProxyConfig) -> None:
         """Update the active proxy configuration at runtime."""
+        self.proxy_pool = proxies if isinstance(proxies, ProxyPool) else None
         self.proxies = self._normalize_proxies(proxies)
         self._apply_proxies()
+
+    def _form_headers(self, content_type: str) -> Dict[str, str]:
+        """Build headers for a form-encoded POST request."""
+        return {**self.headers, "Content-Type": content_type}
     
     def fetch_app_page(self, app_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch app details page from Google Play Store.
@@ -80,26 +198,16 @@ class HttpClient:
             AppNotFoundError: If app not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}&gl={country}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id))
+        url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}"
+        return self._execute(RequestPlan(
+            "app", "GET",
             # Retry without country parameter
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}&hl={lang}"
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e2:
-                if self._is_404_error(e2):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id))
-                logger.error(Config.ERROR_MESSAGES["APP_FETCH_FAILED"].format(app_id=app_id, error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["APP_FETCH_FAILED"].format(app_id=app_id, error=e))
+            [f"{url}&gl={country}", url],
+            not_found=Config.ERROR_MESSAGES["APP_NOT_FOUND"].format(app_id=app_id),
+            failure_key="APP_FETCH_FAILED",
+            failure_args={"app_id": app_id},
+            key=app_id,
+        ))
     
     def fetch_app_page_no_locale(self, app_id: str) -> str:
         """Fetch app page without hl/gl parameters for fallback data.
@@ -108,18 +216,16 @@ class HttpClient:
             app_id: Google Play app ID
             
         Returns:
-            HTML content of app page
+            HTML content of app page, or an empty string if the request fails
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            logger.error(f"Fallback fetch failed for {app_id}: {e}")
-            return ""
+        return self._execute(RequestPlan(
+            "app_fallback", "GET",
+            [f"{Config.PLAY_STORE_BASE_URL}{Config.APP_DETAILS_ENDPOINT}?id={app_id}"],
+            failure_key="FALLBACK_FETCH_FAILED",
+            failure_args={"app_id": app_id},
+            key=app_id,
+            soft_fail=True,
+        ))
 
     def fetch_search_page(self, query: str = None, token: str = None, needed: int = None, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch search results from Google Play Store (initial or paginated).
@@ -138,8 +244,6 @@ class HttpClient:
             AppNotFoundError: If search fails
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
         # Pagination request
         if token and needed:
             url = f"{Config.PLAY_STORE_BASE_URL}/_/PlayStoreUi/data/batchexecute"
@@ -147,38 +251,26 @@ class HttpClient:
             
             body = f'f.req=%5B%5B%5B%22qnKhOb%22%2C%22%5B%5Bnull%2C%5B%5B10%2C%5B10%2C{needed}%5D%5D%2Ctrue%2Cnull%2C%5B96%2C27%2C4%2C8%2C57%2C30%2C110%2C79%2C11%2C16%2C49%2C1%2C3%2C9%2C12%2C104%2C55%2C56%2C51%2C10%2C34%2C77%5D%5D%2Cnull%2C%5C%22{token}%5C%22%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D'
             
-            headers = {
-                **self.headers,
-                "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-            }
-            
-            try:
-                response = self._make_request("POST", f"{url}?{params}", data=body, headers=headers)
-                return response.text
-            except Exception as e:
-                logger.error(Config.ERROR_MESSAGES["SEARCH_PAGINATION_FAILED"].format(error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["SEARCH_PAGINATION_FAILED"].format(error=e))
+            return self._execute(RequestPlan(
+                "search", "POST",
+                [f"{url}?{params}"],
+                data=body,
+                headers=self._form_headers("application/x-www-form-urlencoded;charset=UTF-8"),
+                failure_key="SEARCH_PAGINATION_FAILED",
+            ))
         
         # Initial search request
         elif query:
             encoded_query = quote(query)
-            url = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}&gl={country}&price=0"
-            
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e:
-                if self._is_404_error(e):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query))
-                url = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}&price=0"
-                try:
-                    response = self._make_request("GET", url)
-                    return response.text
-                except Exception as e2:
-                    if self._is_404_error(e2):
-                        raise AppNotFoundError(Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query))
-                    logger.error(Config.ERROR_MESSAGES["SEARCH_FETCH_FAILED"].format(query=query, error=e))
-                    raise NetworkError(Config.ERROR_MESSAGES["SEARCH_FETCH_FAILED"].format(query=query, error=e))
+            url = f"{Config.PLAY_STORE_BASE_URL}/work/search?q={encoded_query}&hl={lang}"
+            return self._execute(RequestPlan(
+                "search", "GET",
+                [f"{url}&gl={country}&price=0", f"{url}&price=0"],
+                not_found=Config.ERROR_MESSAGES["SEARCH_NOT_FOUND"].format(query=query),
+                failure_key="SEARCH_FETCH_FAILED",
+                failure_args={"query": query},
+                key=query,
+            ))
         
         else:
             raise ValueError("Either query or (token and needed) must be provided")
@@ -203,28 +295,23 @@ class HttpClient:
             AppNotFoundError: If reviews not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
         url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?hl={lang}&gl={country}"
         
-        headers = {
-            **self.headers,
-            "content-type": "application/x-www-form-urlencoded"
-        }
-        
         if token:
             payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%2Cnull%2C%5C%22{token}%5C%22%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
         else:
             payload = f"f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{batch_count}%5D%2Cnull%2C%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D"
         
-        try:
-            response = self._make_request("POST", url, data=payload, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["REVIEWS_NOT_FOUND"].format(app_id=app_id))
-            logger.error(Config.ERROR_MESSAGES["REVIEWS_FETCH_FAILED"].format(app_id=app_id, error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["REVIEWS_FETCH_FAILED"].format(app_id=app_id, error=e))
+        return self._execute(RequestPlan(
+            "reviews", "POST",
+            [url],
+            data=payload,
+            headers={**self.headers, "content-type": "application/x-www-form-urlencoded"},
+            not_found=Config.ERROR_MESSAGES["REVIEWS_NOT_FOUND"].format(app_id=app_id),
+            failure_key="REVIEWS_FETCH_FAILED",
+            failure_args={"app_id": app_id},
+            key=app_id,
+        ))
 
     def fetch_developer_page(self, dev_id: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch developer portfolio page from Google Play Store.
@@ -241,31 +328,19 @@ class HttpClient:
             AppNotFoundError: If developer not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
         if dev_id.isdigit():
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_NUMERIC_ENDPOINT}?id={quote(dev_id)}&hl={lang}&gl={country}"
+            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_NUMERIC_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
         else:
-            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_STRING_ENDPOINT}?id={quote(dev_id)}&hl={lang}&gl={country}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id))
-            if dev_id.isdigit():
-                url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_NUMERIC_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
-            else:
-                url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_STRING_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
-            try:
-                response = self._make_request("GET", url)
-                return response.text
-            except Exception as e2:
-                if self._is_404_error(e2):
-                    raise AppNotFoundError(Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id))
-                logger.error(Config.ERROR_MESSAGES["DEVELOPER_FETCH_FAILED"].format(dev_id=dev_id, error=e))
-                raise NetworkError(Config.ERROR_MESSAGES["DEVELOPER_FETCH_FAILED"].format(dev_id=dev_id, error=e))
+            url = f"{Config.PLAY_STORE_BASE_URL}{Config.DEVELOPER_STRING_ENDPOINT}?id={quote(dev_id)}&hl={lang}"
+        
+        return self._execute(RequestPlan(
+            "developer", "GET",
+            [f"{url}&gl={country}", url],
+            not_found=Config.ERROR_MESSAGES["DEVELOPER_NOT_FOUND"].format(dev_id=dev_id),
+            failure_key="DEVELOPER_FETCH_FAILED",
+            failure_args={"dev_id": dev_id},
+            key=dev_id,
+        ))
 
     def fetch_cluster_page(self, cluster_url: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch cluster page (similar apps collection) from Google Play Store.
@@ -282,18 +357,12 @@ class HttpClient:
             AppNotFoundError: If cluster not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
-        url = f"{Config.PLAY_STORE_BASE_URL}{cluster_url}&gl={country}&hl={lang}"
-        
-        try:
-            response = self._make_request("GET", url)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["CLUSTER_NOT_FOUND"].format(cluster_url=cluster_url))
-            logger.error(Config.ERROR_MESSAGES["CLUSTER_FETCH_FAILED"].format(error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["CLUSTER_FETCH_FAILED"].format(error=e))
+        return self._execute(RequestPlan(
+            "cluster", "GET",
+            [f"{Config.PLAY_STORE_BASE_URL}{cluster_url}&gl={country}&hl={lang}"],
+            not_found=Config.ERROR_MESSAGES["CLUSTER_NOT_FOUND"].format(cluster_url=cluster_url),
+            failure_key="CLUSTER_FETCH_FAILED",
+        ))
 
     def fetch_list_page(self, collection: str, category: str = Config.DEFAULT_LIST_CATEGORY, count: int = Config.DEFAULT_LIST_COUNT, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch top charts list page from Google Play Store.
@@ -312,25 +381,18 @@ class HttpClient:
             AppNotFoundError: If list not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
         body = f'f.req=%5B%5B%5B%22vyAe2%22%2C%22%5B%5Bnull%2C%5B%5B8%2C%5B20%2C{count}%5D%5D%2Ctrue%2Cnull%2C%5B64%2C1%2C195%2C71%2C8%2C72%2C9%2C10%2C11%2C139%2C12%2C16%2C145%2C148%2C150%2C151%2C152%2C27%2C30%2C31%2C96%2C32%2C34%2C163%2C100%2C165%2C104%2C169%2C108%2C110%2C113%2C55%2C56%2C57%2C122%5D%2C%5Bnull%2Cnull%2C%5B%5B%5Btrue%5D%2Cnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5Bnull%2C2%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B1%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%2Cnull%2C%5Btrue%5D%5D%2C%5Bnull%2C%5B%5Bnull%2C%5B%5D%5D%5D%5D%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%2C%5B%5B%5Bnull%2C%5B%5D%5D%5D%5D%5D%2C%5B%5B%5B%5B7%2C1%5D%2C%5B%5B1%2C73%2C96%2C103%2C97%2C58%2C50%2C92%2C52%2C112%2C69%2C19%2C31%2C101%2C123%2C74%2C49%2C80%2C38%2C20%2C10%2C14%2C79%2C43%2C42%2C139%5D%5D%5D%5D%5D%5D%2Cnull%2Cnull%2C%5B%5B%5B1%2C2%5D%2C%5B10%2C8%2C9%5D%2C%5B%5D%2C%5B%5D%5D%5D%5D%2C%5B2%2C%5C%22{collection}%5C%22%2C%5C%22{category}%5C%22%5D%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D&at=AFSRYlx8XZfN8-O-IKASbNBDkB6T%3A1655531200971&'
         
         url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=vyAe2&source-path=%2Fstore%2Fapps&hl={lang}&gl={country}"
         
-        headers = {
-            **self.headers,
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-        }
-        
-        try:
-            response = self._make_request("POST", url, data=body, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["LIST_NOT_FOUND"].format(collection=collection, category=category))
-            logger.error(Config.ERROR_MESSAGES["LIST_FETCH_FAILED"].format(error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["LIST_FETCH_FAILED"].format(error=e))
+        return self._execute(RequestPlan(
+            "list", "POST",
+            [url],
+            data=body,
+            headers=self._form_headers("application/x-www-form-urlencoded;charset=UTF-8"),
+            not_found=Config.ERROR_MESSAGES["LIST_NOT_FOUND"].format(collection=collection, category=category),
+            failure_key="LIST_FETCH_FAILED",
+        ))
 
     def fetch_suggest_page(self, term: str, lang: str = Config.DEFAULT_LANGUAGE, country: str = Config.DEFAULT_COUNTRY) -> str:
         """Fetch search suggestions from Google Play Store.
@@ -347,45 +409,198 @@ class HttpClient:
             AppNotFoundError: If suggestions not found
             NetworkError: If request fails
         """
-        self.rate_limit()
-        
         encoded_term = quote(term)
         url = f"{Config.PLAY_STORE_BASE_URL}{Config.BATCHEXECUTE_ENDPOINT}?rpcids=IJ4APc&f.sid=-697906427155521722&bl=boq_playuiserver_20190903.08_p0&hl={lang}&gl={country}&authuser&soc-app=121&soc-platform=1&soc-device=1&_reqid=1065213"
         
         body = f"f.req=%5B%5B%5B%22IJ4APc%22%2C%22%5B%5Bnull%2C%5B%5C%22{encoded_term}%5C%22%5D%2C%5B10%5D%2C%5B2%5D%2C4%5D%5D%22%5D%5D%5D"
         
-        headers = {
-            **self.headers,
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"
-        }
-        
-        try:
-            response = self._make_request("POST", url, data=body, headers=headers)
-            return response.text
-        except Exception as e:
-            if self._is_404_error(e):
-                raise AppNotFoundError(Config.ERROR_MESSAGES["SUGGEST_NOT_FOUND"].format(term=term))
-            logger.error(Config.ERROR_MESSAGES["SUGGEST_FETCH_FAILED"].format(term=term, error=e))
-            raise NetworkError(Config.ERROR_MESSAGES["SUGGEST_FETCH_FAILED"].format(term=term, error=e))
+        return self._execute(RequestPlan(
+            "suggest", "POST",
+            [url],
+            data=body,
+            headers=self._form_headers("application/x-www-form-urlencoded;charset=UTF-8"),
+            not_found=Config.ERROR_MESSAGES["SUGGEST_NOT_FOUND"].format(term=term),
+            failure_key="SUGGEST_FETCH_FAILED",
+            failure_args={"term": term},
+        ))
 
-    def _make_request(self, method: str, url: str, **kwargs):
-        """Execute an HTTP request using the configured session."""
-        headers = kwargs.get("headers", self.headers)
-        data = kwargs.get("data")
-        proxies = kwargs.get("proxies", self.proxies or None)
-        
+    def retry_policy(self, endpoint: str) -> RetryPolicy:
+        """Get the retry policy for an endpoint, falling back to ``default``."""
+        return self.retry_policies.get(endpoint) or self.retry_policies.get("default") or RetryPolicy(max_attempts=1)
+
+    def _next_retry_delay(self, plan: RequestPlan, attempt: int, error: Exception, started: float) -> Optional[float]:
+        """Apply the plan's retry policy to a failed attempt and count the outcome.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        policy = self.retry_policy(plan.endpoint)
+        delay = policy.next_delay(attempt, error, time.monotonic() - started)
+        with self._stats_lock:
+            if delay is not None:
+                self._stats["retries"] += 1
+            elif attempt > 1:
+                self._stats["retries_exhausted"] += 1
+        if delay is not None:
+            logger.warning(Config.ERROR_MESSAGES["RETRYING"].format(
+                endpoint=plan.endpoint, attempt=attempt, max_attempts=policy.max_attempts, delay=delay, error=error))
+        return delay
+
+    @staticmethod
+    def _plan_key(plan: RequestPlan) -> tuple:
+        """Canonical identity of a plan's request, used for coalescing."""
+        return (plan.method, tuple(plan.urls), plan.data)
+
+    def _cache_lookup(self, plan: RequestPlan) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """Look the plan up in the cache, if caching is enabled.
+
+        Returns:
+            Tuple of (fresh response text, stale entry worth revalidating);
+            either or both may be None
+        """
+        if self.cache is None:
+            return None, None
+        entry = self.cache.lookup(plan.cache_key)
+        if entry is None:
+            return None, None
+        if entry.is_fresh():
+            return entry.value, None
+        return None, entry if entry.has_validators else None
+
+    def _request_headers(self, plan: RequestPlan, stale: Optional[CacheEntry]) -> Dict[str, str]:
+        """Headers for a plan, made conditional when revalidating a stale entry."""
+        headers = plan.headers or self.headers
+        return {**headers, **stale.conditional_headers()} if stale is not None else headers
+
+    def _cache_response(self, plan: RequestPlan, response, stale: Optional[CacheEntry]) -> str:
+        """Store a successful response (or renew a revalidated entry) and return its text."""
+        if stale is not None and response.status_code == 304:
+            self.cache.revalidated(plan.cache_key, stale)
+            return stale.value
+        if self.cache is not None:
+            headers = getattr(response, "headers", None) or {}
+            self.cache.set(plan.cache_key, response.text, plan.endpoint,
+                           headers.get("ETag"), headers.get("Last-Modified"))
+        return response.text
+
+    def _acquire_proxy(self, plan: RequestPlan) -> Optional[ProxyState]:
+        """Pick a proxy from the pool for one attempt of a plan, if pooled."""
+        return self.proxy_pool.acquire(plan.key) if self.proxy_pool else None
+
+    def _release_proxy(self, proxy: Optional[ProxyState], error: Exception = None) -> None:
+        """Report an attempt's outcome to the pool; 404s count as healthy."""
+        if proxy is not None:
+            self.proxy_pool.release(proxy, None if error is None or self._is_404_error(error) else error)
+
+    def _request_proxies(self, proxy: Optional[ProxyState]) -> Optional[Dict[str, str]]:
+        """Proxy mapping for a request: the pooled proxy or the session default."""
+        return proxy.proxies if proxy is not None else self.proxies or None
+
+    def _handle_attempt_error(self, plan: RequestPlan, error: Exception) -> None:
+        """Raise AppNotFoundError if a failed attempt was a 404 for this plan."""
+        if plan.not_found and self._is_404_error(error):
+            raise AppNotFoundError(plan.not_found)
+
+    def _handle_plan_failure(self, plan: RequestPlan, error: Exception) -> str:
+        """Log and report a plan whose attempts all failed.
+
+        Returns:
+            The plan default for soft failures
+
+        Raises:
+            RateLimitError: If the server throttled the request
+            NetworkError: For all other plans
+        """
+        message = Config.ERROR_MESSAGES[plan.failure_key].format(error=error, **plan.failure_args)
+        logger.error(message)
+        if plan.soft_fail:
+            return plan.default
+        if isinstance(error, RateLimitError):
+            raise RateLimitError(message, error.retry_after)
+        raise NetworkError(message)
+
+    def _check_method(self, method: str) -> None:
+        """Reject HTTP methods the clients do not support."""
         if method not in {"GET", "POST"}:
             raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        try:
-            if method == "GET":
-                response = self.session.get(url, headers=headers, timeout=self.timeout, proxies=proxies)
+
+    def _record_connection(self, response) -> None:
+        """Update connection reuse statistics from a completed response."""
+        infos = getattr(response, "infos", None) or {}
+        new_connections = infos.get(self._num_connects_info, 0) or 0
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            if new_connections:
+                self._stats["new_connections"] += new_connections
             else:
-                response = self.session.post(url, data=data, headers=headers, timeout=self.timeout, proxies=proxies)
-            response.raise_for_status()
-            return response
-        except Exception:
-            raise
+                self._stats["reused_connections"] += 1
+
+    def _observe_response(self, url: str, response, latency: float) -> None:
+        """Feed a response to the adaptive throttle.
+
+        Raises:
+            RateLimitError: If the response is a throttling status (429/503)
+        """
+        status_code = getattr(response, "status_code", 200)
+        if status_code in Config.THROTTLE_STATUS_CODES:
+            headers = getattr(response, "headers", None) or {}
+            retry_after = self._parse_retry_after(headers.get("Retry-After"))
+            if self.throttle:
+                self.throttle.on_throttle(retry_after, url, self._rate_limit_proxy())
+            raise RateLimitError(Config.ERROR_MESSAGES["THROTTLED"].format(status_code=status_code, url=url), retry_after)
+        if self.throttle and status_code < 400:
+            self.throttle.on_success(latency)
+
+    def _observe_error(self, error: Exception) -> None:
+        """Feed a transport error to the adaptive throttle."""
+        if self.throttle and isinstance(error, self._timeout_errors):
+            self.throttle.on_timeout()
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date.
+
+        Returns:
+            Seconds to wait, or None if the header is missing or invalid
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return connection reuse and throttling statistics for this client.
+
+        Returns:
+            Dictionary with request count, new and reused connection counts,
+            the fraction of requests served on a reused connection, retry,
+            coalescing and cache counters (including 304 revalidations and
+            bytes saved) and, when adaptive throttling is enabled, its backoff
+            counters and current rate
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["reuse_ratio"] = stats["reused_connections"] / stats["requests"] if stats["requests"] else 0.0
+        if self.throttle:
+            stats.update(self.throttle.metrics())
+        if self.cache is not None:
+            cache_stats = self.cache.stats()
+            stats["cache_hits"] = cache_stats["hits"]
+            stats["cache_misses"] = cache_stats["misses"]
+            stats["cache_revalidations"] = cache_stats["revalidations"]
+            stats["cache_bytes_saved"] = cache_stats["bytes_saved"]
+        if self.single_flight:
+            stats["coalesced_requests"] = self.single_flight.coalesced
+        if self.proxy_pool:
+            stats["proxies_healthy"] = self.proxy_pool.healthy_count()
+            stats["proxy_ejections"] = sum(proxy["ejections"] for proxy in self.proxy_pool.stats())
+        return stats
     
     def _is_404_error(self, error: Exception) -> bool:
         """Check if error is a 404 not found error.
@@ -394,19 +609,256 @@ class HttpClient:
             error: Exception to check
             
         Returns:
-            True if 404 error, False otherwise
+            True if the error carries a response with status 404, False otherwise
         """
-        error_str = str(error).lower()
-        return "404" in error_str or "not found" in error_str
+        response = getattr(error, "response", None)
+        return getattr(response, "status_code", None) == 404
+
+
+class HttpClient(BaseHttpClient):
+    """Internal network session manager.
+
+    A single instance can be shared by several scrapers so that they share
+    one coordinated rate limiter and one request concurrency cap.
+
+    curl_cffi keeps one curl handle, and so one connection cache, per thread.
+    Requests made from the same thread reuse its connections, but each thread
+    that sends requests opens its own. ``max_connections`` therefore caps the
+    requests in flight across all threads and the connections each handle
+    keeps, not the total number of open connections.
+    """
+
+    def _setup_client(self):
+        """Setup the underlying session implementation."""
+        curl_requests, CurlInfo, CurlOpt = self._import_curl()
+        self._connection_slots = threading.BoundedSemaphore(self.max_connections)
+        self.session = curl_requests.Session(
+            impersonate="chrome110",
+            curl_options={CurlOpt.MAXCONNECTS: self.max_connections},
+            curl_infos=[CurlInfo.NUM_CONNECTS],
+        )
+        self._apply_proxies()
+
+    def _execute(self, plan: RequestPlan) -> str:
+        """Run a request plan, serving it from the cache or sharing the result
+        with identical plans in flight when possible.
+
+        Args:
+            plan: Request plan to execute
+
+        Returns:
+            Response text
+        """
+        cached, stale = self._cache_lookup(plan)
+        if cached is not None:
+            return cached
+        if self.single_flight is None:
+            return self._run_plan(plan, stale)
+        return self.single_flight.do(self._plan_key(plan), lambda: self._run_plan(plan, stale))
+
+    def _run_plan(self, plan: RequestPlan, stale: CacheEntry = None) -> str:
+        """Run a request plan, trying each URL in turn and retrying per policy.
+
+        Args:
+            plan: Request plan to execute
+            stale: Expired cache entry to revalidate with a conditional request
+
+        Returns:
+            Response text
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            proxy = self._acquire_proxy(plan)
+            first_error = None
+            try:
+                self.rate_limit(plan.urls[0], proxy)
+                for url in plan.urls:
+                    try:
+                        response = self._make_request(plan.method, url, data=plan.data,
+                                                      headers=self._request_headers(plan, stale),
+                                                      proxies=self._request_proxies(proxy))
+                        first_error = None
+                        return self._cache_response(plan, response, stale)
+                    except RateLimitError as e:
+                        # Fallback URLs hit the same servers, so stop while throttled
+                        first_error = e
+                        break
+                    except Exception as e:
+                        first_error = first_error or e
+                        self._handle_attempt_error(plan, e)
+            finally:
+                self._release_proxy(proxy, first_error)
+            
+            delay = self._next_retry_delay(plan, attempt, first_error, started)
+            if delay is None:
+                return self._handle_plan_failure(plan, first_error)
+            time.sleep(delay)
+
+    def _make_request(self, method: str, url: str, **kwargs):
+        """Execute an HTTP request using the configured session."""
+        headers = kwargs.get("headers") or self.headers
+        data = kwargs.get("data")
+        proxies = kwargs.get("proxies", self.proxies or None)
+        
+        self._check_method(method)
+        
+        with self._connection_slots:
+            start = time.monotonic()
+            try:
+                if method == "GET":
+                    response = self.session.get(url, headers=headers, timeout=self.timeout, proxies=proxies)
+                else:
+                    response = self.session.post(url, data=data, headers=headers, timeout=self.timeout, proxies=proxies)
+            except Exception as e:
+                self._observe_error(e)
+                raise
+            latency = time.monotonic() - start
+        self._record_connection(response)
+        self._observe_response(url, response, latency)
+        response.raise_for_status()
+        return response
     
-    def rate_limit(self):
-        """Apply rate limiting delay between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def rate_limit(self, url: str = None, proxy: ProxyState = None):
+        """Wait for the pooled proxy's bucket and the shared rate limiter.
+
+        Args:
+            url: Request URL, used when the limiter is scoped per host
+            proxy: Proxy chosen from the pool for this request, if any
+        """
+        if proxy is not None:
+            proxy.bucket.acquire()
+        self.rate_limiter.acquire(url, proxy.url if proxy is not None else self._rate_limit_proxy())
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """Asyncio network session manager.
+
+    Exposes the same ``fetch_*`` methods as :class:`HttpClient`, but each one
+    returns an awaitable. Requests share a non-blocking rate limiter and at
+    most ``max_concurrency`` of them are in flight at once.
+    """
+
+    def __init__(self, rate_limit_delay: float = None, proxies: ProxyConfig = None, max_connections: int = None,
+                 max_concurrency: int = None, rate_limiter: RateLimiter = None, cache: BaseCache = None):
+        """Initialize the asyncio network session manager.
+
+        Args:
+            rate_limit_delay: Minimum delay between requests in seconds
+            proxies: Optional proxy configuration
+            max_connections: Maximum concurrent requests; also the connection
+                cache size of each curl handle
+            max_concurrency: Maximum number of requests in flight
+            rate_limiter: Shared rate limiter; overrides rate_limit_delay
+            cache: Optional response cache consulted before every request
+        """
+        self.max_concurrency = max_concurrency or Config.ASYNC_MAX_CONCURRENCY
+        self._concurrency = asyncio.Semaphore(self.max_concurrency)
+        super().__init__(rate_limit_delay, proxies, max_connections, rate_limiter, cache)
+
+    def _setup_client(self):
+        """Setup the underlying asyncio session implementation."""
+        curl_requests, CurlInfo, CurlOpt = self._import_curl()
+        self.session = curl_requests.AsyncSession(
+            impersonate="chrome110",
+            max_clients=max(self.max_connections, self.max_concurrency),
+            curl_infos=[CurlInfo.NUM_CONNECTS],
+        )
+        self._apply_proxies()
+
+    async def close(self) -> None:
+        """Close the underlying asyncio session."""
+        await self.session.close()
+
+    async def _execute(self, plan: RequestPlan) -> str:
+        """Run a request plan, serving it from the cache or sharing the result
+        with identical plans in flight when possible.
+
+        Args:
+            plan: Request plan to execute
+
+        Returns:
+            Response text
+        """
+        cached, stale = self._cache_lookup(plan)
+        if cached is not None:
+            return cached
+        if self.single_flight is None:
+            return await self._run_plan(plan, stale)
+        return await self.single_flight.do_async(self._plan_key(plan), lambda: self._run_plan(plan, stale))
+
+    async def _run_plan(self, plan: RequestPlan, stale: CacheEntry = None) -> str:
+        """Run a request plan, trying each URL in turn and retrying per policy.
+
+        Args:
+            plan: Request plan to execute
+            stale: Expired cache entry to revalidate with a conditional request
+
+        Returns:
+            Response text
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            proxy = self._acquire_proxy(plan)
+            first_error = None
+            try:
+                await self.rate_limit(plan.urls[0], proxy)
+                for url in plan.urls:
+                    try:
+                        response = await self._make_request(plan.method, url, data=plan.data,
+                                                            headers=self._request_headers(plan, stale),
+                                                            proxies=self._request_proxies(proxy))
+                        first_error = None
+                        return self._cache_response(plan, response, stale)
+                    except RateLimitError as e:
+                        # Fallback URLs hit the same servers, so stop while throttled
+                        first_error = e
+                        break
+                    except Exception as e:
+                        first_error = first_error or e
+                        self._handle_attempt_error(plan, e)
+            finally:
+                self._release_proxy(proxy, first_error)
+            
+            delay = self._next_retry_delay(plan, attempt, first_error, started)
+            if delay is None:
+                return self._handle_plan_failure(plan, first_error)
+            await asyncio.sleep(delay)
+
+    async def _make_request(self, method: str, url: str, **kwargs):
+        """Execute an HTTP request using the configured asyncio session."""
+        headers = kwargs.get("headers") or self.headers
+        data = kwargs.get("data")
+        proxies = kwargs.get("proxies", self.proxies or None)
         
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=sleep_time))
-            time.sleep(sleep_time)
+        self._check_method(method)
         
-        self.last_request_time = time.time()
+        async with self._concurrency:
+            start = time.monotonic()
+            try:
+                if method == "GET":
+                    response = await self.session.get(url, headers=headers, timeout=self.timeout, proxies=proxies)
+                else:
+                    response = await self.session.post(url, data=data, headers=headers, timeout=self.timeout, proxies=proxies)
+            except Exception as e:
+                self._observe_error(e)
+                raise
+            latency = time.monotonic() - start
+        self._record_connection(response)
+        self._observe_response(url, response, latency)
+        response.raise_for_status()
+        return response
+
+    async def rate_limit(self, url: str = None, proxy: ProxyState = None):
+        """Wait for the pooled proxy's bucket and the shared rate limiter without blocking the event loop.
+
+        Args:
+            url: Request URL, used when the limiter is scoped per host
+            proxy: Proxy chosen from the pool for this request, if any
+        """
+        if proxy is not None:
+            await proxy.bucket.acquire_async()
+        await self.rate_limiter.acquire_async(url, proxy.url if proxy is not None else self._rate_limit_proxy())
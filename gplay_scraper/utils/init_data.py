@@ -0,0 +1,189 @@
+"""Single-pass extraction of AF_initDataCallback payloads.
+
+Play pages embed their data as ``AF_initDataCallback({key: 'ds:N', ...})``
+script calls. :func:`index_init_data` walks the HTML once, matching brackets
+instead of running backtracking regexes, and records where each callback's
+object literal starts and ends. Callers slice out only the blocks they need.
+
+:class:`LazyDatasets` wraps the index as a read-only mapping that decodes a
+block's data only when it is first looked up.
+"""
+
+import re
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from . import json_backend
+
+Span = Tuple[int, int]
+
+_CALLBACK = "AF_initDataCallback"
+
+# Strings are consumed whole so brackets inside them are ignored; runs of
+# opening or closing brackets are matched together to keep the loop short.
+_TOKEN = re.compile(
+    r""""[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'|([\[{]+)|([\]}]+)"""
+)
+_OPEN = re.compile(r"\s*\(\s*\{")
+_KEY = re.compile(r"""\{\s*["']?key["']?\s*:\s*["']([^"']*)["']""")
+_DATA = re.compile(r"""[{,]\s*["']?data["']?\s*:\s*""")
+
+
+def match_bracket(text: str, start: int, end: Optional[int] = None) -> int:
+    """Find the end of the bracketed literal that opens at ``start``.
+
+    Args:
+        text: Source text
+        start: Index of an opening ``[`` or ``{``
+        end: Index to stop searching at (defaults to the end of ``text``)
+
+    Returns:
+        Index just past the matching closing bracket, or -1 if unbalanced
+    """
+    depth = 0
+    for match in _TOKEN.finditer(text, start, len(text) if end is None else end):
+        opening, closing = match.group(1, 2)
+        if opening:
+            depth += len(opening)
+        elif closing:
+            if len(closing) >= depth:
+                return match.start() + depth
+            depth -= len(closing)
+    return -1
+
+
+def index_init_data(html_content: str) -> Dict[str, Span]:
+    """Index every AF_initDataCallback payload on a page in one pass.
+
+    Args:
+        html_content: Page HTML
+
+    Returns:
+        Mapping of dataset key (e.g. ``'ds:5'``) to the ``(start, end)`` span
+        of its callback object literal; the first callback wins on duplicates
+    """
+    index = {}
+    position = html_content.find(_CALLBACK)
+    while position != -1:
+        position += len(_CALLBACK)
+        opening = _OPEN.match(html_content, position)
+        if opening:
+            start = opening.end() - 1
+            end = match_bracket(html_content, start)
+            if end == -1:
+                break
+            key = _KEY.match(html_content, start, end)
+            if key:
+                index.setdefault(key.group(1), (start, end))
+            position = end
+        position = html_content.find(_CALLBACK, position)
+    return index
+
+
+def data_span(html_content: str, span: Span) -> Optional[Span]:
+    """Locate the ``data:`` value inside an indexed callback object literal.
+
+    Args:
+        html_content: Page HTML the span was indexed from
+        span: Object literal span returned by :func:`index_init_data`
+
+    Returns:
+        ``(start, end)`` span of the data array or object, or None
+    """
+    start, end = span
+    field = _DATA.search(html_content, start, end)
+    if not field or field.end() >= end or html_content[field.end()] not in "[{":
+        return None
+    value_end = match_bracket(html_content, field.end(), end)
+    return (field.end(), value_end) if value_end != -1 else None
+
+
+def extract_init_data(html_content: str, ds_key: str) -> str:
+    """Extract the raw AF_initDataCallback object literal for a dataset key.
+
+    Args:
+        html_content: Page HTML
+        ds_key: Dataset key such as 'ds:5'
+
+    Returns:
+        Callback object literal, or an empty string if not found
+    """
+    span = index_init_data(html_content).get(ds_key)
+    return html_content[span[0]:span[1]] if span else ""
+
+
+class LazyDatasets(Mapping):
+    """Read-only ``{ds_key: data}`` mapping that decodes blocks on first access.
+
+    Play pages embed many large datasets that a given call never reads, so
+    nothing is decoded up front; each block is parsed the first time it is
+    looked up and the result is memoized. A block whose data cannot be
+    decoded is dropped from the mapping when it is first looked up, after
+    which iteration, length and membership no longer include it.
+
+    Args:
+        html_content: Page HTML
+        index: Index from :func:`index_init_data` (built if omitted)
+    """
+
+    _MISSING = object()
+
+    def __init__(self, html_content: str, index: Dict[str, Span] = None):
+        """Initialize LazyDatasets over a page without decoding anything."""
+        self._html = html_content
+        self._index = index_init_data(html_content) if index is None else dict(index)
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._decoded:
+            return self._decoded[key]
+        value = self._decode(key)
+        if value is self._MISSING:
+            self._index.pop(key, None)
+            raise KeyError(key)
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _decode(self, key: str) -> Any:
+        """Parse the data value of one block, or return ``_MISSING``."""
+        span = self._index.get(key)
+        value_span = data_span(self._html, span) if span else None
+        if not value_span:
+            return self._MISSING
+        text = self._html[value_span[0]:value_span[1]]
+        try:
+            return json_backend.loads(text)
+        except json.JSONDecodeError:
+            pass
+        from .js_literal import parse_js_literal  # js_literal imports match_bracket from here
+
+        try:
+            return parse_js_literal(text)
+        except json.JSONDecodeError:
+            return self._MISSING
+
+    def any_decodable(self, *preferred: str) -> bool:
+        """Check that at least one block decodes, decoding only until one does.
+
+        Args:
+            *preferred: Keys to probe first, normally the block the caller
+                reads next, so its decode is reused rather than wasted
+
+        Returns:
+            True if some block decodes
+        """
+        keys = [key for key in preferred if key in self._index]
+        keys += [key for key in self._index if key not in preferred]
+        return any(key in self for key in keys)
+
+    @property
+    def decoded(self) -> Tuple[str, ...]:
+        """Keys that have been decoded so far."""
+        return tuple(self._decoded)
@@ -0,0 +1,215 @@
+"""Single-pass parser for the loose JavaScript literals Play embeds in pages.
+
+AF_initDataCallback payloads are JavaScript object literals rather than JSON:
+keys are unquoted, strings may use single quotes, and values such as
+``undefined``, ``NaN`` or inline functions can appear. :func:`parse_js_literal`
+turns such text straight into Python objects in one pass over the input.
+Containers that happen to be valid JSON (normally the whole ``data`` array)
+are handed to the C JSON decoder in a single call.
+"""
+
+import re
+import json
+from typing import Any, Dict, List
+
+from .init_data import match_bracket
+
+_WHITESPACE = re.compile(r"\s*")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER = re.compile(r"-?(?:\d[\d.]*|\.\d+)(?:[eE][-+]?\d+)?")
+_STRINGS = {
+    '"': re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"', re.DOTALL),
+    "'": re.compile(r"'([^'\\]*(?:\\.[^'\\]*)*)'", re.DOTALL),
+}
+_ESCAPE = re.compile(r'\\(x[0-9A-Fa-f]{2}|\r\n|[\s\S])|"')
+_FUNCTION = re.compile(r"function\s*[\w$]*\s*\([^)]*\)\s*(?=\{)")
+_CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "undefined": None,
+    "NaN": None,
+    "Infinity": float("inf"),
+}
+_JSON_ESCAPES = frozenset('"\\/bfnrtu')
+# JavaScript escapes JSON lacks, spelled as JSON unicode escapes
+_JS_ESCAPES = {"v": "\\u000b", "0": "\\u0000"}
+
+# NaN decodes to None on both the fast and the slow path
+_DECODER = json.JSONDecoder(strict=False, parse_constant=lambda name: _CONSTANTS.get(name, float(name)))
+
+
+def _translate_escape(match: "re.Match") -> str:
+    """Rewrite one JavaScript string escape as its JSON equivalent."""
+    escape = match.group(1)
+    if escape is None:
+        return '\\"'
+    if escape[0] == "x" and len(escape) == 3:
+        return "\\u00" + escape[1:]
+    if escape in _JSON_ESCAPES:
+        return "\\" + escape
+    if escape in _JS_ESCAPES:
+        return _JS_ESCAPES[escape]
+    if escape in ("\n", "\r", "\r\n", "\u2028", "\u2029"):
+        return ""
+    return escape
+
+
+def _decode_string(body: str) -> str:
+    """Decode the body of a quoted JavaScript string."""
+    if "\\" not in body and '"' not in body:
+        return body
+    return _DECODER.decode('"' + _ESCAPE.sub(_translate_escape, body) + '"')
+
+
+class _Parser:
+    """Recursive-descent parser over one literal (one instance per call)."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+    def skip_whitespace(self) -> str:
+        """Advance past whitespace and return the next character ('' at the end)."""
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def value(self) -> Any:
+        char = self.skip_whitespace()
+        if char and char in "[{":
+            # Fast path: most containers are already valid JSON
+            try:
+                result, self.pos = _DECODER.raw_decode(self.text, self.pos)
+                return result
+            except json.JSONDecodeError:
+                return self.array() if char == "[" else self.object()
+        if char in _STRINGS:
+            return self.string(char)
+        if char == "$":
+            number = _NUMBER.match(self.text, self.pos + 1)
+            if number:
+                self.pos = number.end()
+                return "$" + number.group()
+        number = _NUMBER.match(self.text, self.pos)
+        if number:
+            self.pos = number.end()
+            return self.number(number.group())
+        identifier = _IDENTIFIER.match(self.text, self.pos)
+        if identifier:
+            name = identifier.group()
+            if name in _CONSTANTS:
+                self.pos = identifier.end()
+                return _CONSTANTS[name]
+            if name == "function":
+                return self.function()
+        if self.text.startswith("-Infinity", self.pos):
+            self.pos += len("-Infinity")
+            return float("-inf")
+        raise self.error("Expecting value")
+
+    def string(self, quote: str) -> str:
+        match = _STRINGS[quote].match(self.text, self.pos)
+        if not match:
+            raise self.error("Unterminated string")
+        self.pos = match.end()
+        return _decode_string(match.group(1))
+
+    @staticmethod
+    def number(token: str) -> Any:
+        if token.count(".") > 1:
+            # Dotted versions such as 1.2.3 are kept as strings
+            return token
+        if "." in token or "e" in token or "E" in token:
+            return float(token)
+        return int(token)
+
+    def function(self) -> None:
+        """Skip an inline function expression; it carries no data."""
+        header = _FUNCTION.match(self.text, self.pos)
+        end = match_bracket(self.text, header.end()) if header else -1
+        if end == -1:
+            raise self.error("Malformed function")
+        self.pos = end
+        return None
+
+    def array(self) -> List[Any]:
+        self.pos += 1
+        items = []
+        expecting_value = True
+        while True:
+            char = self.skip_whitespace()
+            if char == "]":
+                self.pos += 1
+                return items
+            if char == ",":
+                if expecting_value:
+                    items.append(None)  # elision, e.g. [1,,2]
+                self.pos += 1
+                expecting_value = True
+            elif char == "":
+                raise self.error("Unterminated array")
+            elif expecting_value or char in "[{":
+                # Adjacent containers without a comma are tolerated
+                items.append(self.value())
+                expecting_value = False
+            else:
+                raise self.error("Expecting ',' delimiter")
+
+    def object(self) -> Dict[str, Any]:
+        self.pos += 1
+        result = {}
+        while True:
+            char = self.skip_whitespace()
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            key = self.key(char)
+            result[key] = self.value_after_colon()
+            char = self.skip_whitespace()
+            if char not in ",}":
+                raise self.error("Expecting ',' delimiter")
+
+    def key(self, char: str) -> str:
+        if char in _STRINGS:
+            return self.string(char)
+        match = _IDENTIFIER.match(self.text, self.pos) or _NUMBER.match(self.text, self.pos)
+        if not match:
+            raise self.error("Expecting property name")
+        self.pos = match.end()
+        return match.group()
+
+    def value_after_colon(self) -> Any:
+        if self.skip_whitespace() != ":":
+            raise self.error("Expecting ':' delimiter")
+        self.pos += 1
+        return self.value()
+
+
+def parse_js_literal(text: str) -> Any:
+    """Parse a loose JavaScript literal, such as a callback payload, into Python.
+
+    Handles unquoted and single-quoted keys, single-quoted strings,
+    ``undefined``/``NaN`` (as None), inline functions (as None), trailing and
+    missing commas between containers, array holes, and ``$``-prefixed or
+    dotted-version numbers (as strings).
+
+    Args:
+        text: Literal text, e.g. ``{key: 'ds:5', hash: '13', data: [...]}``
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the text is not a literal this parser understands
+    """
+    parser = _Parser(text)
+    result = parser.value()
+    if parser.skip_whitespace():
+        raise parser.error("Extra data")
+    return result
@@ -0,0 +1,100 @@
+"""Pluggable JSON decoding backend.
+
+Parsers decode large batchexecute responses and dataset blocks through
+:func:`loads`, which delegates to the fastest available library: orjson,
+then msgspec, then the standard library. The choice is made at import from
+``Config.JSON_BACKEND`` and can be changed at runtime with :func:`set_backend`.
+
+Whatever the backend, input the fast library rejects is retried with the
+standard library, so results and errors (``json.JSONDecodeError``) match
+stdlib behavior.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _orjson_loads() -> Callable[[str], Any]:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_loads() -> Callable[[str], Any]:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+BACKENDS: Dict[str, Callable[[], Callable[[str], Any]]] = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": lambda: json.loads,
+}
+
+_backend = "json"
+_loads: Callable[[str], Any] = json.loads
+
+
+def set_backend(name: str = "auto") -> str:
+    """Select the library used by :func:`loads`.
+
+    Args:
+        name: ``"auto"`` (fastest installed), ``"orjson"``, ``"msgspec"`` or ``"json"``
+
+    Returns:
+        Name of the backend now in use; falls back to ``"json"`` when the
+        requested library is not installed
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    global _backend, _loads
+    if name != "auto" and name not in BACKENDS:
+        raise ValueError(f"JSON backend must be one of auto, {', '.join(BACKENDS)}")
+
+    candidates = list(BACKENDS) if name == "auto" else [name, "json"]
+    for candidate in candidates:
+        try:
+            _loads = BACKENDS[candidate]()
+        except ImportError:
+            if candidate == name:
+                logger.warning(Config.ERROR_MESSAGES["JSON_BACKEND_UNAVAILABLE"].format(backend=name))
+            continue
+        _backend = candidate
+        return _backend
+    return _backend
+
+
+def get_backend() -> str:
+    """Name of the backend currently used by :func:`loads`."""
+    return _backend
+
+
+def loads(text: str) -> Any:
+    """Decode a JSON document with the selected backend.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    try:
+        return _loads(text)
+    except ValueError:
+        if _loads is json.loads:
+            raise
+        # e.g. NaN or lone surrogates, which the fast libraries reject
+        return json.loads(text)
+
+
+set_backend(Config.JSON_BACKEND)
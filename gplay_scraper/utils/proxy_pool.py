@@ -0,0 +1,201 @@
+"""Proxy pool with rotation strategies, health scoring and ejection.
+
+Pass a :class:`ProxyPool` as ``proxies`` to a scraper to spread requests over
+several proxies. Every proxy gets its own token bucket, so throughput grows
+with the number of healthy proxies. Proxies that keep failing or get
+throttled are ejected for a probation period that doubles on each repeat.
+"""
+
+import time
+import zlib
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from ..config import Config
+from ..exceptions import RateLimitError
+from .rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class ProxyState:
+    """Health and load bookkeeping for one proxy in a pool.
+
+    Attributes:
+        url: Proxy URL
+        proxies: Scheme mapping passed to the session
+        bucket: Token bucket pacing requests through this proxy
+        score: Exponentially weighted success rate (1.0 is fully healthy)
+        in_flight: Requests currently using this proxy
+        requests: Completed requests
+        failures: Failed requests
+        consecutive_failures: Failures since the last success
+        ejections: Times ejected since the last success
+        total_ejections: Times ejected overall
+        ejected_until: Monotonic time the current ejection ends (0 if healthy)
+    """
+
+    def __init__(self, url: str, rate: Optional[float], burst: float):
+        """Initialize ProxyState for a healthy proxy."""
+        self.url = url
+        self.proxies = {"http": url, "https": url}
+        self.bucket = TokenBucket(rate, burst)
+        self.score = 1.0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.total_ejections = 0
+        self.ejected_until = 0.0
+
+    def is_available(self, now: float) -> bool:
+        """Check whether the proxy is not currently ejected."""
+        return now >= self.ejected_until
+
+    def to_dict(self, now: float) -> Dict:
+        """Summarize the proxy state for reporting."""
+        return {
+            "url": self.url,
+            "score": round(self.score, 3),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.total_ejections,
+            "ejected": not self.is_available(now),
+        }
+
+
+class ProxyPool:
+    """Set of proxies shared by one or more HTTP clients.
+
+    Strategies:
+        ``round_robin``: cycle through healthy proxies
+        ``least_loaded``: pick the proxy with the fewest requests in flight
+        ``sticky``: keep requests for the same app (or query) on the same
+        proxy; remapping only keys whose proxy got ejected
+
+    Args:
+        proxies: Proxy URLs
+        strategy: Rotation strategy
+        rate: Requests per second through each proxy (None uses RATE_LIMIT_DELAY)
+        burst: Burst size of each proxy's bucket
+        max_failures: Consecutive failures before a proxy is ejected
+        probation: Seconds a proxy is ejected for the first time
+        max_probation: Longest ejection in seconds
+    """
+
+    STRATEGIES = ("round_robin", "least_loaded", "sticky")
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        strategy: str = "round_robin",
+        rate: float = None,
+        burst: float = Config.RATE_LIMIT_BURST,
+        max_failures: int = Config.PROXY_MAX_FAILURES,
+        probation: float = Config.PROXY_PROBATION,
+        max_probation: float = Config.PROXY_MAX_PROBATION,
+    ):
+        """Initialize ProxyPool with the given proxies and strategy."""
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(self.STRATEGIES)}")
+        rate = rate or 1.0 / Config.RATE_LIMIT_DELAY
+        self.proxies: List[ProxyState] = [ProxyState(url, rate, burst) for url in dict.fromkeys(proxies)]
+        if not self.proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.probation = probation
+        self.max_probation = max_probation
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def acquire(self, key: str = None) -> ProxyState:
+        """Pick a proxy for a request and mark it in flight.
+
+        When every proxy is ejected the one whose probation ends first is
+        returned, so requests keep flowing at a reduced pace.
+
+        Args:
+            key: Sticky routing key (app ID, developer ID or query)
+
+        Returns:
+            Selected proxy; pass it back to :meth:`release` when done
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = [proxy for proxy in self.proxies if proxy.is_available(now)]
+            if not available:
+                proxy = min(self.proxies, key=lambda p: p.ejected_until)
+            elif self.strategy == "least_loaded":
+                proxy = min(available, key=lambda p: (p.in_flight, -p.score))
+            elif self.strategy == "sticky" and key is not None:
+                proxy = max(available, key=lambda p: zlib.crc32(f"{key}|{p.url}".encode()))
+            else:
+                proxy = self._round_robin(now)
+            proxy.in_flight += 1
+            return proxy
+
+    def _round_robin(self, now: float) -> ProxyState:
+        """Return the next available proxy in rotation (lock must be held)."""
+        for _ in range(len(self.proxies)):
+            proxy = self.proxies[self._next % len(self.proxies)]
+            self._next += 1
+            if proxy.is_available(now):
+                return proxy
+        return self.proxies[0]
+
+    def release(self, proxy: ProxyState, error: Exception = None) -> None:
+        """Record the outcome of a request made through ``proxy``.
+
+        Args:
+            proxy: Proxy returned by :meth:`acquire`
+            error: Exception the request failed with, or None on success
+        """
+        with self._lock:
+            now = time.monotonic()
+            proxy.in_flight = max(0, proxy.in_flight - 1)
+            proxy.requests += 1
+            proxy.score = 0.8 * proxy.score + (0.0 if error else 0.2)
+            if error is None:
+                proxy.consecutive_failures = 0
+                proxy.ejections = 0
+                return
+
+            proxy.failures += 1
+            proxy.consecutive_failures += 1
+            throttled = isinstance(error, RateLimitError)
+            # A proxy on probation gets one chance; otherwise allow a few failures
+            on_probation = proxy.ejections > 0
+            if not (throttled or on_probation or proxy.consecutive_failures >= self.max_failures):
+                return
+
+            duration = min(self.max_probation, self.probation * (2 ** proxy.ejections))
+            if throttled and error.retry_after:
+                duration = max(duration, error.retry_after)
+            proxy.ejections += 1
+            proxy.total_ejections += 1
+            proxy.ejected_until = now + duration
+        if throttled and error.retry_after:
+            proxy.bucket.pause(error.retry_after)
+        logger.warning(Config.ERROR_MESSAGES["PROXY_EJECTED"].format(proxy=proxy.url, seconds=duration, error=error))
+
+    def healthy_count(self) -> int:
+        """Number of proxies not currently ejected."""
+        now = time.monotonic()
+        return sum(1 for proxy in self.proxies if proxy.is_available(now))
+
+    def stats(self) -> List[Dict]:
+        """Return per-proxy health and load figures.
+
+        Returns:
+            List of dictionaries, one per proxy
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [proxy.to_dict(now) for proxy in self.proxies]
@@ -0,0 +1,319 @@
+"""Token bucket rate limiting shared by threads, tasks and clients.
+
+A :class:`RateLimiter` owns one :class:`TokenBucket` per scope key (a single
+global bucket, one per host, or one per proxy). Buckets hand out reservations
+under a lock and the caller sleeps outside it, so the same limiter works from
+threads (``acquire``) and asyncio tasks (``acquire_async``).
+
+An :class:`AdaptiveThrottle` adjusts a limiter's rate from server feedback:
+throttling responses, timeouts and slow responses cut it multiplicatively,
+healthy responses raise it additively (AIMD).
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket with burst capacity.
+
+    Attributes:
+        rate: Tokens added per second, or None for no limit
+        capacity: Maximum number of tokens (burst size)
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float = 1):
+        """Initialize TokenBucket with a full bucket."""
+        self._lock = threading.Lock()
+        self.rate = rate or None
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (lock must be held)."""
+        if self.rate:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return how long the caller must wait before using them.
+
+        Tokens may go negative, which queues later callers behind earlier ones.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait (0 if tokens were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            paused = max(0.0, self._resume_at - now)
+            if not self.rate:
+                return paused
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return paused
+            return max(paused, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block the current thread until tokens are available."""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=wait_time))
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """Wait without blocking the event loop until tokens are available."""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            logger.debug(Config.ERROR_MESSAGES["RATE_LIMIT_SLEEP"].format(sleep_time=wait_time))
+            await asyncio.sleep(wait_time)
+
+    def set_rate(self, rate: Optional[float], capacity: float = None) -> None:
+        """Change the refill rate (and optionally the burst size) at runtime.
+
+        Args:
+            rate: New tokens per second, or None/0 to disable limiting
+            capacity: New burst size, or None to keep the current one
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate or None
+            if capacity is not None:
+                self.capacity = max(1.0, float(capacity))
+            self._tokens = min(self._tokens, self.capacity)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new reservations for ``seconds`` (e.g. from Retry-After).
+
+        Later callers stay spaced out at the normal rate after the pause ends
+        instead of all resuming at once.
+
+        Args:
+            seconds: How long to pause
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.rate:
+                self._tokens = min(self._tokens, 1 - seconds * self.rate)
+            self._resume_at = max(self._resume_at, now + seconds)
+
+
+class RateLimiter:
+    """Token bucket rate limiter scoped globally, per host or per proxy.
+
+    One instance can be shared between several clients (including sync and
+    async ones) to enforce a single budget across all of them.
+
+    Args:
+        rate: Requests per second, or None for no limit
+        burst: Number of requests allowed back to back
+        scope: ``"global"``, ``"host"`` or ``"proxy"``
+    """
+
+    SCOPES = ("global", "host", "proxy")
+
+    def __init__(self, rate: Optional[float] = None, burst: float = Config.RATE_LIMIT_BURST, scope: str = Config.RATE_LIMIT_SCOPE):
+        """Initialize RateLimiter with the given rate, burst size and scope."""
+        if scope not in self.SCOPES:
+            raise ValueError(f"scope must be one of {', '.join(self.SCOPES)}")
+        self.scope = scope
+        self._rate = rate or None
+        self._burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current requests per second, or None if unlimited."""
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        """Current burst size."""
+        return self._burst
+
+    def _scope_key(self, url: str = None, proxy: str = None) -> str:
+        """Map a request to the bucket key for this limiter's scope."""
+        if self.scope == "host" and url:
+            return urlsplit(url).netloc
+        if self.scope == "proxy":
+            return proxy or ""
+        return ""
+
+    def bucket(self, url: str = None, proxy: str = None) -> TokenBucket:
+        """Get (or create) the bucket that governs a request.
+
+        Args:
+            url: Request URL (used by the ``host`` scope)
+            proxy: Proxy URL (used by the ``proxy`` scope)
+
+        Returns:
+            TokenBucket for the request's scope key
+        """
+        key = self._scope_key(url, proxy)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self._rate, self._burst)
+            return bucket
+
+    def acquire(self, url: str = None, proxy: str = None) -> None:
+        """Block until a request to ``url`` through ``proxy`` may be sent."""
+        self.bucket(url, proxy).acquire()
+
+    async def acquire_async(self, url: str = None, proxy: str = None) -> None:
+        """Await until a request to ``url`` through ``proxy`` may be sent."""
+        await self.bucket(url, proxy).acquire_async()
+
+    def pause(self, seconds: float, url: str = None, proxy: str = None) -> None:
+        """Pause the bucket governing ``url`` / ``proxy`` for ``seconds``."""
+        self.bucket(url, proxy).pause(seconds)
+
+    def set_rate(self, rate: Optional[float], burst: float = None) -> None:
+        """Change the rate (and optionally burst) of all current and future buckets.
+
+        Args:
+            rate: New requests per second, or None/0 to disable limiting
+            burst: New burst size, or None to keep the current one
+        """
+        with self._lock:
+            self._rate = rate or None
+            if burst is not None:
+                self._burst = burst
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.set_rate(self._rate, burst)
+
+
+class AdaptiveThrottle:
+    """AIMD controller that tunes a :class:`RateLimiter` from responses.
+
+    Throttling responses (429/503), timeouts and responses slower than
+    ``latency_target`` multiply the rate by ``decrease``; at most one decrease
+    happens per ``cooldown`` seconds so a burst of failures from one congestion
+    event only counts once. Every healthy response adds ``increase`` requests
+    per second, up to ``max_rate``. By default ``max_rate`` is the limiter's
+    rate when the throttle is built, so recovery never exceeds the configured
+    rate; pass a higher ``max_rate`` to let it.
+
+    Args:
+        limiter: Rate limiter to control
+        min_rate: Lowest rate backoff may reach
+        max_rate: Highest rate recovery may reach (None for the limiter's current rate)
+        increase: Requests per second added per healthy response
+        decrease: Multiplier applied to the rate on congestion
+        latency_target: Latency in seconds above which a response counts as congestion
+        cooldown: Minimum seconds between two decreases
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        min_rate: float = Config.THROTTLE_MIN_RATE,
+        max_rate: Optional[float] = Config.THROTTLE_MAX_RATE,
+        increase: float = Config.THROTTLE_INCREASE,
+        decrease: float = Config.THROTTLE_DECREASE,
+        latency_target: float = Config.THROTTLE_LATENCY_TARGET,
+        cooldown: float = Config.THROTTLE_COOLDOWN,
+    ):
+        """Initialize AdaptiveThrottle for the given limiter."""
+        self.limiter = limiter
+        self.min_rate = min_rate
+        self.max_rate = limiter.rate if max_rate is None else max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._last_decrease = float("-inf")
+        self._metrics = {
+            "throttled": 0,
+            "timeouts": 0,
+            "slow_responses": 0,
+            "rate_decreases": 0,
+            "rate_increases": 0,
+            "pauses": 0,
+            "paused_seconds": 0.0,
+        }
+
+    def on_success(self, latency: float) -> None:
+        """Record a healthy response and raise the rate additively.
+
+        Args:
+            latency: Response time in seconds
+        """
+        if self.latency_target and latency > self.latency_target:
+            with self._lock:
+                self._metrics["slow_responses"] += 1
+            self._decrease("slow response")
+            return
+        with self._lock:
+            rate = self.limiter.rate
+            if rate is None or (self.max_rate is not None and rate >= self.max_rate):
+                return
+            new_rate = rate + self.increase
+            self.limiter.set_rate(new_rate if self.max_rate is None else min(self.max_rate, new_rate))
+            self._metrics["rate_increases"] += 1
+
+    def on_throttle(self, retry_after: float = None, url: str = None, proxy: str = None) -> None:
+        """Record a throttling response, honouring its Retry-After delay.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if any
+            url: Request URL (selects the bucket to pause)
+            proxy: Proxy URL (selects the bucket to pause)
+        """
+        with self._lock:
+            self._metrics["throttled"] += 1
+            if retry_after:
+                self._metrics["pauses"] += 1
+                self._metrics["paused_seconds"] += retry_after
+        if retry_after:
+            self.limiter.pause(retry_after, url, proxy)
+        self._decrease("throttled")
+
+    def on_timeout(self) -> None:
+        """Record a timed out request."""
+        with self._lock:
+            self._metrics["timeouts"] += 1
+        self._decrease("timeout")
+
+    def _decrease(self, reason: str) -> None:
+        """Cut the rate multiplicatively unless still cooling down."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            rate = self.limiter.rate or self.max_rate or 1.0 / Config.RATE_LIMIT_DELAY
+            new_rate = max(self.min_rate, rate * self.decrease)
+            if self.limiter.rate is not None and new_rate >= rate:
+                return
+            self._last_decrease = now
+            self.limiter.set_rate(new_rate)
+            self._metrics["rate_decreases"] += 1
+        logger.warning(Config.ERROR_MESSAGES["THROTTLE_BACKOFF"].format(rate=new_rate, reason=reason))
+
+    def metrics(self) -> Dict[str, float]:
+        """Return backoff counters and the current request rate.
+
+        Returns:
+            Dictionary of throttling counters plus ``current_rate``
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["current_rate"] = self.limiter.rate
+        return metrics
@@ -0,0 +1,110 @@
+"""Declarative retry policies for request plans.
+
+A :class:`RetryPolicy` decides whether a failed attempt is retried and how
+long to wait first. The HTTP clients look up a policy per endpoint (see
+``Config.RETRY_POLICIES``) and apply it around every request plan.
+"""
+
+import random
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from ..config import Config
+from ..exceptions import RateLimitError
+
+
+class RetryPolicy:
+    """Retry settings for one endpoint.
+
+    Attempts are spaced with exponential backoff and full jitter: the n-th
+    retry waits a random time between 0 and ``min(backoff_max,
+    backoff_base * 2 ** (n - 1))`` seconds, or at least the server's
+    Retry-After when throttled.
+
+    Args:
+        max_attempts: Total attempts including the first one
+        backoff_base: Backoff ceiling for the first retry in seconds
+        backoff_max: Largest backoff ceiling in seconds
+        jitter: Randomize delays to avoid synchronized retries
+        deadline: Give up once this many seconds have passed, or None
+        retry_statuses: HTTP status codes worth retrying
+        retry_exceptions: Transport exception types worth retrying
+        retry_curl_codes: curl error codes worth retrying; curl_cffi raises
+            every transport failure as an ``OSError``, so DNS, certificate
+            and malformed URL errors are told apart from transient ones by code
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        jitter: bool = True,
+        deadline: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = Config.RETRY_STATUS_CODES,
+        retry_exceptions: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError, asyncio.TimeoutError),
+        retry_curl_codes: Iterable[int] = Config.RETRY_CURL_CODES,
+    ):
+        """Initialize RetryPolicy with attempt, backoff and deadline limits."""
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.retry_curl_codes = frozenset(retry_curl_codes)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Check whether a failed attempt is worth retrying.
+
+        Args:
+            error: Exception raised by the attempt
+
+        Returns:
+            True for throttling, retryable HTTP statuses and transport errors
+        """
+        if isinstance(error, RateLimitError):
+            return True
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code is not None:
+            return status_code in self.retry_statuses
+        if isinstance(error, self.retry_exceptions):
+            return True
+        return isinstance(error, OSError) and getattr(error, "code", None) in self.retry_curl_codes
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before the retry that follows ``attempt`` (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def next_delay(self, attempt: int, error: Exception, elapsed: float) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Number of attempts made so far
+            error: Exception raised by the last attempt
+            elapsed: Seconds since the first attempt started
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.backoff(attempt)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    @classmethod
+    def from_config(cls) -> Dict[str, "RetryPolicy"]:
+        """Build the per-endpoint policies declared in ``Config.RETRY_POLICIES``.
+
+        Returns:
+            Mapping of endpoint name to policy; ``"default"`` covers the rest
+        """
+        return {endpoint: cls(**settings) for endpoint, settings in Config.RETRY_POLICIES.items()}
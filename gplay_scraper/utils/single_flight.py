@@ -0,0 +1,109 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+While a call for a key is running, later callers with the same key wait for
+it and share its result (or exception) instead of starting their own. Once
+the call finishes the key is forgotten, so this never serves stale data.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """Result slot for one in-flight call."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key.
+
+    ``do`` serves threads and ``do_async`` serves asyncio tasks; a client uses
+    one or the other.
+
+    Attributes:
+        coalesced: Number of calls that were served by another call's result
+    """
+
+    def __init__(self):
+        """Initialize SingleFlight with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Canonical request key
+            fn: Function performing the request
+
+        Returns:
+            Result of the call that ran for ``key``
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Canonical request key
+            fn: Coroutine function performing the request
+
+        Returns:
+            Result of the call that ran for ``key``
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = asyncio.get_running_loop().create_future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            # Shield so one cancelled follower does not cancel the shared call
+            return await asyncio.shield(future)
+
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody was waiting
+            raise
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
@@ -1,8 +1,9 @@
 import unittest
 import warnings
 import time
+from unittest import mock
 from gplay_scraper import GPlayScraper
-from gplay_scraper.exceptions import GPlayScraperError, NetworkError, RateLimitError
+from gplay_scraper.exceptions import GPlayScraperError, NetworkError, RateLimitError, AppNotFoundError
 
 
 class TestAppMethods(unittest.TestCase):
@@ -60,5 +61,88 @@ class TestAppMethods(unittest.TestCase):
             warnings.warn(f"Network/Rate limit error in test_app_get_fields: {e}")
             self.skipTest(f"Skipping due to network/rate limit: {e}")
     
+    def test_app_analyze_many_yields_per_item_results(self):
+        """Test app_analyze_many keeps going past failed items (no network)"""
+        scraper = GPlayScraper()
+        
+        def fake_analyze(app_id, lang, country, assets):
+            if app_id == "missing.app":
+                raise AppNotFoundError(app_id)
+            return {"appId": app_id}
+        
+        scraper.app_methods.app_analyze = fake_analyze
+        app_ids = ["com.a", "missing.app", "com.b", "com.c"]
+        results = dict(scraper.app_analyze_many(app_ids, max_workers=2, rate=1000))
+        
+        self.assertEqual(set(results), set(app_ids))
+        self.assertIsInstance(results["missing.app"], AppNotFoundError)
+        self.assertEqual(results["com.b"], {"appId": "com.b"})
+
+        # rate= paces the batch on its own bucket; the shared limiter is never changed
+        rate_limiter = scraper.app_methods.scraper.http_client.rate_limiter
+        shared_rate = rate_limiter.rate
+        abandoned = scraper.app_analyze_many(app_ids, max_workers=1, rate=1000)
+        next(abandoned)
+        abandoned.close()
+        self.assertEqual(rate_limiter.rate, shared_rate)
+
+        for max_workers in (0, -1):
+            with self.assertRaises(ValueError):
+                scraper.app_analyze_many(app_ids, max_workers=max_workers)
+        self.assertEqual(scraper.http_client.rate_limit_delay, 1.0)
+
+    def test_app_analyze_include_similar_reuses_app_page(self):
+        """Test include_similar fetches the app page once plus the cluster page (no network)"""
+        scraper = GPlayScraper()
+        methods = scraper.app_methods
+        client = scraper.http_client
+        page = '<a href="/store/apps/collection/cluster?gsr=abc">Similar</a>'
+        with mock.patch.object(client, "fetch_app_page", return_value=page) as fetch_page, \
+                mock.patch.object(client, "fetch_cluster_page", return_value="cluster") as fetch_cluster, \
+                mock.patch.object(methods.scraper, "parse_app_page", return_value={"ds:5": []}), \
+                mock.patch.object(methods.parser, "parse_app_data", return_value={}), \
+                mock.patch.object(methods.parser, "format_app_data", return_value={"title": "Example"}), \
+                mock.patch.object(methods.similar_scraper, "parse_cluster_page", return_value={"ds:3": []}), \
+                mock.patch.object(methods.similar_parser, "parse_similar_data", return_value=[{"appId": "a"}, {"appId": "b"}]):
+            result = scraper.app_analyze("com.example", include_similar=True, similar_count=1)
+
+        self.assertEqual(result, {"title": "Example", "similarApps": [{"appId": "a"}]})
+        fetch_page.assert_called_once()
+        fetch_cluster.assert_called_once_with("/store/apps/collection/cluster?gsr=abc", "en", "us")
+
+    def test_app_get_fields_extracts_only_requested_fields(self):
+        """Test price fields skip other specs and the release date fallback (no network)"""
+        scraper = GPlayScraper()
+        methods = scraper.app_methods
+        fields = ["price", "sale", "originalPrice"]
+        with mock.patch.object(methods.scraper, "fetch_playstore_page", return_value="<html></html>"), \
+                mock.patch.object(methods.scraper, "parse_app_page", return_value={"ds:5": '{"data": []}'}), \
+                mock.patch.object(methods.scraper, "fetch_fallback_data") as fetch_fallback:
+            result = scraper.app_get_fields("com.example", fields)
+            self.assertEqual(list(result), fields)
+            fetch_fallback.assert_not_called()
+
+            scraper.app_get_fields("com.example", ["dailyInstalls"])
+            fetch_fallback.assert_called_once_with("com.example")
+
+    def test_parse_app_data_computes_requested_metrics_only(self):
+        """Test derived install metrics are computed only when requested"""
+        parser = GPlayScraper().app_methods.parser
+        layout = parser.record_layout(["monthlyInstalls"])
+        self.assertEqual(layout, {"monthlyInstalls": None, "released": "released", "installs": "installs"})
+        details = {"minDailyInstalls": None, "released": "Jan 1, 2020", "minInstalls": 1000}
+        parser.compute_install_metrics(details)
+        self.assertEqual(set(details), {"released", "minInstalls", "minDailyInstalls"})
+        self.assertIsInstance(details["minDailyInstalls"], int)
+        self.assertEqual(parser.format_app_data(details, ["minDailyInstalls", "bogus"])["bogus"], None)
+
+    def test_parse_app_data_builds_final_record(self):
+        """Test parse_app_data returns final field names in output order"""
+        parser = GPlayScraper().app_methods.parser
+        record = parser.parse_app_data({"ds:5": '{"data": []}'}, "com.example")
+        self.assertEqual(list(record), list(parser.FIELDS))
+        self.assertEqual(record["appId"], "com.example")
+        self.assertIs(parser.format_app_data(record), record)
+
 if __name__ == '__main__':
     unittest.main()
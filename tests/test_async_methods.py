@@ -0,0 +1,229 @@
+"""
+Unit tests for AsyncGPlayScraper
+"""
+
+import asyncio
+import inspect
+import json
+import unittest
+from gplay_scraper import AsyncGPlayScraper, GPlayScraper
+from gplay_scraper.exceptions import AppNotFoundError
+
+
+class FakeResponse:
+    """Minimal response object returned by the fake async session."""
+
+    def __init__(self, text):
+        self.text = text
+        self.infos = {}
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeAsyncSession:
+    """Async session stub returning canned suggestion responses."""
+
+    def __init__(self):
+        self.proxies = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def post(self, url, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        payload = json.dumps([[[["fitness app"], ["fitness tracker"]]]])
+        return FakeResponse(")]}'\n" + json.dumps([["wrb.fr", "IJ4APc", payload]]))
+
+    get = post
+
+    async def close(self):
+        pass
+
+
+class FakeAppSession(FakeAsyncSession):
+    """Async session stub returning a minimal app details page."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    async def get(self, url, **kwargs):
+        self.urls.append(url)
+        data = json.dumps([None, [None, None, [["Example App"]]]])
+        return FakeResponse(f"<script>AF_initDataCallback({{key: 'ds:5', hash: '1', data:{data}, sideChannel: {{}}}});</script>")
+
+
+class TestAsyncMethods(unittest.TestCase):
+    """Tests that don't require network access."""
+
+    def test_mirrors_public_methods(self):
+        """Every public GPlayScraper method has a coroutine counterpart."""
+        scraper = AsyncGPlayScraper()
+        for name in dir(GPlayScraper):
+            if name.startswith(("app_", "search_", "reviews_", "developer_", "similar_", "list_", "suggest_")):
+                method = getattr(scraper, name)
+                if name.endswith(("_iter", "_many")):
+                    argument = ["com.example"] if name.endswith("_many") else "com.example"
+                    self.assertTrue(hasattr(method(argument), "__aiter__"), name)
+                    continue
+                self.assertTrue(inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method), name)
+        asyncio.run(scraper.close())
+
+    def test_concurrent_requests_are_bounded(self):
+        """Nested suggestions run concurrently up to max_concurrency."""
+        async def run():
+            async with AsyncGPlayScraper(max_concurrency=2, rate_limit_delay=0.001) as scraper:
+                session = FakeAsyncSession()
+                scraper.http_client.session = session
+                result = await scraper.suggest_nested("fitness", count=2)
+                return result, session
+
+        result, session = asyncio.run(run())
+        self.assertEqual(list(result), ["fitness app", "fitness tracker"])
+        self.assertEqual(result["fitness app"], ["fitness app", "fitness tracker"])
+        self.assertLessEqual(session.max_in_flight, 2)
+
+
+    def test_app_analyze_many_yields_per_item_results(self):
+        """Bulk analysis yields failures per item instead of aborting."""
+        async def fake_analyze(app_id, lang, country, assets):
+            if app_id == "missing.app":
+                raise AppNotFoundError(app_id)
+            return {"appId": app_id}
+
+        async def run():
+            async with AsyncGPlayScraper() as scraper:
+                scraper.app_methods.app_analyze = fake_analyze
+                return {app_id: result async for app_id, result in
+                        scraper.app_analyze_many(["com.a", "missing.app", "com.b"], max_workers=1, rate=1000)}
+
+        results = asyncio.run(run())
+        self.assertEqual(results["com.a"], {"appId": "com.a"})
+        self.assertIsInstance(results["missing.app"], AppNotFoundError)
+        self.assertEqual(len(results), 3)
+        with self.assertRaises(ValueError):
+            AsyncGPlayScraper().app_analyze_many(["com.a"], max_workers=0)
+
+    def test_app_analyze_and_get_fields(self):
+        """App pages are parsed into final records, with the release date fallback awaited."""
+        async def run():
+            async with AsyncGPlayScraper() as scraper:
+                session = FakeAppSession()
+                scraper.http_client.session = session
+                app = await scraper.app_analyze("com.example")
+                fields = await scraper.app_get_fields("com.example", ["title", "score"])
+                title = await scraper.app_get_field("com.example", "title")
+                return app, fields, title, session.urls
+
+        app, fields, title, urls = asyncio.run(run())
+        self.assertEqual((app["title"], app["appId"]), ("Example App", "com.example"))
+        self.assertIn("dailyInstalls", app)
+        self.assertEqual(fields, {"title": "Example App", "score": None})
+        self.assertEqual(title, "Example App")
+        # Only app_analyze needs the release date, so only it makes the fallback request
+        self.assertEqual(len(urls), 4)
+
+    def test_reviews_iter_fetches_batches_on_demand(self):
+        """Reviews are yielded batch by batch with the continuation token exposed."""
+        def batch(review_ids, token):
+            reviews = [[review_id, ["User", None], 5, None, "Great", [1700000000, 0], 3] for review_id in review_ids]
+            inner = json.dumps([reviews, [None, token], None])
+            return ")]}'\n\n" + json.dumps([["wrb.fr", "UsvDTd", inner]])
+
+        responses = {None: batch(["a", "b"], "t1"), "t1": batch(["c"], None)}
+
+        async def run():
+            async with AsyncGPlayScraper() as scraper:
+                calls = []
+
+                async def fetch_reviews_batch(app_id, lang, country, sort, count, token):
+                    calls.append(token)
+                    return responses[token]
+
+                scraper.http_client.fetch_reviews_batch = fetch_reviews_batch
+                reviews = scraper.reviews_iter("com.example", sort="NEWEST")
+                first = await reviews.__anext__()
+                state = (first["reviewId"], reviews.token, list(calls))
+                rest = [review["reviewId"] async for review in reviews]
+                return state, rest, reviews.token, calls
+
+        state, rest, token, calls = asyncio.run(run())
+        self.assertEqual(state, ("a", None, [None]))
+        self.assertEqual(rest, ["b", "c"])
+        self.assertIsNone(token)
+        self.assertEqual(calls, [None, "t1"])
+
+        async def run_prefetched():
+            async with AsyncGPlayScraper() as scraper:
+                calls = []
+
+                async def fetch_reviews_batch(app_id, lang, country, sort, count, token):
+                    calls.append(token)
+                    return responses[token]
+
+                scraper.http_client.fetch_reviews_batch = fetch_reviews_batch
+                reviews = scraper.reviews_iter("com.example", prefetch=True)
+                await reviews.__anext__()
+                state = list(calls)
+                rest = [review["reviewId"] async for review in reviews]
+                return state, rest
+
+        state, rest = asyncio.run(run_prefetched())
+        self.assertEqual(state, [None, "t1"])
+        self.assertEqual(rest, ["b", "c"])
+
+    def test_reviews_iter_cancels_prefetch_when_stopped_early(self):
+        """Breaking out of a prefetching iterator cancels the batch in flight."""
+        first = ")]}'\n\n" + json.dumps([["wrb.fr", "UsvDTd", json.dumps([
+            [[review_id, ["User", None], 5, None, "Great", [1700000000, 0], 3] for review_id in ["a", "b"]],
+            [None, "t1"], None
+        ])]])
+
+        async def run():
+            async with AsyncGPlayScraper() as scraper:
+                started = asyncio.Event()
+                cancelled = []
+
+                async def fetch_reviews_batch(app_id, lang, country, sort, count, token):
+                    if token is None:
+                        return first
+                    started.set()
+                    try:
+                        await asyncio.sleep(60)
+                    except asyncio.CancelledError:
+                        cancelled.append(token)
+                        raise
+
+                scraper.http_client.fetch_reviews_batch = fetch_reviews_batch
+                async with scraper.reviews_iter("com.example", prefetch=True) as reviews:
+                    async for review in reviews:
+                        await started.wait()
+                        break
+                return review["reviewId"], cancelled, reviews._pending
+
+        review_id, cancelled, pending = asyncio.run(asyncio.wait_for(run(), 5))
+        self.assertEqual(review_id, "a")
+        self.assertEqual(cancelled, ["t1"])
+        self.assertIsNone(pending)
+
+    def test_identical_concurrent_requests_are_coalesced(self):
+        """Identical suggestion requests in flight share one POST."""
+        async def run():
+            async with AsyncGPlayScraper(rate_limit_delay=0.001) as scraper:
+                session = FakeAsyncSession()
+                scraper.http_client.session = session
+                results = await asyncio.gather(*(scraper.suggest_analyze("fitness") for _ in range(4)))
+                return results, session, scraper.get_connection_stats()
+
+        results, session, stats = asyncio.run(run())
+        self.assertEqual(results[0], ["fitness app", "fitness tracker"])
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(session.max_in_flight, 1)
+        self.assertEqual(stats["coalesced_requests"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from gplay_scraper import GPlayScraper, ResponseCache, SQLiteCache
+
+
+class FakeResponse:
+    """Minimal successful response."""
+
+    def __init__(self, text, status_code=200, headers=None):
+        self.infos = {}
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class CountingSession:
+    """Session stub returning a numbered body per request."""
+
+    def __init__(self):
+        self.proxies = {}
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(f"body-{self.calls}")
+
+    post = get
+
+
+class ValidatingSession(CountingSession):
+    """Session stub that honours If-None-Match like an ETag-aware server."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent_headers = []
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        self.sent_headers.append(kwargs["headers"])
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            return FakeResponse("", status_code=304)
+        return FakeResponse("<html>full page</html>", headers={"ETag": '"v1"'})
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "1", "app")
+        cache.set("b", "2", "app")
+        cache.get("a")
+        cache.set("c", "3", "app")
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_per_endpoint_ttl(self):
+        """Test entries expire after their endpoint TTL and TTL 0 skips caching"""
+        cache = ResponseCache(ttls={"list": 60, "suggest": 0})
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0):
+            cache.set("chart", "top", "list")
+            cache.set("page", "html", "app")
+            cache.set("term", "ideas", "suggest")
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0 + 120):
+            self.assertIsNone(cache.get("chart"))
+            self.assertEqual(cache.get("page"), "html")
+        self.assertIsNone(cache.get("term"))
+        self.assertEqual(len(cache), 1)  # the expired chart had no validators, so it was dropped
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertAlmostEqual(stats["hit_ratio"], 1 / 3)
+
+    def test_scraper_serves_repeat_fetches_from_cache(self):
+        """Test GPlayScraper(cache=True) downloads a page only once"""
+        scraper = GPlayScraper(cache=True)
+        client = scraper.http_client
+        client.rate_limit_delay = 0.001
+        client.session = CountingSession()
+
+        self.assertEqual(client.fetch_app_page("com.example"), "body-1")
+        self.assertEqual(client.fetch_app_page("com.example"), "body-1")
+        self.assertEqual(client.fetch_app_page("com.example", lang="de"), "body-2")
+        self.assertEqual(client.session.calls, 2)
+
+        stats = scraper.get_connection_stats()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["cache_misses"], 2)
+
+    def test_empty_cache_instance_is_used(self):
+        """Test an explicitly passed (still empty) cache is kept"""
+        cache = ResponseCache()
+        self.assertIs(GPlayScraper(cache=cache).http_client.cache, cache)
+        self.assertIsNone(GPlayScraper().http_client.cache)
+
+
+    def test_stale_entry_is_revalidated_with_etag(self):
+        """Test an expired page is revalidated and a 304 counts as a hit with bytes saved"""
+        cache = ResponseCache(ttls={"app": 60})
+        scraper = GPlayScraper(cache=cache)
+        client = scraper.http_client
+        client.rate_limit_delay = 0.001
+        client.session = ValidatingSession()
+
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0):
+            self.assertEqual(client.fetch_app_page("com.example"), "<html>full page</html>")
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0 + 120):
+            self.assertEqual(client.fetch_app_page("com.example"), "<html>full page</html>")
+            self.assertEqual(client.fetch_app_page("com.example"), "<html>full page</html>")  # renewed
+
+        self.assertEqual(client.session.calls, 2)
+        self.assertEqual(client.session.sent_headers[1]["If-None-Match"], '"v1"')
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual(stats["revalidations"], 1)
+        self.assertEqual(stats["bytes_saved"], len("<html>full page</html>"))
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_entries_survive_reopen(self):
+        """Test a second cache instance (e.g. another process) sees stored bodies"""
+        cache = SQLiteCache(self.path)
+        cache.set("page", "<html>" * 1000, "app")
+        cache.close()
+
+        reopened = SQLiteCache(self.path)
+        self.assertEqual(reopened.get("page"), "<html>" * 1000)
+        self.assertLess(reopened.size_bytes(), len("<html>" * 1000))  # stored compressed
+        reopened.close()
+
+    def test_prune_expired_and_size_cap(self):
+        """Test prune drops expired entries and evicts down to max_bytes"""
+        cache = SQLiteCache(self.path, ttls={"list": 60}, max_bytes=1)
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0):
+            cache.set("chart", "top", "list")
+            cache.set("page-a", "a", "app")
+            cache.set("page-b", "b", "app")
+        self.assertEqual(len(cache), 3)
+        with mock.patch("gplay_scraper.utils.cache.time.time", return_value=1000.0 + 120):
+            cache.prune()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["evictions"], 2)
+        cache.vacuum()
+        cache.close()
+
+    def test_prune_interval_counts_writes_from_all_threads(self):
+        """Test concurrent writers trigger one prune per prune_interval writes"""
+        cache = SQLiteCache(self.path, prune_interval=10)
+
+        def write(thread):
+            for index in range(25):
+                cache.set(f"page-{thread}-{index}", "x", "app")
+
+        with mock.patch.object(cache, "prune") as prune:
+            threads = [threading.Thread(target=write, args=(thread,)) for thread in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(prune.call_count, 20)
+        cache.close()
+
+    def test_validators_persist(self):
+        """Test ETag and Last-Modified are stored alongside the body"""
+        cache = SQLiteCache(self.path)
+        cache.set("page", "<html>", "app", etag='"abc"', last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+        entry = cache.lookup("page")
+        self.assertEqual(entry.conditional_headers(), {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        })
+        cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
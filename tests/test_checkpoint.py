@@ -0,0 +1,89 @@
+"""
+Unit tests for review crawl checkpoints
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from gplay_scraper import GPlayScraper, FileCheckpointStore, SQLiteCheckpointStore
+from gplay_scraper.utils.checkpoint import ReviewsCheckpoint
+
+
+def batch_response(review_ids, token):
+    """Build a reviews batchexecute response as the API returns it."""
+    reviews = [[review_id, ["User", None], 5, None, "Great", [1700000000, 0], 3] for review_id in review_ids]
+    inner = json.dumps([reviews, [None, token], None])
+    return ")]}'\n\n" + json.dumps([["wrb.fr", "UsvDTd", inner, None, None, None, "generic"]])
+
+
+class TestCheckpointStores(unittest.TestCase):
+    """Test suite for checkpoint storage backends."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def stores(self):
+        sqlite_store = SQLiteCheckpointStore(os.path.join(self.tmpdir.name, "checkpoints.sqlite3"))
+        self.addCleanup(sqlite_store.close)
+        return [FileCheckpointStore(os.path.join(self.tmpdir.name, "checkpoints.json")), sqlite_store]
+
+    def test_round_trip(self):
+        """Test checkpoints are saved, replaced, reloaded and deleted"""
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                self.assertIsNone(store.load("com.example", 2, "en", "us"))
+                store.save(ReviewsCheckpoint("com.example", 2, "en", "us", "t1", 100))
+                store.save(ReviewsCheckpoint("com.example", 2, "en", "us", "t2", 200))
+                store.save(ReviewsCheckpoint("com.example", 1, "en", "us", "r1", 100))
+                self.assertEqual(len(store), 2)
+
+                reopened = type(store)(store.path)
+                checkpoint = reopened.load("com.example", 2, "en", "us")
+                self.assertEqual((checkpoint.token, checkpoint.seen), ("t2", 200))
+
+                store.delete("com.example", 2, "en", "us")
+                self.assertIsNone(store.load("com.example", 2, "en", "us"))
+                store.clear()
+                self.assertEqual(len(store), 0)
+
+    def test_interrupted_crawl_resumes(self):
+        """Test a crawl resumes from its checkpoint and removes it when done (no network)"""
+        store = FileCheckpointStore(os.path.join(self.tmpdir.name, "checkpoints.json"))
+        scraper = GPlayScraper()
+        fetch = mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch")
+
+        with fetch as first_run:
+            first_run.side_effect = [batch_response(["a", "b"], "t1"), batch_response(["c", "d"], "t2")]
+            reviews = scraper.reviews_iter("com.example", batch_size=2, checkpoint=store)
+            self.assertEqual([next(reviews)["reviewId"] for _ in range(3)], ["a", "b", "c"])
+        checkpoint = store.load("com.example", 2, "en", "us")
+        self.assertEqual((checkpoint.token, checkpoint.seen), ("t1", 2))
+
+        with fetch as second_run:
+            second_run.side_effect = [batch_response(["c", "d"], "t2"), batch_response(["e"], None)]
+            resumed = scraper.reviews_analyze("com.example", count=10, checkpoint=store)
+        self.assertEqual([review["reviewId"] for review in resumed], ["c", "d", "e"])
+        self.assertEqual(second_run.call_args_list[0].args[-1], "t1")
+        self.assertIsNone(store.load("com.example", 2, "en", "us"))
+
+    def test_explicit_resume_token(self):
+        """Test resume_token starts the crawl from the given page (no network)"""
+        scraper = GPlayScraper()
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               return_value=batch_response(["x"], None)) as fetch:
+            reviews = scraper.reviews_analyze("com.example", count=5, resume_token="saved")
+        self.assertEqual([review["reviewId"] for review in reviews], ["x"])
+        self.assertEqual(fetch.call_args.args[-1], "saved")
+
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               return_value=batch_response(["x"], None)) as fetch:
+            review_ids = scraper.reviews_get_field("com.example", "reviewId", count=5, resume_token="saved", batch_size=5)
+        self.assertEqual(review_ids, ["x"])
+        self.assertEqual(fetch.call_args.args[-2:], (5, "saved"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from gplay_scraper.models import element_specs
+from gplay_scraper.models.element_specs import ElementSpec, ElementSpecs, compile_specs
+
+
+def build_source(specs, leaf):
+    """Build a nested list in which every spec path resolves to ``leaf``."""
+    root = []
+    for spec in specs.values():
+        node = root
+        for depth, key in enumerate(spec.data_map):
+            if isinstance(key, str):
+                break
+            node.extend([None] * (key + 1 - len(node)))
+            if depth == len(spec.data_map) - 1:
+                node[key] = leaf if node[key] is None else node[key]
+            else:
+                if not isinstance(node[key], list):
+                    node[key] = []
+                node = node[key]
+    return root
+
+
+class TestCompiledSpecs(unittest.TestCase):
+
+    def assertMatchesSpecs(self, specs, source):
+        expected = {key: spec.extract_content(source) for key, spec in specs.items()}
+        self.assertEqual(list(compile_specs(specs)(source).items()), list(expected.items()))
+
+    def test_tables_match_extract_content(self):
+        """Test every compiled table returns what extract_content returns"""
+        for name in ("App", "Search", "Review", "Developer", "Similar", "List"):
+            specs = getattr(ElementSpecs, name)
+            with self.subTest(table=name):
+                for leaf in (12000000, 0, "text", None):
+                    self.assertMatchesSpecs(specs, build_source(specs, leaf))
+                for source in (None, [], "abc", {"x": 1}):
+                    self.assertMatchesSpecs(specs, source)
+
+    def test_post_processor_errors_and_fallbacks(self):
+        """Test failing post-processors keep the raw value and fallbacks chain"""
+        specs = {
+            "raw": ElementSpec(None, [0], lambda value: value["missing"]),
+            "chained": ElementSpec(None, [5], fallback_value=ElementSpec(None, [1, 0], fallback_value="default")),
+            "constant": ElementSpec(None, [9], bool, False),
+        }
+        extract = compile_specs(specs)
+        self.assertEqual(extract([[1], ["second"]]), {"raw": [1], "chained": "second", "constant": False})
+        self.assertEqual(extract([]), {"raw": None, "chained": "default", "constant": False})
+
+    def test_recompiles_when_table_changes(self):
+        """Test adding a spec to a table is picked up on the next call"""
+        specs = {"first": ElementSpec(None, [0])}
+        self.assertIs(compile_specs(specs), compile_specs(specs))
+        specs["second"] = ElementSpec(None, [1])
+        self.assertEqual(compile_specs(specs)(["a", "b"]), {"first": "a", "second": "b"})
+
+    def test_field_projection(self):
+        """Test only the selected keys are extracted, in table order"""
+        specs = {
+            "first": ElementSpec(None, [0]),
+            "broken": ElementSpec(None, [1], lambda value: 1 / 0),
+            "third": ElementSpec(None, [2], str.upper),
+        }
+        extract = compile_specs(specs, ["third", "first", "unknown"])
+        self.assertEqual(list(extract(["a", "b", "c"]).items()), [("first", "a"), ("third", "C")])
+        self.assertEqual(compile_specs(specs, [])(["a"]), {})
+        self.assertEqual(len(compile_specs(specs)(["a"])), 3)
+
+    def test_compiled_cache_is_bounded(self):
+        """Test many distinct projections do not grow the extractor cache without limit"""
+        specs = {f"field{index}": ElementSpec(None, [index]) for index in range(9)}
+        for mask in range(1, 2 ** 9):
+            compile_specs(specs, [key for index, key in enumerate(specs) if mask >> index & 1])
+        self.assertLessEqual(len(element_specs._COMPILED), element_specs._COMPILED_MAX_SIZE)
+        self.assertIs(compile_specs(specs, ["field0"]), compile_specs(specs, ["field0"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
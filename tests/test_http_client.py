@@ -0,0 +1,189 @@
+"""
+Unit tests for the shared HTTP client
+"""
+
+import threading
+import time
+import unittest
+from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError, DNSError, Timeout as CurlTimeout
+from gplay_scraper import GPlayScraper, RetryPolicy
+from gplay_scraper.exceptions import NetworkError, RateLimitError
+from gplay_scraper.utils.http_client import HttpClient
+
+
+class FakeResponse:
+    """Minimal response object exposing curl connection info."""
+
+    def __init__(self, infos, text="ok", status_code=200, headers=None):
+        self.infos = infos
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Session stub returning one new connection followed by reused ones."""
+
+    def __init__(self, info_key):
+        self.info_key = info_key
+        self.calls = 0
+        self.proxies = {}
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse({self.info_key: 1 if self.calls == 1 else 0})
+
+    post = get
+
+
+class TestHttpClient(unittest.TestCase):
+    """Tests that don't require network access."""
+
+    def test_method_groups_share_one_client(self):
+        """All method groups use the scraper's pooled client."""
+        scraper = GPlayScraper(max_connections=4)
+        clients = {
+            id(group.scraper.http_client)
+            for group in (
+                scraper.app_methods, scraper.search_methods, scraper.reviews_methods,
+                scraper.developer_methods, scraper.similar_methods,
+                scraper.list_methods, scraper.suggest_methods,
+            )
+        }
+        self.assertEqual(clients, {id(scraper.http_client)})
+        self.assertEqual(scraper.http_client.max_connections, 4)
+
+    def test_connection_reuse_stats(self):
+        """Requests on a warm connection are counted as reused."""
+        client = HttpClient()
+        client.session = FakeSession(client._num_connects_info)
+        for _ in range(3):
+            client._make_request("GET", "https://play.google.com")
+
+        stats = client.get_stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["new_connections"], 1)
+        self.assertEqual(stats["reused_connections"], 2)
+        self.assertAlmostEqual(stats["reuse_ratio"], 2 / 3)
+
+    def test_rate_limit_delay_maps_to_limiter_rate(self):
+        """rate_limit_delay is a view over the shared token bucket rate"""
+        client = HttpClient(rate_limit_delay=0.5)
+        self.assertEqual(client.rate_limiter.rate, 2.0)
+        client.rate_limit_delay = 0.25
+        self.assertEqual(client.rate_limiter.rate, 4.0)
+        self.assertAlmostEqual(client.rate_limit_delay, 0.25)
+
+    def test_throttling_response_backs_off(self):
+        """429 responses raise RateLimitError, lower the rate and honour Retry-After."""
+        class ThrottlingSession(FakeSession):
+            def get(self, url, **kwargs):
+                self.calls += 1
+                return FakeResponse({}, status_code=429, headers={"Retry-After": "7"})
+
+        client = HttpClient(rate_limit_delay=0.5)
+        client.retry_policies["app"] = RetryPolicy(max_attempts=1)
+        client.session = ThrottlingSession(client._num_connects_info)
+        with self.assertRaises(RateLimitError) as ctx:
+            client.fetch_app_page("com.example")
+
+        self.assertEqual(ctx.exception.retry_after, 7.0)
+        self.assertEqual(client.session.calls, 1)  # fallbacks are skipped while throttled
+        self.assertLess(client.rate_limiter.rate, 2.0)
+        self.assertGreater(client.rate_limiter.bucket().reserve(), 6.0)
+        stats = client.get_stats()
+        self.assertEqual(stats["throttled"], 1)
+        self.assertEqual(stats["paused_seconds"], 7.0)
+
+    def test_parse_retry_after(self):
+        """Retry-After accepts delta seconds and HTTP dates."""
+        self.assertEqual(HttpClient._parse_retry_after("12"), 12.0)
+        self.assertEqual(HttpClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(HttpClient._parse_retry_after("soon"))
+        self.assertIsNone(HttpClient._parse_retry_after(None))
+
+
+    def test_transient_errors_are_retried(self):
+        """Connection resets are retried per endpoint policy and counted."""
+        class FlakySession(FakeSession):
+            def post(self, url, **kwargs):
+                self.calls += 1
+                if self.calls < 3:
+                    raise ConnectionResetError("connection reset by peer")
+                return FakeResponse({}, text="batch")
+
+        client = HttpClient(rate_limit_delay=0.001)
+        client.throttle = None
+        client.retry_policies["reviews"] = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+        client.session = FlakySession(client._num_connects_info)
+
+        self.assertEqual(client.fetch_reviews_batch("com.example"), "batch")
+        self.assertEqual(client.get_stats()["retries"], 2)
+
+    def test_retries_stop_at_max_attempts(self):
+        """Exhausted retries surface as NetworkError."""
+        class DownSession(FakeSession):
+            def post(self, url, **kwargs):
+                self.calls += 1
+                raise ConnectionResetError("connection reset by peer")
+
+        client = HttpClient(rate_limit_delay=0.001)
+        client.retry_policies["default"] = RetryPolicy(max_attempts=2, backoff_base=0, jitter=False)
+        client.session = DownSession(client._num_connects_info)
+
+        with self.assertRaises(NetworkError):
+            client.fetch_suggest_page("fitness")
+        self.assertEqual(client.session.calls, 2)
+        self.assertEqual(client.get_stats()["retries_exhausted"], 1)
+
+    def test_retry_policy_classification(self):
+        """Only transient failures are retryable and deadlines cap retries."""
+        class HTTPStatusError(Exception):
+            def __init__(self, status_code):
+                self.response = FakeResponse({}, status_code=status_code)
+
+        policy = RetryPolicy(max_attempts=5, backoff_base=1, jitter=False, deadline=3)
+        self.assertTrue(policy.is_retryable(HTTPStatusError(502)))
+        self.assertFalse(policy.is_retryable(HTTPStatusError(403)))
+        self.assertTrue(policy.is_retryable(TimeoutError()))
+        self.assertFalse(policy.is_retryable(ValueError()))
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertFalse(policy.is_retryable(FileNotFoundError()))
+        self.assertTrue(policy.is_retryable(CurlConnectionError("refused", code=7)))
+        self.assertTrue(policy.is_retryable(CurlTimeout("timed out", code=28)))
+        self.assertFalse(policy.is_retryable(DNSError("could not resolve host", code=6)))
+        self.assertEqual(policy.next_delay(2, TimeoutError(), elapsed=0), 2)
+        self.assertIsNone(policy.next_delay(2, TimeoutError(), elapsed=2))
+        self.assertEqual(policy.next_delay(1, RateLimitError("slow down", retry_after=2.5), elapsed=0), 2.5)
+
+    def test_identical_concurrent_requests_are_coalesced(self):
+        """Concurrent fetches of the same page share one network call."""
+        class SlowSession(FakeSession):
+            def get(self, url, **kwargs):
+                self.calls += 1
+                time.sleep(0.1)
+                return FakeResponse({}, text="<html>")
+
+        client = HttpClient(rate_limit_delay=0.001)
+        client.session = SlowSession(client._num_connects_info)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.fetch_app_page("com.example")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["<html>"] * 5)
+        self.assertEqual(client.session.calls, 1)
+        self.assertEqual(client.get_stats()["coalesced_requests"], 4)
+        client.fetch_app_page("com.example")  # nothing in flight, so fetched again
+        self.assertEqual(client.session.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()
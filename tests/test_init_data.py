@@ -0,0 +1,100 @@
+import unittest
+from gplay_scraper.exceptions import DataParsingError
+from gplay_scraper.core.gplay_parser import SearchParser
+from gplay_scraper.core.gplay_scraper import AppScraper
+from gplay_scraper.utils.js_literal import parse_js_literal
+from gplay_scraper.utils.init_data import LazyDatasets, index_init_data, data_span, extract_init_data
+
+
+PAGE = (
+    "<html><script>var AF_initDataCallback;</script>"
+    "<script class=\"ds:1\">AF_initDataCallback({key: 'ds:1', hash: '7', "
+    "data:[[\"a]]}\", 'b'], {\"x\": [1, 2]}], sideChannel: {}});</script>"
+    "<script>AF_initDataCallback( {key: \"ds:5\", hash: '13', "
+    "data:[[[\"Title with } and ] inside\", \"it\\\"s\"]]], sideChannel: {}} );</script>"
+    "<script>AF_initDataCallback({key: 'ds:5', data:[\"duplicate\"], sideChannel: {}});</script>"
+    "</html>"
+)
+
+
+class TestInitData(unittest.TestCase):
+
+    def test_index_finds_every_block(self):
+        """Test each dataset key is indexed once, first callback winning"""
+        index = index_init_data(PAGE)
+        self.assertEqual(set(index), {"ds:1", "ds:5"})
+        start, end = index["ds:5"]
+        self.assertTrue(PAGE[start:end].startswith("{key: \"ds:5\""))
+        self.assertTrue(PAGE[start:end].endswith("sideChannel: {}}"))
+
+    def test_brackets_inside_strings_are_ignored(self):
+        """Test bracket matching skips brackets in quoted strings"""
+        literal = extract_init_data(PAGE, "ds:5")
+        self.assertIn("Title with } and ] inside", literal)
+        self.assertNotIn("duplicate", literal)
+
+    def test_data_span(self):
+        """Test the data value span covers exactly the data array"""
+        span = data_span(PAGE, index_init_data(PAGE)["ds:1"])
+        self.assertEqual(PAGE[span[0]:span[1]], "[[\"a]]}\", 'b'], {\"x\": [1, 2]}]")
+
+    def test_shared_script_is_split_by_brackets(self):
+        """Test callbacks sharing one script element are still split correctly"""
+        html = PAGE.replace("});</script><script>AF_initDataCallback(", "});AF_initDataCallback(")
+        index = index_init_data(html)
+        start, end = index["ds:1"]
+        self.assertTrue(html[start:end].endswith("sideChannel: {}}"))
+        self.assertIn("Title with", extract_init_data(html, "ds:5"))
+
+    def test_trailing_script_code_is_excluded(self):
+        """Test statements after the callback in the same script are not part of the span"""
+        html = PAGE.replace("});</script><script>AF_initDataCallback( {key: \"ds:5\"",
+                            "}); window.foo = bar({a: 1});</script><script>AF_initDataCallback( {key: \"ds:5\"")
+        self.assertIn("window.foo", html)
+        literal = extract_init_data(html, "ds:1")
+        self.assertTrue(literal.endswith("sideChannel: {}}"))
+        self.assertEqual(parse_js_literal(literal)["key"], "ds:1")
+
+    def test_missing_and_unbalanced(self):
+        """Test missing keys and truncated pages yield nothing"""
+        self.assertEqual(extract_init_data(PAGE, "ds:9"), "")
+        truncated = PAGE[:PAGE.index("sideChannel")]
+        self.assertEqual(set(index_init_data(truncated)), set())
+
+    def test_scrapers_use_index(self):
+        """Test app and search parsing go through the shared extractor"""
+        self.assertIn("Title with", AppScraper.parse_app_page(PAGE)["ds:5"])
+        dataset = SearchParser().parse_html_content(PAGE.replace("'b'", "\"b\""))
+        self.assertEqual(dataset["ds:1"][1], {"x": [1, 2]})
+
+    def test_lazy_datasets_decode_on_access(self):
+        """Test blocks are decoded only when looked up, and only once"""
+        datasets = LazyDatasets(PAGE.replace("'b'", "\"b\""))
+        self.assertEqual(set(datasets), {"ds:1", "ds:5"})
+        self.assertEqual(datasets.decoded, ())
+        first = datasets["ds:1"]
+        self.assertIs(datasets["ds:1"], first)
+        self.assertEqual(datasets.decoded, ("ds:1",))
+
+        datasets = LazyDatasets(PAGE.replace("'b'", "\"b\""))
+        self.assertTrue(datasets.any_decodable("ds:5"))
+        self.assertEqual(datasets.decoded, ("ds:5",))
+
+    def test_lazy_datasets_undecodable_block_is_dropped(self):
+        """Test loose literals decode and broken blocks leave the mapping on first access"""
+        datasets = LazyDatasets(PAGE.replace("data:[[[\"Title", "data:[@, [[\"Title"))
+        self.assertEqual(datasets["ds:1"][0], ["a]]}", "b"])
+        self.assertEqual(len(datasets), 2)
+        self.assertNotIn("ds:5", datasets)
+        self.assertEqual((len(datasets), dict(datasets)), (1, {"ds:1": datasets["ds:1"]}))
+        with self.assertRaises(KeyError):
+            datasets["ds:9"]
+
+    def test_page_without_decodable_blocks_is_an_error(self):
+        """Test search page parsing fails when no block decodes"""
+        html = PAGE.replace("data:[[\"a", "data:[@[\"a").replace("data:[[[\"Title", "data:[@, [[\"Title")
+        with self.assertRaises(DataParsingError):
+            SearchParser().parse_html_content(html)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import unittest
+from gplay_scraper.core.gplay_parser import AppParser
+from gplay_scraper.exceptions import DataParsingError
+from gplay_scraper.utils.js_literal import parse_js_literal
+from gplay_scraper.utils.helpers import parse_data_array
+
+
+class TestJsLiteral(unittest.TestCase):
+
+    def test_callback_literal(self):
+        """Test a callback payload parses straight to Python objects"""
+        literal = "{key: 'ds:5', hash: '13', data:[[\"Title\", null, 4.5]], sideChannel: {}}"
+        self.assertEqual(
+            parse_js_literal(literal),
+            {"key": "ds:5", "hash": "13", "data": [["Title", None, 4.5]], "sideChannel": {}},
+        )
+
+    def test_javascript_constructs(self):
+        """Test the non-JSON constructs Play payloads use"""
+        literal = (
+            "{data:[1,,2, undefined, NaN, [3][4], 'it\\'s \"x\" \\x41', $1.99, 1.2.3,"
+            " function(a) { return {b: 1}; },], 'quoted': true,}"
+        )
+        self.assertEqual(parse_js_literal(literal), {
+            "data": [1, None, 2, None, None, [3], [4], "it's \"x\" A", "$1.99", "1.2.3", None],
+            "quoted": True,
+        })
+
+    def test_string_contents_untouched(self):
+        """Test text that looks like syntax inside strings is preserved"""
+        text = "a, sideChannel: {}, b: undefined ,, ][ version: 1.2"
+        self.assertEqual(parse_js_literal("{data: ['" + text + "']}"), {"data": [text]})
+        self.assertEqual(parse_js_literal("['a\\vb\\0c', \"\\q\"]"), ["a\x0bb\x00c", "q"])
+
+    def test_malformed_raises_json_error(self):
+        """Test malformed literals raise JSONDecodeError"""
+        for literal in ("{key:", "[1 2]", "{a 1}", "", "[1] x"):
+            with self.assertRaises(json.JSONDecodeError):
+                parse_js_literal(literal)
+
+    def test_app_parser_uses_literal_parser(self):
+        """Test AppParser reads fields from a raw callback literal"""
+        literal = "{key: 'ds:5', hash: '13', data:[[[\"t\"]]], sideChannel: {}}"
+        with self.assertRaises(DataParsingError):
+            AppParser().parse_app_data({"ds:5": "{key: 'ds:5', data: [1 2]}"}, "com.example")
+        details = AppParser().parse_app_data({"ds:5": literal}, "com.example")
+        self.assertEqual(details["appId"], "com.example")
+
+    def test_parse_data_array_skips_broken_wrapper(self):
+        """Test the data array is recovered when the wrapper is unparseable"""
+        literal = "{key: 'ds:3', hash: @@, data:[[\"a]\", NaN], [1]], sideChannel: ???}"
+        self.assertEqual(parse_data_array(literal), [["a]", None], [1]])
+        with self.assertRaises(json.JSONDecodeError):
+            parse_data_array("{key: 'ds:3', data: [1, 2")
+
+
+if __name__ == '__main__':
+    unittest.main()
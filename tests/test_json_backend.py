@@ -0,0 +1,44 @@
+import json
+import unittest
+from unittest import mock
+from gplay_scraper.utils import json_backend
+
+
+class TestJsonBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(json_backend.set_backend, json_backend.get_backend())
+
+    def test_stdlib_backend(self):
+        """Test the standard library backend can always be selected"""
+        self.assertEqual(json_backend.set_backend("json"), "json")
+        self.assertEqual(json_backend.loads('{"a": [1, null]}'), {"a": [1, None]})
+
+    def test_unknown_backend_rejected(self):
+        """Test an unknown backend name raises ValueError"""
+        with self.assertRaises(ValueError):
+            json_backend.set_backend("simdjson")
+
+    def test_missing_library_falls_back(self):
+        """Test a backend whose library is missing falls back to stdlib"""
+        def missing():
+            raise ImportError("not installed")
+
+        with mock.patch.dict(json_backend.BACKENDS, {"orjson": missing, "msgspec": missing}):
+            with self.assertLogs("gplay_scraper.utils.json_backend", "WARNING"):
+                self.assertEqual(json_backend.set_backend("orjson"), "json")
+            self.assertEqual(json_backend.set_backend("auto"), "json")
+
+    def test_rejected_input_matches_stdlib(self):
+        """Test input a fast backend rejects is decoded or rejected like stdlib"""
+        strict = mock.Mock(side_effect=ValueError("unsupported"))
+        with mock.patch.dict(json_backend.BACKENDS, {"orjson": lambda: strict}):
+            json_backend.set_backend("orjson")
+            self.assertEqual(json_backend.loads('["\\ud800"]'), ["\ud800"])
+            with self.assertRaises(json.JSONDecodeError):
+                json_backend.loads("[1,")
+        strict.assert_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from gplay_scraper import GPlayScraper, ProxyPool
+from gplay_scraper.exceptions import RateLimitError
+
+
+PROXIES = ["http://10.0.0.1:8080", "http://10.0.0.2:8080", "http://10.0.0.3:8080"]
+
+
+class FakeResponse:
+    """Minimal successful response."""
+
+    def __init__(self):
+        self.infos = {}
+        self.text = "ok"
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+class RecordingSession:
+    """Session stub recording the proxy used for each request."""
+
+    def __init__(self):
+        self.proxies = {}
+        self.used = []
+
+    def get(self, url, **kwargs):
+        self.used.append(kwargs["proxies"]["https"])
+        return FakeResponse()
+
+    post = get
+
+
+class TestProxyPool(unittest.TestCase):
+
+    def test_round_robin_cycles(self):
+        """Test round robin visits every proxy in turn"""
+        pool = ProxyPool(PROXIES)
+        picked = []
+        for _ in range(6):
+            proxy = pool.acquire()
+            picked.append(proxy.url)
+            pool.release(proxy)
+        self.assertEqual(picked, PROXIES * 2)
+
+    def test_least_loaded_prefers_idle_proxy(self):
+        """Test least loaded skips proxies with requests in flight"""
+        pool = ProxyPool(PROXIES, strategy="least_loaded")
+        busy = [pool.acquire(), pool.acquire()]
+        self.assertNotIn(pool.acquire().url, [proxy.url for proxy in busy])
+
+    def test_sticky_keeps_key_on_one_proxy(self):
+        """Test sticky routing is stable and only remaps ejected proxies"""
+        pool = ProxyPool(PROXIES, strategy="sticky")
+        first = pool.acquire("com.whatsapp")
+        pool.release(first)
+        self.assertIs(pool.acquire("com.whatsapp"), first)
+        pool.release(first, RateLimitError("throttled"))
+        self.assertIsNot(pool.acquire("com.whatsapp"), first)
+
+    def test_failures_eject_then_probation(self):
+        """Test repeated failures eject a proxy and probation failures double the ejection"""
+        pool = ProxyPool(PROXIES[:1], max_failures=2, probation=10)
+        proxy = pool.acquire()
+        pool.release(proxy, ConnectionResetError())
+        self.assertEqual(pool.healthy_count(), 1)
+        pool.release(proxy, ConnectionResetError())
+        self.assertEqual(pool.healthy_count(), 0)
+
+        first_ejection = proxy.ejected_until
+        proxy.ejected_until = 0  # probation period over
+        pool.release(proxy, ConnectionResetError())
+        self.assertGreater(proxy.ejected_until - first_ejection, 9)
+        self.assertEqual(pool.stats()[0]["ejections"], 2)
+
+        proxy.ejected_until = 0
+        pool.release(proxy)
+        self.assertEqual(proxy.ejections, 0)
+
+    def test_only_404_responses_count_as_healthy(self):
+        """Test a 404 response keeps a proxy healthy but a 404 in an error message does not"""
+        class NotFound(Exception):
+            response = FakeResponse()
+
+        NotFound.response.status_code = 404
+        client = GPlayScraper(proxies=ProxyPool(PROXIES[:1], max_failures=1)).http_client
+        proxy = client.proxy_pool.acquire()
+        client._release_proxy(proxy, NotFound("HTTP Error 404"))
+        self.assertEqual(client.proxy_pool.healthy_count(), 1)
+        client._release_proxy(client.proxy_pool.acquire(), OSError("proxy 10.0.0.1 not found (404)"))
+        self.assertEqual(client.proxy_pool.healthy_count(), 0)
+
+    def test_scraper_routes_requests_through_pool(self):
+        """Test a scraper built with a pool sends each request via a pooled proxy"""
+        pool = ProxyPool(PROXIES, strategy="sticky", rate=1000)
+        scraper = GPlayScraper(proxies=pool)
+        scraper.http_client.session = RecordingSession()
+        for _ in range(3):
+            scraper.http_client.fetch_app_page("com.example")
+        used = scraper.http_client.session.used
+        self.assertEqual(len(set(used)), 1)
+        self.assertIn(used[0], PROXIES)
+        self.assertIsNone(scraper.http_client.rate_limiter.rate)
+        self.assertEqual(scraper.get_connection_stats()["proxies_healthy"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import asyncio
+import time
+from gplay_scraper import AdaptiveThrottle, RateLimiter, TokenBucket
+from gplay_scraper.utils.http_client import HttpClient
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        """Test bucket allows a burst then reserves increasing waits"""
+        bucket = TokenBucket(rate=10, capacity=3)
+        waits = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertGreater(waits[3], 0.0)
+        self.assertGreater(waits[4], waits[3])
+
+    def test_unlimited_bucket_never_waits(self):
+        """Test a bucket without a rate never asks callers to wait"""
+        bucket = TokenBucket(rate=None)
+        self.assertTrue(all(bucket.reserve() == 0.0 for _ in range(100)))
+
+    def test_set_rate_applies_to_existing_buckets(self):
+        """Test set_rate updates buckets that were already created"""
+        limiter = RateLimiter(rate=1)
+        bucket = limiter.bucket()
+        limiter.set_rate(50, burst=4)
+        self.assertEqual(bucket.rate, 50)
+        self.assertEqual(bucket.capacity, 4)
+        self.assertEqual(limiter.rate, 50)
+
+    def test_host_scope_uses_separate_buckets(self):
+        """Test host scope keys buckets by URL host"""
+        limiter = RateLimiter(rate=1, scope="host")
+        a = limiter.bucket("https://play.google.com/store/apps")
+        b = limiter.bucket("https://play.google.com/_/PlayStoreUi")
+        c = limiter.bucket("https://market.android.com/suggest")
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+    def test_invalid_scope(self):
+        """Test unknown scopes are rejected"""
+        with self.assertRaises(ValueError):
+            RateLimiter(scope="planet")
+
+    def test_acquire_async_paces_tasks(self):
+        """Test acquire_async spaces out concurrent tasks"""
+        limiter = RateLimiter(rate=50)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.035)
+
+    def test_pause_delays_next_reservation(self):
+        """Test pause holds back the next caller for the requested time"""
+        bucket = TokenBucket(rate=100, capacity=5)
+        bucket.pause(0.5)
+        self.assertGreaterEqual(bucket.reserve(), 0.49)
+
+    def test_throttle_backs_off_and_recovers(self):
+        """Test AIMD halves the rate on throttling and adds back on success"""
+        limiter = RateLimiter(rate=2)
+        throttle = AdaptiveThrottle(limiter, min_rate=0.5, max_rate=3, increase=0.5, decrease=0.5, cooldown=60)
+        throttle.on_throttle()
+        self.assertEqual(limiter.rate, 1)
+        throttle.on_timeout()  # within cooldown, counted but no second cut
+        self.assertEqual(limiter.rate, 1)
+        for _ in range(10):
+            throttle.on_success(0.1)
+        self.assertEqual(limiter.rate, 3)
+
+        metrics = throttle.metrics()
+        self.assertEqual(metrics["throttled"], 1)
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertEqual(metrics["rate_decreases"], 1)
+        self.assertEqual(metrics["rate_increases"], 4)
+        self.assertEqual(metrics["current_rate"], 3)
+
+    def test_throttle_recovers_only_to_configured_rate(self):
+        """Test healthy responses never raise the rate above the limiter's configured rate"""
+        limiter = RateLimiter(rate=0.5)
+        throttle = AdaptiveThrottle(limiter, increase=0.5, cooldown=0)
+        for _ in range(10):
+            throttle.on_success(0.1)
+        self.assertEqual(limiter.rate, 0.5)
+        throttle.on_throttle()
+        self.assertEqual(limiter.rate, 0.25)
+        for _ in range(10):
+            throttle.on_success(0.1)
+        self.assertEqual(limiter.rate, 0.5)
+
+        client = HttpClient()
+        client.rate_limit_delay = 4.0
+        for _ in range(10):
+            client.throttle.on_success(0.1)
+        self.assertEqual(client.rate_limiter.rate, 0.25)
+
+    def test_throttle_treats_slow_responses_as_congestion(self):
+        """Test responses above the latency target lower the rate"""
+        limiter = RateLimiter(rate=4)
+        throttle = AdaptiveThrottle(limiter, min_rate=1, latency_target=1.0, decrease=0.5, cooldown=0)
+        throttle.on_success(2.0)
+        self.assertEqual(limiter.rate, 2)
+        self.assertEqual(throttle.metrics()["slow_responses"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,14 @@
 Unit tests for Reviews Methods
 """
 
+import json
 import unittest
 import time
 import warnings
+from datetime import datetime
+from unittest import mock
 from gplay_scraper import GPlayScraper
+from gplay_scraper.core.gplay_scraper import ReviewsScraper
 from gplay_scraper.exceptions import GPlayScraperError, NetworkError, RateLimitError
 
 
@@ -64,6 +68,130 @@ class TestReviewsMethods(unittest.TestCase):
         except (NetworkError, RateLimitError, GPlayScraperError) as e:
             warnings.warn(f"Network/Rate limit error in test_reviews_get_fields: {e}")
             self.skipTest(f"Skipping due to network/rate limit: {e}")
-    
+
+    @staticmethod
+    def batch_response(review_ids, token):
+        """Build a reviews batchexecute response as the API returns it."""
+        reviews = [[review_id, ["User", None], 5, None, "Great", [1700000000, 0], 3] for review_id in review_ids]
+        inner = json.dumps([reviews, [None, token], None])
+        return ")]}'\n\n" + json.dumps([["wrb.fr", "UsvDTd", inner, None, None, None, "generic"]])
+
+    def test_decode_reviews_batch(self):
+        """Test a batch decodes into raw reviews and the next token (no network)"""
+        reviews, token = ReviewsScraper.decode_reviews_batch(self.batch_response(["a", "b"], "next"))
+        self.assertEqual([review[0] for review in reviews], ["a", "b"])
+        self.assertEqual(token, "next")
+        self.assertEqual(ReviewsScraper.decode_reviews_batch(self.batch_response([], "next")), ([], None))
+        self.assertEqual(ReviewsScraper.decode_reviews_batch("<html>"), ([], None))
+        parsed, token = self.scraper.reviews_methods.parser.parse_reviews_response(self.batch_response(["a"], None))
+        self.assertEqual((parsed[0]["reviewId"], token), ("a", None))
+
+    def test_reviews_analyze_decodes_each_batch_once(self):
+        """Test every batch response is decoded once across scraper and parser (no network)"""
+        scraper = GPlayScraper()
+        methods = scraper.reviews_methods
+        responses = [self.batch_response(["a", "b"], "t1"), self.batch_response(["c"], None)]
+        with mock.patch.object(methods.scraper.http_client, "fetch_reviews_batch", side_effect=responses) as fetch, \
+                mock.patch.object(ReviewsScraper, "decode_reviews_batch", wraps=ReviewsScraper.decode_reviews_batch) as decode:
+            reviews = scraper.reviews_analyze("com.example", count=300)
+
+        self.assertEqual([review["reviewId"] for review in reviews], ["a", "b", "c"])
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args_list[1].args[-1], "t1")
+        self.assertEqual(decode.call_count, 2)
+
+    def test_reviews_iter_holds_one_batch_and_tracks_token(self):
+        """Test reviews_iter fetches lazily and advances the token per batch (no network)"""
+        scraper = GPlayScraper()
+        responses = [self.batch_response(["a", "b"], "t1"), self.batch_response(["c", "d"], "t2")]
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               side_effect=responses) as fetch:
+            reviews = scraper.reviews_iter("com.example", count=3, batch_size=2)
+            fetch.assert_not_called()
+            self.assertEqual(next(reviews)["reviewId"], "a")
+            self.assertEqual((fetch.call_count, reviews.token), (1, None))
+            self.assertEqual(next(reviews)["reviewId"], "b")
+            self.assertEqual(reviews.token, "t1")
+            self.assertEqual([review["reviewId"] for review in reviews], ["c"])
+
+        # The second batch was cut short by count, so resuming repeats it
+        self.assertEqual(reviews.token, "t1")
+        self.assertEqual(reviews.seen, 3)
+        self.assertEqual(fetch.call_args_list[1].args[-2:], (1, "t1"))
+
+    def test_reviews_since_returns_only_new_reviews(self):
+        """Test since_review_id and since stop paging at already seen reviews (no network)"""
+        scraper = GPlayScraper()
+        responses = [self.batch_response(["e", "d"], "t1"), self.batch_response(["c", "b"], "t2")]
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               side_effect=responses) as fetch:
+            reviews = scraper.reviews_analyze("com.example", count=500, since_review_id="b")
+        self.assertEqual([review["reviewId"] for review in reviews], ["e", "d", "c"])
+        self.assertEqual(fetch.call_count, 2)
+
+        # batch_response stamps every review at 1700000000
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               side_effect=responses) as fetch:
+            reviews = scraper.reviews_iter("com.example", since=datetime.fromtimestamp(1700000000))
+            self.assertEqual(list(reviews), [])
+        self.assertEqual((fetch.call_count, reviews.token), (1, None))
+
+        with self.assertRaises(ValueError):
+            scraper.reviews_iter("com.example", sort="RELEVANT", since_review_id="b")
+
+    def test_reviews_prefetch_and_batch_size(self):
+        """Test the next batch is requested before the current one is consumed (no network)"""
+        scraper = GPlayScraper()
+        responses = [self.batch_response(["a", "b"], "t1"), self.batch_response(["c"], None)]
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               side_effect=responses) as fetch:
+            reviews = scraper.reviews_iter("com.example", count=10, batch_size=2, prefetch=True)
+            self.assertEqual(next(reviews)["reviewId"], "a")
+            reviews._pending.result()
+            self.assertEqual(fetch.call_count, 2)
+            self.assertEqual([review["reviewId"] for review in reviews], ["b", "c"])
+        self.assertEqual([call.args[-2:] for call in fetch.call_args_list], [(2, None), (2, "t1")])
+        self.assertIsNone(reviews._executor)
+
+        self.assertEqual(scraper.reviews_iter("com.example", batch_size=100000).batch_size, 4500)
+        with self.assertRaises(ValueError):
+            scraper.reviews_analyze("com.example", batch_size=0)
+
+    def test_short_batches_keep_paging(self):
+        """Test batches shorter than requested do not end the crawl early (no network)"""
+        scraper = GPlayScraper()
+        responses = [self.batch_response(["a", "b"], "t1"), self.batch_response(["c"], "t2"),
+                     self.batch_response([], "t3")]
+        for analyze in (scraper.reviews_analyze, scraper.reviews_methods.scraper.scrape_reviews_data):
+            with self.subTest(method=analyze.__name__), \
+                    mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                                      side_effect=responses) as fetch:
+                result = analyze("com.example", count=4500, batch_size=4500)
+            reviews = result["reviews"] if isinstance(result, dict) else result
+            self.assertEqual(len(reviews), 3)
+            self.assertEqual([call.args[-2:] for call in fetch.call_args_list],
+                             [(4500, None), (4498, "t1"), (4497, "t2")])
+
+    def test_reviews_prefetch_released_on_early_stop(self):
+        """Test abandoning a prefetching iterator shuts down its thread and stops iteration (no network)"""
+        scraper = GPlayScraper()
+        responses = [self.batch_response(["a", "b"], "t1"), self.batch_response(["c", "d"], "t2")]
+        with mock.patch.object(scraper.reviews_methods.scraper.http_client, "fetch_reviews_batch",
+                               side_effect=responses * 2):
+            with scraper.reviews_iter("com.example", batch_size=2, prefetch=True) as reviews:
+                for review in reviews:
+                    break
+                executor = reviews._executor
+                self.assertIsNotNone(executor)
+            self.assertIsNone(reviews._executor)
+            self.assertTrue(executor._shutdown)
+            self.assertEqual(list(reviews), [])
+
+            reviews = scraper.reviews_iter("com.example", batch_size=2, prefetch=True)
+            next(reviews)
+            executor = reviews._executor
+            del reviews
+            self.assertTrue(executor._shutdown)
+
 if __name__ == '__main__':
     unittest.main()